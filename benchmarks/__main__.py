@@ -0,0 +1,157 @@
+"""Command line of the benchmark suite.
+
+    python -m benchmarks list
+    python -m benchmarks run [--output results.json] [--filter vec2d] [--repeat 5] [--min-time 0.2]
+    python -m benchmarks compare baseline.json results.json [--threshold 0.10]
+
+'run' times every case (or those whose name contains one of the --filter
+strings) and writes the results, with a description of the machine, as JSON.
+'compare' prints the change of each case between two result files and exits
+with status 1 if any case got slower by more than the threshold (a fraction:
+0.10 is 10%).
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import numpy as np
+
+from benchmarks.suite import CASES, time_case
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+
+def machine_metadata() -> dict:
+    """Where and when the results were measured."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "hostname": platform.node(),
+        "git_commit": _git_commit(),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def selected_cases(filters):
+    if not filters:
+        return list(CASES)
+    return [a_case for a_case in CASES if any(a_filter in a_case.name for a_filter in filters)]
+
+
+def run(args) -> int:
+    cases = selected_cases(args.filter)
+    if not cases:
+        print("No case matches %s" % (args.filter), file=sys.stderr)
+        return 2
+    results = {}
+    for a_case in cases:
+        timing = time_case(a_case, repeat=args.repeat, min_time=args.min_time)
+        results[a_case.name] = dict(timing, group=a_case.group)
+        print("%-40s %12.3f us" % (a_case.name, timing["best"] * 1e6))
+    document = {"version": RESULTS_FORMAT_VERSION, "metadata": machine_metadata(), "results": results}
+    if args.output:
+        with open(args.output, "w") as a_file:
+            json.dump(document, a_file, indent=2, sort_keys=True)
+        print("Results written to %s" % (args.output))
+    return 0
+
+
+def load_results(path) -> dict:
+    with open(path) as a_file:
+        document = json.load(a_file)
+    if document.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError("%s: unknown results format %r" % (path, document.get("version")))
+    return document
+
+
+def compare_results(baseline: dict, current: dict, threshold: float):
+    """
+    Changes between two result documents.
+    :return: list of (name, baseline seconds, current seconds, ratio current / baseline, is a regression),
+        for the cases in both; cases in only one of them are left out.
+    """
+    rows = []
+    for name, a_result in sorted(current["results"].items()):
+        if name not in baseline["results"]:
+            continue
+        before, after = baseline["results"][name]["best"], a_result["best"]
+        ratio = after / before
+        rows.append((name, before, after, ratio, ratio > 1.0 + threshold))
+    return rows
+
+
+def compare(args) -> int:
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    for key in ("python", "numpy", "machine", "hostname"):
+        if baseline["metadata"].get(key) != current["metadata"].get(key):
+            print("warning: different %s (%s vs %s)" % (key, baseline["metadata"].get(key),
+                                                        current["metadata"].get(key)))
+    rows = compare_results(baseline, current, args.threshold)
+    print("%-40s %12s %12s %8s" % ("case", "before (us)", "after (us)", "change"))
+    for name, before, after, ratio, is_regression in rows:
+        print("%-40s %12.3f %12.3f %+7.1f%% %s" % (name, before * 1e6, after * 1e6, (ratio - 1) * 100,
+                                                  "REGRESSION" if is_regression else ""))
+    for path, names in ((args.baseline, set(baseline["results"]) - set(current["results"])),
+                        (args.current, set(current["results"]) - set(baseline["results"]))):
+        if names:
+            print("%d case(s) only in %s: %s" % (len(names), path, ", ".join(sorted(names))))
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print("%d regression(s) above %.0f%%: %s" % (len(regressions), args.threshold * 100, ", ".join(regressions)))
+        return 1
+    return 0
+
+
+def list_cases(args) -> int:
+    for a_case in selected_cases(args.filter):
+        print(a_case.name)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks of the geometry package.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="names of the cases")
+    list_parser.add_argument("--filter", action="append", help="only cases whose name contains this (repeatable)")
+    list_parser.set_defaults(handler=list_cases)
+
+    run_parser = commands.add_parser("run", help="time the cases")
+    run_parser.add_argument("--output", "-o", help="JSON file to write the results to")
+    run_parser.add_argument("--filter", action="append", help="only cases whose name contains this (repeatable)")
+    run_parser.add_argument("--repeat", type=int, default=5, help="measurements per case (the best one is kept)")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="seconds per measurement")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="slowdown (fraction) above which a case is a regression")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Benchmark: pickling lists of Point/Vec2d/Rect vs their packed collections.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pickle [--count N]
+
+For each kind of object, measures a dumps + loads round trip of:
+  - the list of objects (what sending them to a multiprocessing worker costs today),
+  - the packed collection, pickled in-band with protocol 5,
+  - the packed collection, with protocol 5 out-of-band buffers (zero-copy),
+  - pack + out-of-band round trip + unpack, starting and ending with objects.
+"""
+
+import argparse
+import pickle
+import sys
+import time
+from random import random
+
+from geometry.coordinates import CoordinatesDirection
+from geometry.packing import pack, unpack
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+
+
+def round_trip(an_object, out_of_band: bool = False):
+    """(seconds, bytes of pickle) of dumps + loads."""
+    start = time.perf_counter()
+    if out_of_band:
+        buffers = []
+        data = pickle.dumps(an_object, protocol=5, buffer_callback=buffers.append)
+        pickle.loads(data, buffers=buffers)
+    else:
+        data = pickle.dumps(an_object, protocol=5)
+        pickle.loads(data)
+    return time.perf_counter() - start, len(data)
+
+
+def packed_round_trip(items):
+    start = time.perf_counter()
+    buffers = []
+    data = pickle.dumps(pack(items), protocol=5, buffer_callback=buffers.append)
+    unpack(pickle.loads(data, buffers=buffers))
+    return time.perf_counter() - start, len(data)
+
+
+def datasets(count: int) -> dict:
+    return {
+        "Point": [Point(random(), random()) for _ in range(count)],
+        "Vec2d": [Vec2d(random(), random()) for _ in range(count)],
+        "Rect": [Rect(direction=CoordinatesDirection.SCREEN_DIRECTION,
+                      pt1=Point(random(), random()), pt2=Point(random(), random())) for _ in range(count // 10)],
+    }
+
+
+def run(count: int) -> list:
+    """Rows of (kind, n items, method, seconds, pickle bytes)."""
+    rows = []
+    for kind, items in datasets(count).items():
+        packed = pack(items)
+        for method, (seconds, size) in (("list of objects", round_trip(items)),
+                                        ("packed, in-band", round_trip(packed)),
+                                        ("packed, out-of-band", round_trip(packed, out_of_band=True)),
+                                        ("pack + out-of-band + unpack", packed_round_trip(items))):
+            rows.append((kind, len(items), method, seconds, size))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000000, help="number of points and vectors (rects: a tenth)")
+    args = parser.parse_args(argv)
+    print("%-6s %8s %-28s %10s %14s" % ("kind", "items", "method", "ms", "pickle bytes"))
+    for kind, n_items, method, seconds, size in run(args.count):
+        print("%-6s %8d %-28s %10.1f %14d" % (kind, n_items, method, seconds * 1e3, size))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Micro-benchmark: single-vector operations, NumPy versions vs geometry.scalar.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scalar_kernel [--number N]
+
+For each operation, times the implementation Vec2d used to have (NumPy on two
+Python floats) against the current one, and exits with status 1 if any
+current version is not faster.
+"""
+
+import argparse
+import sys
+import timeit
+
+import numpy as np
+
+from geometry.angle import AngleInRadians
+from geometry.vector import Vec2d
+
+
+def legacy_norm(a_vector):
+    return float(np.linalg.norm(np.asarray([a_vector.x, a_vector.y])))
+
+
+def legacy_angle_with_positive_x_axis(a_vector):
+    if a_vector.x == 0:
+        if a_vector.y == 0:
+            return AngleInRadians(0)
+        elif a_vector.y > 0:
+            return AngleInRadians(AngleInRadians.PI_HALF)
+        return AngleInRadians(AngleInRadians.THREE_HALFS_OF_PI)
+    the_value = np.arctan(a_vector.y / a_vector.x)
+    if a_vector.x < 0:
+        the_value += AngleInRadians.PI
+    else:
+        the_value += 2 * AngleInRadians.PI
+    return AngleInRadians(the_value)
+
+
+def legacy_scaled_to_norm(a_vector, new_norm):
+    multiplier = new_norm / legacy_norm(a_vector)
+    return Vec2d(a_vector.x * multiplier, a_vector.y * multiplier)
+
+
+def legacy_angle_to(a_vector, another_vector):
+    return legacy_angle_with_positive_x_axis(another_vector) - legacy_angle_with_positive_x_axis(a_vector)
+
+
+def legacy_angle_then_arithmetic(a_vector):
+    # the NumPy scalar returned by the old angle slowed down whatever came next
+    return legacy_angle_with_positive_x_axis(a_vector).value * 2.0 + 1.0
+
+
+# name -> (legacy, current)
+CASES = {
+    "norm": (lambda v, w: legacy_norm(v), lambda v, w: v.norm()),
+    "scaled_to_norm": (lambda v, w: legacy_scaled_to_norm(v, 3.0), lambda v, w: v.scaled_to_norm(3.0)),
+    "angle_with_positive_x_axis": (lambda v, w: legacy_angle_with_positive_x_axis(v),
+                                   lambda v, w: v.angle_with_positive_x_axis()),
+    "angle_to": (lambda v, w: legacy_angle_to(v, w), lambda v, w: v.angle_to(w)),
+    "angle_then_arithmetic": (lambda v, w: legacy_angle_then_arithmetic(v),
+                              lambda v, w: v.angle_with_positive_x_axis().value * 2.0 + 1.0),
+}
+
+
+def best_time(a_function, number: int, repeat: int = 5) -> float:
+    """Best time of one call (seconds), over 'repeat' runs of 'number' calls."""
+    a_vector, another_vector = Vec2d(3.0, -4.0), Vec2d(-1.5, 2.5)
+    timings = timeit.repeat(lambda: a_function(a_vector, another_vector), number=number, repeat=repeat)
+    return min(timings) / number
+
+
+def run(number: int) -> dict:
+    """{name: (legacy seconds per call, current seconds per call)}"""
+    return {name: (best_time(legacy, number), best_time(current, number))
+            for name, (legacy, current) in CASES.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    args = parser.parse_args(argv)
+    all_faster = True
+    print("%-28s %12s %12s %8s" % ("operation", "numpy (us)", "scalar (us)", "speedup"))
+    for name, (legacy, current) in run(args.number).items():
+        all_faster &= current < legacy
+        print("%-28s %12.3f %12.3f %7.1fx" % (name, legacy * 1e6, current * 1e6, legacy / current))
+    return 0 if all_faster else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,461 @@
+"""The benchmark cases, and how they are timed.
+
+BenchmarkCase  -- one operation to time
+CASES  -- all the cases, in the order they run
+time_case  -- best and median time of one call of a case
+
+A case is registered with the 'case' decorator, on a function that builds
+whatever the operation needs and returns a callable doing the operation once.
+Building is not timed.
+"""
+
+import math
+import statistics
+import timeit
+from random import Random
+
+import numpy as np
+
+from geometry.angle import AngleInRadians
+from geometry.angle_array import AngleArray
+from geometry.coordinates import CoordinatesDirection
+from geometry.field_of_view import FieldOfViewIndex
+from geometry.kdtree import KDTree
+from geometry.kinematics import KinematicsIntegrator
+from geometry.point import FrozenPoint, Point
+from geometry.point_array import PointArray
+from geometry.quadtree import RectQuadtree
+from geometry.rect_array import RectArray
+from geometry.shapes import Rect
+from geometry.snapping import deduplicate
+from geometry.spatial_hash import SpatialHashGrid
+from geometry.sweep_and_prune import SweepAndPrune
+from geometry.transform import Transform2D
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+
+# size of the collections of the batch cases
+BATCH_SIZE = 10000
+
+
+class BenchmarkCase(object):
+    """An operation to time: 'make' returns a callable doing it once."""
+
+    def __init__(self, name: str, make):
+        self.name = name
+        self.make = make
+
+    @property
+    def group(self) -> str:
+        return self.name.split(".")[0]
+
+
+CASES = []
+
+
+def case(name: str):
+    """Registers the decorated function as the case 'name' (its group is what comes before the first dot)."""
+    def register(make):
+        CASES.append(BenchmarkCase(name, make))
+        return make
+    return register
+
+
+def time_case(a_case: BenchmarkCase, repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Times a case.
+    :param repeat: number of measurements.
+    :param min_time: (approximate) seconds of each measurement.
+    :return: {"best": seconds per call, "median": seconds per call, "number": calls per measurement, "repeat": ...}
+    """
+    an_operation = a_case.make()
+    timer = timeit.Timer(an_operation)
+    number, elapsed = timer.autorange()
+    number = max(1, int(math.ceil(number * min_time / max(elapsed, 1e-9))))
+    timings = [a_timing / number for a_timing in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(timings), "median": statistics.median(timings), "number": number, "repeat": repeat}
+
+
+def _random_points(n: int, seed: int = 0, scale: float = 1000.0):
+    generator = Random(seed)
+    return [Point(generator.random() * scale, generator.random() * scale) for _ in range(n)]
+
+
+def _random_rects(n: int, seed: int = 0, scale: float = 1000.0, size: float = 10.0):
+    generator = Random(seed)
+    rects = []
+    for _ in range(n):
+        x, y = generator.random() * scale, generator.random() * scale
+        rects.append(Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(x, y),
+                          pt2=Point(x + generator.random() * size, y + generator.random() * size)))
+    return rects
+
+
+# Point ******************************************************************
+
+@case("point.add")
+def _point_add():
+    a_point, another_point = Point(1.5, 2.5), Point(3.0, -1.0)
+    return lambda: a_point + another_point
+
+
+@case("point.sub")
+def _point_sub():
+    a_point, another_point = Point(1.5, 2.5), Point(3.0, -1.0)
+    return lambda: a_point - another_point
+
+
+@case("point.mul")
+def _point_mul():
+    a_point = Point(1.5, 2.5)
+    return lambda: a_point * 3.0
+
+
+@case("point.iadd")
+def _point_iadd():
+    a_point, another_point = Point(1.5, 2.5), Point(0.0, 0.0)
+
+    def an_operation():
+        nonlocal a_point
+        a_point += another_point
+    return an_operation
+
+
+@case("point.distance_to")
+def _point_distance_to():
+    a_point, another_point = Point(1.5, 2.5), Point(3.0, -1.0)
+    return lambda: a_point.distance_to(another_point)
+
+
+@case("point.length")
+def _point_length():
+    a_point = Point(1.5, 2.5)
+    return a_point.length
+
+
+@case("point.set_lookup")
+def _point_set_lookup():
+    points = {Point(i, -i) for i in range(1000)}
+    a_point = Point(500, -500)
+    return lambda: a_point in points
+
+
+@case("frozen_point.set_lookup")
+def _frozen_point_set_lookup():
+    points = {FrozenPoint(i, -i) for i in range(1000)}
+    a_point = FrozenPoint(500, -500)
+    return lambda: a_point in points
+
+
+@case("frozen_point.add")
+def _frozen_point_add():
+    a_point, another_point = FrozenPoint(1.5, 2.5), FrozenPoint(3.0, -1.0)
+    return lambda: a_point + another_point
+
+
+# Vec2d ******************************************************************
+
+@case("vec2d.add")
+def _vec2d_add():
+    a_vector, another_vector = Vec2d(1.5, 2.5), Vec2d(3.0, -1.0)
+    return lambda: a_vector + another_vector
+
+
+@case("vec2d.sub")
+def _vec2d_sub():
+    a_vector, another_vector = Vec2d(1.5, 2.5), Vec2d(3.0, -1.0)
+    return lambda: a_vector - another_vector
+
+
+@case("vec2d.mul_scalar")
+def _vec2d_mul():
+    a_vector = Vec2d(1.5, 2.5)
+    return lambda: a_vector * 3.0
+
+
+@case("vec2d.truediv_scalar")
+def _vec2d_truediv():
+    a_vector = Vec2d(1.5, 2.5)
+    return lambda: a_vector / 3.0
+
+
+@case("vec2d.dot")
+def _vec2d_dot():
+    a_vector, another_vector = Vec2d(1.5, 2.5), Vec2d(3.0, -1.0)
+    return lambda: a_vector.dot(another_vector)
+
+
+@case("vec2d.norm")
+def _vec2d_norm():
+    return Vec2d(1.5, 2.5).norm
+
+
+@case("vec2d.normalized")
+def _vec2d_normalized():
+    return Vec2d(1.5, 2.5).normalized
+
+
+@case("vec2d.rotated_degrees")
+def _vec2d_rotated():
+    a_vector = Vec2d(1.5, 2.5)
+    return lambda: a_vector.rotated(30.0)
+
+
+@case("vec2d.rotated_radians")
+def _vec2d_rotated_radians():
+    a_vector, an_angle = Vec2d(1.5, 2.5), AngleInRadians(0.5)
+    return lambda: a_vector.rotated_radians(an_angle)
+
+
+@case("vec2d.angle_with_positive_x_axis")
+def _vec2d_angle_with_x():
+    return Vec2d(-1.5, 2.5).angle_with_positive_x_axis
+
+
+@case("vec2d.angle_to")
+def _vec2d_angle_to():
+    a_vector, another_vector = Vec2d(1.5, 2.5), Vec2d(-3.0, -1.0)
+    return lambda: a_vector.angle_to(another_vector)
+
+
+@case("vec2d.get_angle_between")
+def _vec2d_get_angle_between():
+    a_vector, another_vector = Vec2d(1.5, 2.5), Vec2d(-3.0, -1.0)
+    return lambda: a_vector.get_angle_between(another_vector)
+
+
+# AngleInRadians *********************************************************
+
+@case("angle.construct")
+def _angle_construct():
+    return lambda: AngleInRadians(7.5)
+
+
+@case("angle.normalize")
+def _angle_normalize():
+    return lambda: AngleInRadians.normalize(-7.5)
+
+
+@case("angle.eq")
+def _angle_eq():
+    an_angle, another_angle = AngleInRadians(1.0), AngleInRadians(1.0001)
+    return lambda: an_angle == another_angle
+
+
+@case("angle.lt")
+def _angle_lt():
+    an_angle, another_angle = AngleInRadians(1.0), AngleInRadians(2.0)
+    return lambda: an_angle < another_angle
+
+
+@case("angle.sub")
+def _angle_sub():
+    an_angle, another_angle = AngleInRadians(5.0), AngleInRadians(2.0)
+    return lambda: an_angle - another_angle
+
+
+@case("angle.cos_sin")
+def _angle_cos_sin():
+    return AngleInRadians(1.0).cos_sin
+
+
+# Rect *******************************************************************
+
+@case("rect.construct")
+def _rect_construct():
+    a_point, another_point = Point(1.0, 2.0), Point(5.0, 7.0)
+    return lambda: Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=a_point, pt2=another_point)
+
+
+@case("rect.contains")
+def _rect_contains():
+    a_rect, a_point = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(1, 2), pt2=Point(5, 7)), Point(3, 4)
+    return lambda: a_rect.contains(a_point)
+
+
+@case("rect.overlaps")
+def _rect_overlaps():
+    a_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(1, 2), pt2=Point(5, 7))
+    another_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(4, 6), pt2=Point(9, 9))
+    return lambda: a_rect.overlaps(another_rect)
+
+
+@case("rect.expanded_by")
+def _rect_expanded_by():
+    a_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(1, 2), pt2=Point(5, 7))
+    return lambda: a_rect.expanded_by(2.0)
+
+
+@case("rect.center")
+def _rect_center():
+    a_point, another_point = Point(1.0, 2.0), Point(5.0, 7.0)
+    # a new rectangle each time, so that the center is not cached
+    return lambda: Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=a_point, pt2=another_point).center
+
+
+# Batch types (BATCH_SIZE entries) ***************************************
+
+@case("point_array.add")
+def _point_array_add():
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    return lambda: points + points
+
+
+@case("point_array.distance_to")
+def _point_array_distance_to():
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    a_point = Point(500.0, 500.0)
+    return lambda: points.distance_to(a_point)
+
+
+@case("point_array.integer_coords")
+def _point_array_integer_coords():
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    return points.integer_coords
+
+
+@case("point_array.deduplicate")
+def _point_array_deduplicate():
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    return lambda: deduplicate(points, 1.0)
+
+
+@case("point_array.from_points")
+def _point_array_from_points():
+    points = _random_points(BATCH_SIZE)
+    return lambda: PointArray.from_points(points)
+
+
+@case("vec2d_array.normalized")
+def _vec2d_array_normalized():
+    vectors = Vec2dArray(PointArray.from_points(_random_points(BATCH_SIZE)).coords - 500.0)
+    return vectors.normalized
+
+
+@case("vec2d_array.angle_with_positive_x_axis")
+def _vec2d_array_angles():
+    vectors = Vec2dArray(PointArray.from_points(_random_points(BATCH_SIZE)).coords - 500.0)
+    return vectors.angle_with_positive_x_axis
+
+
+@case("angle_array.add")
+def _angle_array_add():
+    angles = AngleArray(np.linspace(-10.0, 10.0, BATCH_SIZE))
+    return lambda: angles + 3.0
+
+
+@case("rect_array.contains_mask")
+def _rect_array_contains_mask():
+    rects = RectArray.from_rects(_random_rects(100))
+    points = PointArray.from_points(_random_points(1000, seed=1))
+    return lambda: rects.contains_mask(points)
+
+
+@case("transform.apply_point_array")
+def _transform_apply():
+    a_transform = Transform2D.rotation(AngleInRadians(0.5)).translated(10.0, -3.0).scaled(2.0)
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    return lambda: a_transform.apply(points)
+
+
+@case("transform.apply_point")
+def _transform_apply_point():
+    a_transform = Transform2D.rotation(AngleInRadians(0.5)).translated(10.0, -3.0).scaled(2.0)
+    a_point = Point(1.5, 2.5)
+    return lambda: a_transform.apply(a_point)
+
+
+@case("kinematics.step_semi_implicit")
+def _kinematics_step():
+    positions = PointArray.from_points(_random_points(BATCH_SIZE))
+    integrator = KinematicsIntegrator(positions, velocities=positions.coords * 0.01, accelerations=(0.0, -9.8))
+    return lambda: integrator.step_semi_implicit(0.01)
+
+
+# Spatial indexes (BATCH_SIZE entries) ***********************************
+
+@case("kdtree.build")
+def _kdtree_build():
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    return lambda: KDTree(points)
+
+
+@case("kdtree.query_k8")
+def _kdtree_query():
+    tree = KDTree(PointArray.from_points(_random_points(BATCH_SIZE)))
+    a_point = Point(500.0, 500.0)
+    return lambda: tree.query(a_point, k=8)
+
+
+@case("kdtree.query_batch_k8")
+def _kdtree_query_batch():
+    tree = KDTree(PointArray.from_points(_random_points(BATCH_SIZE)))
+    queries = PointArray.from_points(_random_points(1000, seed=1))
+    return lambda: tree.query_batch(queries, k=8)
+
+
+@case("kdtree.query_radius")
+def _kdtree_query_radius():
+    tree = KDTree(PointArray.from_points(_random_points(BATCH_SIZE)))
+    a_point = Point(500.0, 500.0)
+    return lambda: tree.query_radius(a_point, 30.0)
+
+
+@case("spatial_hash.query_radius")
+def _spatial_hash_query_radius():
+    grid = SpatialHashGrid(cell_size=20.0)
+    for an_id, a_point in enumerate(_random_points(BATCH_SIZE)):
+        grid.insert(an_id, a_point)
+    a_point = Point(500.0, 500.0)
+    return lambda: grid.query_radius(a_point, 30.0)
+
+
+@case("spatial_hash.neighbour_pairs")
+def _spatial_hash_neighbour_pairs():
+    grid = SpatialHashGrid(cell_size=20.0)
+    grid.rebucket(PointArray.from_points(_random_points(BATCH_SIZE)))
+    return lambda: grid.neighbour_pairs(20.0)
+
+
+@case("spatial_hash.rebucket")
+def _spatial_hash_rebucket():
+    grid = SpatialHashGrid(cell_size=20.0)
+    points = PointArray.from_points(_random_points(BATCH_SIZE))
+    for an_id, a_point in enumerate(points):
+        grid.insert(an_id, a_point)
+    # moves going back and forth, so that every run does the same amount of work
+    moved = [points.coords + 5.0, points.coords]
+
+    def an_operation():
+        moved.reverse()
+        grid.rebucket(moved[0])
+    return an_operation
+
+
+@case("quadtree.query_overlap")
+def _quadtree_query_overlap():
+    tree = RectQuadtree(_random_rects(BATCH_SIZE))
+    a_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(480, 480), pt2=Point(520, 520))
+    return lambda: tree.query_overlap(a_rect)
+
+
+@case("sweep_and_prune.update")
+def _sweep_and_prune_update():
+    rects = _random_rects(BATCH_SIZE // 10)
+    engine = SweepAndPrune(rects)
+    bounds = RectArray.from_rects(rects)
+    lefts, rights, tops, bottoms = bounds.lefts, bounds.rights, bounds.tops, bounds.bottoms
+    offsets = [1.0, -1.0]
+
+    def an_operation():
+        offsets.reverse()
+        engine.set_bounds(lefts + offsets[0], rights + offsets[0], tops, bottoms)
+        engine.update()
+    return an_operation
+
+
+@case("field_of_view.query")
+def _field_of_view_query():
+    index = FieldOfViewIndex(PointArray.from_points(_random_points(BATCH_SIZE)))
+    a_point = Point(500.0, 500.0)
+    return lambda: index.query(a_point, 1.0, 0.5, 100.0)
@@ -0,0 +1,76 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks.__main__ import RESULTS_FORMAT_VERSION, compare_results, load_results, main
+
+
+def results_document(best_by_case: dict) -> dict:
+    return {"version": RESULTS_FORMAT_VERSION,
+            "metadata": {"python": "3.11", "numpy": "2.0", "machine": "x86_64", "hostname": "bench"},
+            "results": {name: {"best": best, "median": best, "group": name.split(".")[0]}
+                        for name, best in best_by_case.items()}}
+
+
+class UnitTestCompare(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.baseline = results_document({"point.add": 1.0e-6, "point.sub": 2.0e-6, "rect.contains": 4.0e-6,
+                                          "only.before": 1.0e-6})
+        self.current = results_document({"point.add": 1.05e-6, "point.sub": 2.5e-6, "rect.contains": 2.0e-6,
+                                         "only.after": 1.0e-6})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name: str, document: dict) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as a_file:
+            json.dump(document, a_file)
+        return path
+
+    def run_main(self, argv):
+        """(exit status, printed output) of the command line."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = main(argv)
+        return status, output.getvalue()
+
+    def test_compare_results(self):
+        rows = compare_results(self.baseline, self.current, threshold=0.10)
+        self.assertEqual([row[0] for row in rows], ["point.add", "point.sub", "rect.contains"])
+        by_name = {row[0]: row for row in rows}
+        self.assertAlmostEqual(by_name["point.add"][3], 1.05)
+        self.assertFalse(by_name["point.add"][4])
+        self.assertAlmostEqual(by_name["point.sub"][3], 1.25)
+        self.assertTrue(by_name["point.sub"][4])
+        self.assertAlmostEqual(by_name["rect.contains"][3], 0.5)
+        self.assertFalse(by_name["rect.contains"][4])
+        # a looser threshold lets the slowdown through
+        self.assertFalse(any(row[4] for row in compare_results(self.baseline, self.current, threshold=0.30)))
+
+    def test_exit_status(self):
+        baseline, current = self.write("before.json", self.baseline), self.write("after.json", self.current)
+        status, output = self.run_main(["compare", baseline, current])
+        self.assertEqual(status, 1)
+        self.assertIn("1 regression(s) above 10%: point.sub", output)
+        self.assertIn("only.before", output)
+        self.assertIn("only.after", output)
+        status, output = self.run_main(["compare", baseline, current, "--threshold", "0.3"])
+        self.assertEqual(status, 0)
+        self.assertNotIn("REGRESSION", output)
+        status, _ = self.run_main(["compare", baseline, baseline])
+        self.assertEqual(status, 0)
+
+    def test_unknown_format(self):
+        path = self.write("old.json", dict(self.baseline, version=RESULTS_FORMAT_VERSION + 1))
+        with self.assertRaises(ValueError):
+            load_results(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
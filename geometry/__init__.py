@@ -0,0 +1,6 @@
+import os
+
+# opt-in instrumentation of the hot paths (see geometry/instrumentation.py)
+if os.environ.get("GEOMETRY_INSTRUMENTATION", "").lower() not in ("", "0", "false"):
+    from geometry import instrumentation
+    instrumentation.enable()
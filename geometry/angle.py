@@ -3,6 +3,87 @@ import math
 import random
 from geometry.util import normalize_to
 
+
+class TrigStats(object):
+    """
+    Counters of how cos/sin of AngleInRadians were obtained.
+    Counting costs time on every call, so it is off until enable() is called.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.table_lookups = 0
+
+    def enable(self):
+        """Starts counting (from zero)."""
+        self.reset()
+        self.enabled = True
+        _install_trigonometry()
+
+    def disable(self):
+        """Stops counting; the counters keep their values."""
+        self.enabled = False
+        _install_trigonometry()
+
+    def as_dict(self) -> dict:
+        return {"cache_hits": self.cache_hits, "cache_misses": self.cache_misses,
+                "table_lookups": self.table_lookups}
+
+    def __str__(self):
+        return "trig cache: %d hits, %d misses; lookup table: %d lookups" % \
+               (self.cache_hits, self.cache_misses, self.table_lookups)
+
+TRIG_STATS = TrigStats()
+
+
+class TrigLookupTable(object):
+    """
+    Precomputed cos/sin of 'resolution' angles evenly spread on [0, 2*Pi).
+    An angle is rounded to the closest one, so the error is at most 'max_error' (Pi / resolution).
+    """
+
+    def __init__(self, resolution: int = 4096):
+        if resolution < 1:
+            raise ValueError("resolution must be positive, got %d" % (resolution))
+        self.resolution = resolution
+        self.step = 2 * math.pi / resolution
+        self._cos = [math.cos(i * self.step) for i in range(resolution)]
+        self._sin = [math.sin(i * self.step) for i in range(resolution)]
+
+    @classmethod
+    def for_max_error(cls, max_error: float):
+        """A table whose results are never further than 'max_error' from the exact ones."""
+        return cls(resolution=int(math.ceil(math.pi / max_error)))
+
+    @property
+    def max_error(self) -> float:
+        """Bound of |table - exact| for cos and sin (both are 1-Lipschitz; angles are off by step/2 at most)."""
+        return self.step / 2
+
+    def cos_sin(self, radians: float):
+        index = int(round(radians / self.step)) % self.resolution
+        return self._cos[index], self._sin[index]
+
+_lookup_table = None
+
+def enable_trig_lookup_table(resolution: int = 4096) -> TrigLookupTable:
+    """From now on, AngleInRadians.cos/sin/cos_sin come from a lookup table (approximate)."""
+    global _lookup_table
+    _lookup_table = TrigLookupTable(resolution=resolution)
+    _install_trigonometry()
+    return _lookup_table
+
+def disable_trig_lookup_table():
+    """Back to exact cos/sin."""
+    global _lookup_table
+    _lookup_table = None
+    _install_trigonometry()
+
 class Angle(metaclass=abc.ABCMeta):
 
     def __init__(self, value: float):
@@ -18,6 +99,10 @@ class Angle(metaclass=abc.ABCMeta):
         """Returns sinus of angle."""
         pass
 
+    def cos_sin(self):
+        """Returns (cosinus, sinus) of angle."""
+        return self.cos(), self.sin()
+
 
 class AngleInRadians(Angle):
 
@@ -34,6 +119,9 @@ class AngleInRadians(Angle):
         value = AngleInRadians.normalize(value)
         assert (value >= 0) and (value <= 2 * math.pi) # sanity check
         super().__init__(value)
+        # (cos, sin) of _cos_sin_value, computed on first use:
+        self._cos_sin = None
+        self._cos_sin_value = None
 
     def __eq__(self, other):
         """Override the default Equals behavior"""
@@ -63,6 +151,16 @@ class AngleInRadians(Angle):
             return not self.__eq__(other)
         return NotImplemented
 
+    def cos_sin(self):
+        """(cos, sin) of this angle; computed once and kept until the angle changes."""
+        # also checking the value, in case it was assigned directly
+        if self._cos_sin_value == self.value:
+            return self._cos_sin
+        a_pair = (math.cos(self.value), math.sin(self.value))
+        self._cos_sin = a_pair
+        self._cos_sin_value = self.value
+        return a_pair
+
     def cos(self):
         return math.cos(self.value)
 
@@ -102,6 +200,7 @@ class AngleInRadians(Angle):
     def __iadd__(self, other):
         other_as_angle = AngleInRadians.create_from(other)
         self.value = AngleInRadians.normalize(self.value + other_as_angle.value)
+        self._cos_sin_value = None
         return self
 
     @classmethod
@@ -122,6 +221,7 @@ class AngleInRadians(Angle):
     def __isub__(self, other):
         other_as_angle = AngleInRadians.create_from(other)
         self.value = AngleInRadians.normalize(self.value - other_as_angle.value)
+        self._cos_sin_value = None
         return self
 
     def __lt__(self, other):
@@ -131,6 +231,7 @@ class AngleInRadians(Angle):
     def randomly_mutate(self):
         """Changes the value of this angle, at random."""
         self.value = normalize_to(random.random(), new_min=0.0, new_max=2*math.pi, old_min=0.0, old_max=1.0)
+        self._cos_sin_value = None
 
 
     def __repr__(self):
@@ -165,13 +266,51 @@ class AngleInDegrees(Angle):
     def from_radians(cls, angle_in_radians: AngleInRadians):
         return cls(math.degrees(angle_in_radians.value))
 
+_exact_trigonometry = (AngleInRadians.cos_sin, AngleInRadians.cos, AngleInRadians.sin)
+
+
+def _counted_cos_sin(self):
+    if self._cos_sin_value == self.value:
+        TRIG_STATS.cache_hits += 1
+        return self._cos_sin
+    TRIG_STATS.cache_misses += 1
+    return _exact_trigonometry[0](self)
+
+
+def _table_cos_sin(self):
+    if TRIG_STATS.enabled:
+        TRIG_STATS.table_lookups += 1
+    return _lookup_table.cos_sin(self.value)
+
+
+def _table_cos(self):
+    return _table_cos_sin(self)[0]
+
+
+def _table_sin(self):
+    return _table_cos_sin(self)[1]
+
+
+def _install_trigonometry():
+    """
+    Puts the cos/sin methods matching the lookup table and TRIG_STATS settings on AngleInRadians,
+    so that the default (exact, not counted) ones pay for neither.
+    """
+    if _lookup_table is not None:
+        AngleInRadians.cos_sin, AngleInRadians.cos, AngleInRadians.sin = _table_cos_sin, _table_cos, _table_sin
+    else:
+        AngleInRadians.cos_sin, AngleInRadians.cos, AngleInRadians.sin = _exact_trigonometry
+        if TRIG_STATS.enabled:
+            AngleInRadians.cos_sin = _counted_cos_sin
+
 # https://stackoverflow.com/questions/20023209/function-for-rotating-2d-objects
 def rotatePoint(centerPoint, point, angle: AngleInRadians):
     """Rotates a point around another centerPoint. Angle is in degrees.
     Rotation is counter-clockwise"""
     angle = math.radians(angle.value)
+    a_cosinus, a_sinus = math.cos(angle), math.sin(angle)
     temp_point = point[0]-centerPoint[0] , point[1]-centerPoint[1]
-    temp_point = ( temp_point[0]*math.cos(angle)-temp_point[1]*math.sin(angle) , temp_point[0]*math.sin(angle)+temp_point[1]*math.cos(angle))
+    temp_point = ( temp_point[0]*a_cosinus-temp_point[1]*a_sinus , temp_point[0]*a_sinus+temp_point[1]*a_cosinus)
     temp_point = temp_point[0]+centerPoint[0] , temp_point[1]+centerPoint[1]
     return temp_point
 
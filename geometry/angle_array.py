@@ -0,0 +1,156 @@
+"""Array-backed collection of angles.
+
+AngleArray  -- many angles in radians, kept in [0, 2*Pi), in one NumPy buffer
+normalize_radians  -- vectorized AngleInRadians.normalize
+as_radians  -- values in radians of an AngleArray, an Angle, or plain numbers
+
+Normalization, wrapping arithmetic, tolerant comparisons and sorting are done
+in one NumPy pass over the whole array, instead of one AngleInRadians (and its
+normalize/assert/round) per angle.
+"""
+
+import math
+import pickle
+
+import numpy as np
+
+from geometry.angle import Angle, AngleInRadians, AngleInDegrees
+
+TWO_PI = 2 * math.pi
+
+# comparisons of AngleInRadians round to 3 digits: closer than this is "equal"
+DEFAULT_TOLERANCE = 5e-4
+
+
+def normalize_radians(values) -> np.ndarray:
+    """Brings all values to [0, 2*Pi)."""
+    result = np.mod(values, TWO_PI)
+    # mod of a tiny negative number rounds to exactly 2*Pi:
+    return np.where(result >= TWO_PI, 0.0, result)
+
+
+class AngleArray(object):
+    """A collection of angles in radians, all in [0, 2*Pi).
+
+    supports: +, -, len, iteration, indexing (int -> AngleInRadians, slice -> AngleArray),
+        pickle (with protocol 5, the values are one out-of-band buffer)
+
+    isclose, less_than, greater_than  -- tolerant comparisons, as boolean arrays
+    distance_to  -- smallest angle between angles, in [0, Pi]
+    sort, argsort  -- order by value
+    to_degrees, from_degrees  -- conversions
+    cos, sin  -- trigonometry
+    """
+
+    __slots__ = ['values']
+
+    def __init__(self, values):
+        """
+        Initializes the collection.
+        :param values: angles in radians (any value: they are normalized).
+        """
+        self.values = normalize_radians(np.array(values, dtype=np.float64, ndmin=1))
+
+    @classmethod
+    def from_angles(cls, angles):
+        """Builds an array from an iterable of Angle (in radians or degrees)."""
+        return cls([an_angle.value if isinstance(an_angle, AngleInRadians) else math.radians(an_angle.value)
+                    for an_angle in angles])
+
+    @classmethod
+    def from_degrees(cls, degrees):
+        """Builds an array from values in degrees, or from an iterable of AngleInDegrees."""
+        degrees = [a_value.value if isinstance(a_value, Angle) else a_value for a_value in degrees]
+        return cls(np.radians(np.asarray(degrees, dtype=np.float64)))
+
+    def to_degrees(self) -> np.ndarray:
+        """Values in degrees, in [0, 360)."""
+        return np.degrees(self.values)
+
+    def to_degree_angles(self):
+        """A list with one AngleInDegrees per entry."""
+        return [AngleInDegrees(a_value) for a_value in self.to_degrees().tolist()]
+
+    def to_angles(self):
+        """A list with one AngleInRadians per entry."""
+        return [AngleInRadians(a_value) for a_value in self.values.tolist()]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for a_value in self.values.tolist():
+            yield AngleInRadians(a_value)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return AngleInRadians(float(self.values[item]))
+        return self.__class__(self.values[item])
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.values.tolist())
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return _from_buffer, (self.__class__, pickle.PickleBuffer(np.ascontiguousarray(self.values)))
+        return self.__class__, (self.values,)
+
+    def __add__(self, other):
+        """Sum, wrapped to [0, 2*Pi)."""
+        return self.__class__(self.values + as_radians(other))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Difference, wrapped to [0, 2*Pi)."""
+        return self.__class__(self.values - as_radians(other))
+
+    def __rsub__(self, other):
+        return self.__class__(as_radians(other) - self.values)
+
+    def distance_to(self, other) -> np.ndarray:
+        """Smallest angle between each angle and 'other' (going either way), in [0, Pi]."""
+        difference = np.abs(self.values - as_radians(other))
+        return np.minimum(difference, TWO_PI - difference)
+
+    def isclose(self, other, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+        """Equality up to 'tolerance' radians; 2*Pi - epsilon is close to 0."""
+        return self.distance_to(other) <= tolerance
+
+    def less_than(self, other, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+        """Smaller (as values in [0, 2*Pi)) and not close."""
+        return (self.values < as_radians(other)) & ~self.isclose(other, tolerance)
+
+    def greater_than(self, other, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+        """Bigger (as values in [0, 2*Pi)) and not close."""
+        return (self.values > as_radians(other)) & ~self.isclose(other, tolerance)
+
+    def argsort(self) -> np.ndarray:
+        return np.argsort(self.values, kind='stable')
+
+    def sort(self):
+        """A sorted copy."""
+        return self.__class__(np.sort(self.values))
+
+    def cos(self) -> np.ndarray:
+        return np.cos(self.values)
+
+    def sin(self) -> np.ndarray:
+        return np.sin(self.values)
+
+
+def _from_buffer(cls, buffer):
+    """Unpickles an AngleArray of class 'cls' over 'buffer' (values are already normalized)."""
+    an_array = cls.__new__(cls)
+    an_array.values = np.frombuffer(buffer, dtype=np.float64)
+    return an_array
+
+
+def as_radians(other):
+    """Values in radians of an AngleArray, an Angle, or plain numbers."""
+    if isinstance(other, AngleArray):
+        return other.values
+    if isinstance(other, AngleInRadians):
+        return other.value
+    if isinstance(other, Angle):
+        return math.radians(other.value)
+    return np.asarray(other, dtype=np.float64)
@@ -0,0 +1,180 @@
+"""Batch computations over sequences of Points and Vec2ds, with a choice of engine.
+
+PythonBackend  -- loops of geometry.scalar; no import cost, best for small batches and Python objects
+NumpyBackend  -- computes in bulk on one (N, 2) array; best for big batches already in arrays
+get_backend  -- the backend to use for a given batch
+set_backend  -- force one backend (or go back to choosing automatically)
+norms, distances_to, angles_with_positive_x_axis, translated, contained_in  -- batch operations, on the chosen backend
+
+NumPy is only imported the first time the NumPy backend is used, so code that
+sticks to Point, Vec2d, Angle and Rect never pays for it.
+
+Items are a PointArray/Vec2dArray or (N, 2) NumPy array, or a sequence of
+anything with x and y (Point, Vec2d, ...) or of (x, y) pairs. Results are lists
+of Python floats (or bools, or (x, y) tuples), whatever the backend.
+
+Choosing automatically: arrays of at least NUMPY_MIN_SIZE entries go to NumPy
+(when it is installed), smaller ones stay in Python. Sequences of Python
+objects always stay in Python: reading x and y out of each object is most of
+the work, and NumPy has to do it too before it can start (measured slower at
+every size up to 20000 items). The environment variable GEOMETRY_BACKEND
+("python" or "numpy") forces a backend from the start.
+"""
+
+import importlib.util
+import math
+import os
+
+from geometry import scalar
+
+PYTHON = "python"
+NUMPY = "numpy"
+
+# below this many entries, Python loops over an array's values beat NumPy's per-call overhead
+NUMPY_MIN_SIZE = 64
+
+
+def _is_array(items) -> bool:
+    """Whether 'items' are already in an array (an XYArray, or a NumPy array), rather than Python objects."""
+    return hasattr(items, 'coords') or hasattr(items, 'tolist')
+
+
+def _xy_pairs(items):
+    """(x, y) of the items, as tuples (or as 2-element lists, for arrays)."""
+    if _is_array(items):
+        return getattr(items, 'coords', items).tolist()
+    try:
+        return [(an_item.x, an_item.y) for an_item in items]
+    except AttributeError:
+        return [(an_item[0], an_item[1]) for an_item in items]
+
+
+class PythonBackend(object):
+    """Batch operations as Python loops."""
+
+    name = PYTHON
+
+    def norms(self, items):
+        hypot = math.hypot
+        return [hypot(x, y) for (x, y) in _xy_pairs(items)]
+
+    def distances_to(self, items, x: float, y: float):
+        hypot = math.hypot
+        return [hypot(an_x - x, a_y - y) for (an_x, a_y) in _xy_pairs(items)]
+
+    def angles_with_positive_x_axis(self, items):
+        angle = scalar.angle_with_positive_x_axis
+        return [angle(x, y) for (x, y) in _xy_pairs(items)]
+
+    def translated(self, items, dx: float, dy: float):
+        return [(x + dx, y + dy) for (x, y) in _xy_pairs(items)]
+
+    def contained_in(self, items, left: float, right: float, min_y: float, max_y: float):
+        return [left <= x <= right and min_y <= y <= max_y for (x, y) in _xy_pairs(items)]
+
+
+class NumpyBackend(object):
+    """Batch operations on one (N, 2) NumPy array."""
+
+    name = NUMPY
+
+    def __init__(self):
+        import numpy
+        self.np = numpy
+
+    def _coords(self, items):
+        if _is_array(items):
+            return self.np.asarray(getattr(items, 'coords', items), dtype=self.np.float64).reshape(-1, 2)
+        return self.np.array(_xy_pairs(items), dtype=self.np.float64).reshape(-1, 2)
+
+    def norms(self, items):
+        coords = self._coords(items)
+        return self.np.hypot(coords[:, 0], coords[:, 1]).tolist()
+
+    def distances_to(self, items, x: float, y: float):
+        coords = self._coords(items)
+        return self.np.hypot(coords[:, 0] - x, coords[:, 1] - y).tolist()
+
+    def angles_with_positive_x_axis(self, items):
+        from geometry.vector_array import angles_with_positive_x_axis
+        return angles_with_positive_x_axis(self._coords(items)).tolist()
+
+    def translated(self, items, dx: float, dy: float):
+        coords = self._coords(items) + (dx, dy)
+        return [(x, y) for (x, y) in coords.tolist()]
+
+    def contained_in(self, items, left: float, right: float, min_y: float, max_y: float):
+        coords = self._coords(items)
+        xs, ys = coords[:, 0], coords[:, 1]
+        return ((xs >= left) & (xs <= right) & (ys >= min_y) & (ys <= max_y)).tolist()
+
+
+_backends = {PYTHON: PythonBackend()}
+_forced = None
+_numpy_available = None
+
+
+def numpy_available() -> bool:
+    """Whether NumPy is installed (checked without importing it)."""
+    global _numpy_available
+    if _numpy_available is None:
+        _numpy_available = importlib.util.find_spec("numpy") is not None
+    return _numpy_available
+
+
+def _backend_named(name: str):
+    if name not in (PYTHON, NUMPY):
+        raise ValueError("Unknown backend '%s' (expected '%s' or '%s')" % (name, PYTHON, NUMPY))
+    if name not in _backends:
+        if not numpy_available():
+            raise ValueError("Backend '%s' needs NumPy, which is not installed" % (name))
+        _backends[name] = NumpyBackend()
+    return _backends[name]
+
+
+def set_backend(name: str = None):
+    """
+    Forces all batches to a backend.
+    :param name: PYTHON or NUMPY; None goes back to choosing automatically.
+    """
+    global _forced
+    _forced = None if name is None else _backend_named(name)
+
+
+def get_backend(items=None):
+    """The forced backend if there is one; otherwise the best one for 'items' (Python if not given)."""
+    if _forced is not None:
+        return _forced
+    if items is not None and _is_array(items) and len(items) >= NUMPY_MIN_SIZE and numpy_available():
+        return _backend_named(NUMPY)
+    return _backends[PYTHON]
+
+
+def norms(items):
+    """Length of each vector."""
+    return get_backend(items).norms(items)
+
+
+def distances_to(items, a_point):
+    """Distance of each point to 'a_point'."""
+    return get_backend(items).distances_to(items, a_point.x, a_point.y)
+
+
+def angles_with_positive_x_axis(items):
+    """Angle of each vector with the X+ axis (as Vec2d.angle_with_positive_x_axis), in radians."""
+    return get_backend(items).angles_with_positive_x_axis(items)
+
+
+def translated(items, dx: float, dy: float):
+    """(x, y) of each point, moved by (dx, dy)."""
+    return get_backend(items).translated(items, dx, dy)
+
+
+def contained_in(items, a_rect):
+    """Whether each point is inside a Rect (borders included)."""
+    min_y, max_y = min(a_rect.top, a_rect.bottom), max(a_rect.top, a_rect.bottom)
+    return get_backend(items).contained_in(items, a_rect.left, a_rect.right, min_y, max_y)
+
+
+if os.environ.get("GEOMETRY_BACKEND"):
+    set_backend(os.environ["GEOMETRY_BACKEND"])
@@ -0,0 +1,249 @@
+"""Compact binary files of points, vectors or rectangles, read through memory maps.
+
+write_points, write_vectors, write_rects  -- save a collection
+read_header  -- what a file holds, without touching the data
+open_dataset  -- map a file in memory, for zero-copy random access
+BinaryDataset  -- an opened file
+
+A file is a 32-byte header followed by the coordinates, one column after the
+other (all x, then all y; for rectangles: lefts, rights, tops, bottoms), as
+little-endian float32 or float64. Header (little-endian):
+
+    offset  size  field
+         0     8  magic, b"GEO2DBIN"
+         8     2  format version (uint16)
+        10     1  kind: 1 points, 2 vectors, 3 rectangles
+        11     1  dtype: 4 float32, 8 float64
+        12     1  CoordinatesDirection: 0 not given, 1 SCREEN, 2 ANTI_SCREEN
+        13     1  number of columns
+        14    10  reserved (zeros)
+        24     8  number of entries (uint64)
+
+Opening a file maps it with np.memmap: it is instant whatever the size, and
+only the parts that are read (an entry, a slice, a column) are loaded.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.rect_array import RectArray
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+from geometry.xy_array import XYArray
+
+MAGIC = b"GEO2DBIN"
+FORMAT_VERSION = 1
+
+KIND_POINTS = 1
+KIND_VECTORS = 2
+KIND_RECTS = 3
+
+_HEADER = struct.Struct("<8sHBBBB10xQ")
+HEADER_SIZE = _HEADER.size
+
+_COLUMNS = {KIND_POINTS: 2, KIND_VECTORS: 2, KIND_RECTS: 4}
+_DTYPES = {4: np.dtype("<f4"), 8: np.dtype("<f8")}
+_DIRECTIONS = {0: None,
+               1: CoordinatesDirection.SCREEN_DIRECTION,
+               2: CoordinatesDirection.ANTI_SCREEN_DIRECTION}
+
+
+class BinaryHeader(object):
+    """Description of the content of a binary file."""
+
+    __slots__ = ['version', 'kind', 'dtype', 'direction', 'n_columns', 'count']
+
+    def __init__(self, kind: int, dtype, count: int, direction: CoordinatesDirection = None,
+                 version: int = FORMAT_VERSION):
+        if kind not in _COLUMNS:
+            raise ValueError("Unknown kind of dataset: %s" % (kind))
+        self.version = version
+        self.kind = kind
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        if self.dtype not in _DTYPES.values():
+            raise ValueError("Coordinates must be float32 or float64, not %s" % (self.dtype))
+        self.direction = direction
+        self.n_columns = _COLUMNS[kind]
+        self.count = count
+
+    def pack(self) -> bytes:
+        direction_code = [code for code, a_direction in _DIRECTIONS.items() if a_direction == self.direction][0]
+        return _HEADER.pack(MAGIC, self.version, self.kind, self.dtype.itemsize, direction_code,
+                            self.n_columns, self.count)
+
+    @classmethod
+    def unpack(cls, raw: bytes):
+        if len(raw) < HEADER_SIZE:
+            raise ValueError("Not a geometry binary file: too short")
+        magic, version, kind, itemsize, direction_code, n_columns, count = _HEADER.unpack(raw[:HEADER_SIZE])
+        if magic != MAGIC:
+            raise ValueError("Not a geometry binary file: bad magic %r" % (magic))
+        if version > FORMAT_VERSION:
+            raise ValueError("File has format version %d; only up to %d is supported" % (version, FORMAT_VERSION))
+        if itemsize not in _DTYPES or direction_code not in _DIRECTIONS:
+            raise ValueError("Corrupted header")
+        a_header = cls(kind, _DTYPES[itemsize], count, _DIRECTIONS[direction_code], version)
+        if n_columns != a_header.n_columns:
+            raise ValueError("Corrupted header: %d columns for kind %d" % (n_columns, kind))
+        return a_header
+
+    @property
+    def data_size(self) -> int:
+        """Bytes of coordinates after the header."""
+        return self.n_columns * self.count * self.dtype.itemsize
+
+    def __repr__(self):
+        return "%s(kind=%d, dtype=%s, count=%d, direction=%s)" % \
+               (self.__class__.__name__, self.kind, self.dtype, self.count, self.direction)
+
+
+def _write(path, a_header: BinaryHeader, columns):
+    with open(path, "wb") as a_file:
+        a_file.write(a_header.pack())
+        for a_column in columns:
+            np.ascontiguousarray(a_column, dtype=a_header.dtype).tofile(a_file)
+
+
+def _xy_columns(items):
+    """(xs, ys) of an XYArray, a (N, 2) array, or an iterable of anything with x and y."""
+    if isinstance(items, XYArray):
+        return items.xs, items.ys
+    if not isinstance(items, np.ndarray):
+        items = [(an_item.x, an_item.y) for an_item in items]
+    coords = np.asarray(items, dtype=np.float64).reshape(-1, 2)
+    return coords[:, 0], coords[:, 1]
+
+
+def write_points(path, points, direction: CoordinatesDirection = None, dtype=np.float64):
+    """
+    Saves points.
+    :param path: file to (over)write.
+    :param points: a PointArray, a (N, 2) array, or an iterable of Point.
+    :param direction: coordinates direction the points are in, kept in the header.
+    :param dtype: float64, or float32 to halve the size.
+    """
+    xs, ys = _xy_columns(points)
+    _write(path, BinaryHeader(KIND_POINTS, dtype, len(xs), direction), (xs, ys))
+
+
+def write_vectors(path, vectors, direction: CoordinatesDirection = None, dtype=np.float64):
+    """Saves vectors (a Vec2dArray, a (N, 2) array, or an iterable of Vec2d); see write_points."""
+    xs, ys = _xy_columns(vectors)
+    _write(path, BinaryHeader(KIND_VECTORS, dtype, len(xs), direction), (xs, ys))
+
+
+def write_rects(path, rects, dtype=np.float64):
+    """
+    Saves rectangles.
+    :param path: file to (over)write.
+    :param rects: a RectArray or an iterable of Rect, all in the same coordinates direction (kept in the header).
+    :param dtype: float64, or float32 to halve the size.
+    """
+    if not isinstance(rects, RectArray):
+        rects = RectArray.from_rects(rects)
+    if len(rects) == 0:
+        direction = None
+    elif rects.screen_direction.all():
+        direction = CoordinatesDirection.SCREEN_DIRECTION
+    elif not rects.screen_direction.any():
+        direction = CoordinatesDirection.ANTI_SCREEN_DIRECTION
+    else:
+        raise ValueError("All rectangles of a file must have the same coordinates direction")
+    _write(path, BinaryHeader(KIND_RECTS, dtype, len(rects), direction),
+           (rects.lefts, rects.rights, rects.tops, rects.bottoms))
+
+
+def read_header(path) -> BinaryHeader:
+    """Header of a binary file."""
+    with open(path, "rb") as a_file:
+        return BinaryHeader.unpack(a_file.read(HEADER_SIZE))
+
+
+def open_dataset(path):
+    """Maps a binary file in memory (read-only); nothing is loaded until used."""
+    return BinaryDataset(path)
+
+
+class BinaryDataset(object):
+    """A binary file mapped in memory.
+
+    supports: len, iteration, indexing (int -> Point/Vec2d/Rect, slice or index array -> PointArray/Vec2dArray/RectArray)
+
+    header  -- kind, dtype, count and direction of the content
+    columns  -- (n_columns, count) read-only array over the file
+    xs, ys  -- columns of points or vectors
+    lefts, rights, tops, bottoms  -- columns of rectangles
+    load  -- the whole content, in memory
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.header = read_header(path)
+        if os.path.getsize(path) < HEADER_SIZE + self.header.data_size:
+            raise ValueError("Truncated file: the header announces %d entries" % (self.header.count))
+        shape = (self.header.n_columns, self.header.count)
+        if self.header.count == 0:
+            # (a file can't be mapped with a length of 0)
+            self.columns = np.empty(shape, dtype=self.header.dtype)
+        else:
+            self.columns = np.memmap(path, dtype=self.header.dtype, mode="r", offset=HEADER_SIZE, shape=shape)
+
+    @property
+    def kind(self) -> int:
+        return self.header.kind
+
+    @property
+    def direction(self) -> CoordinatesDirection:
+        return self.header.direction
+
+    def _column(self, index: int, kinds) -> np.ndarray:
+        if self.kind not in kinds:
+            raise AttributeError("No such column in a file of kind %d" % (self.kind))
+        return self.columns[index]
+
+    xs = property(lambda self: self._column(0, (KIND_POINTS, KIND_VECTORS)))
+    ys = property(lambda self: self._column(1, (KIND_POINTS, KIND_VECTORS)))
+    lefts = property(lambda self: self._column(0, (KIND_RECTS,)))
+    rights = property(lambda self: self._column(1, (KIND_RECTS,)))
+    tops = property(lambda self: self._column(2, (KIND_RECTS,)))
+    bottoms = property(lambda self: self._column(3, (KIND_RECTS,)))
+
+    def __len__(self):
+        return self.header.count
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            values = self.columns[:, item].tolist()
+            if self.kind == KIND_POINTS:
+                return Point(*values)
+            if self.kind == KIND_VECTORS:
+                return Vec2d(*values)
+            left, right, top, bottom = values
+            return Rect(direction=self.direction or CoordinatesDirection.SCREEN_DIRECTION,
+                        pt1=Point(left, top), pt2=Point(right, bottom))
+        return self._collection(self.columns[:, item])
+
+    def _collection(self, columns: np.ndarray):
+        if self.kind == KIND_POINTS:
+            return PointArray.from_xy(columns[0], columns[1])
+        if self.kind == KIND_VECTORS:
+            return Vec2dArray.from_xy(columns[0], columns[1])
+        return RectArray(columns[0], columns[1], columns[2], columns[3],
+                         self.direction or CoordinatesDirection.SCREEN_DIRECTION)
+
+    def load(self):
+        """All the content, copied to memory, as a PointArray, Vec2dArray or RectArray."""
+        return self._collection(self.columns)
+
+    def __repr__(self):
+        return "%s(%r, %r)" % (self.__class__.__name__, self.path, self.header)
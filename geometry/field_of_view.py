@@ -0,0 +1,100 @@
+"""Field-of-view ("what can I see") queries over a set of points.
+
+sector_mask  -- which points of an array are inside an angular sector
+FieldOfViewIndex  -- same question over a static point set, many times
+
+A sector is everything within distance 'radius' of an origin and at most
+'half_width' away from a heading, on either side. Headings and angles follow
+Vec2d.angle_with_positive_x_axis: angles of vectors with the X+ axis, in
+radians, from X+ towards Y+. This holds in both coordinates directions, so
+results always agree with Vec2d: with ANTI_SCREEN_DIRECTION positive angles
+turn counter-clockwise as seen, with SCREEN_DIRECTION (y going down) they turn
+clockwise as seen. Sectors crossing the 0/2*Pi line are handled.
+"""
+
+import math
+
+import numpy as np
+
+from geometry.angle_array import TWO_PI, as_radians, normalize_radians
+from geometry.coordinates import CoordinatesDirection
+from geometry.kdtree import KDTree
+from geometry.xy_array import as_coords_array, as_xy
+
+
+def _radians(an_angle) -> float:
+    return float(as_radians(an_angle))
+
+
+def _in_sector(coords: np.ndarray, origin, heading: float, half_width: float, radius: float) -> np.ndarray:
+    """Mask of the points of 'coords' in the sector (distance and angle)."""
+    ox, oy = as_xy(origin)
+    dxs = coords[:, 0] - ox
+    dys = coords[:, 1] - oy
+    inside = dxs * dxs + dys * dys <= radius * radius
+    if half_width >= math.pi:
+        return inside
+    offsets = normalize_radians(np.arctan2(dys, dxs) - heading)
+    in_angle = (offsets <= half_width) | (offsets >= TWO_PI - half_width)
+    # the viewer sees what is exactly where it stands
+    in_angle |= (dxs == 0) & (dys == 0)
+    return inside & in_angle
+
+
+def sector_mask(points, origin, heading, half_width, radius: float,
+                direction: CoordinatesDirection = CoordinatesDirection.ANTI_SCREEN_DIRECTION) -> np.ndarray:
+    """
+    Which points are inside a sector.
+    :param points: a PointArray or a (N, 2) array.
+    :param origin: apex of the sector (a Point, or (x, y)).
+    :param heading: direction the sector faces (an Angle, or radians).
+    :param half_width: angular half-width of the sector (an Angle, or radians); Pi or more means a full disc.
+    :param radius: reach of the sector.
+    :param direction: coordinates direction of the points; angles are read the same way in both (see above).
+    :return: boolean array, one entry per point.
+    """
+    coords = as_coords_array(points)
+    return _in_sector(coords, origin, _radians(heading), _radians(half_width), radius)
+
+
+class FieldOfViewIndex(object):
+    """A static set of points, queried with sectors.
+
+    query  -- indices of the points inside a sector
+    query_many  -- same, for many viewers
+    """
+
+    def __init__(self, points, direction: CoordinatesDirection = CoordinatesDirection.ANTI_SCREEN_DIRECTION,
+                 leaf_size: int = 16):
+        """
+        Indexes the points.
+        :param points: a PointArray, an iterable of Point, or a (N, 2) array.
+        :param direction: coordinates direction of the points; angles are read the same way in both.
+        """
+        self.tree = KDTree(points, leaf_size=leaf_size)
+        self.points = self.tree.points
+        self.direction = direction
+
+    def __len__(self):
+        return len(self.points)
+
+    def query(self, origin, heading, half_width, radius: float) -> np.ndarray:
+        """Indices of the points inside a sector (see 'sector_mask' for the parameters)."""
+        candidates = self.tree.query_radius(origin, radius)
+        if len(candidates) == 0:
+            return candidates
+        inside = _in_sector(self.points.coords[candidates], origin, _radians(heading),
+                            _radians(half_width), radius)
+        return candidates[inside]
+
+    def query_many(self, origins, headings, half_width, radius: float):
+        """
+        Sector queries for many viewers, all with the same half-width and radius.
+        :param origins: a PointArray, an iterable of Point, or a (M, 2) array.
+        :param headings: an AngleArray, or one heading (radians) per viewer.
+        :return: list of index arrays, one per viewer.
+        """
+        origins = as_coords_array(origins)
+        headings = np.broadcast_to(as_radians(headings), (len(origins),)).tolist()
+        return [self.query(an_origin, a_heading, half_width, radius)
+                for an_origin, a_heading in zip(origins.tolist(), headings)]
@@ -0,0 +1,125 @@
+"""Opt-in counting and timing of the most used geometry methods.
+
+enable  -- start counting calls and time of the instrumented methods
+disable  -- stop, and put the original methods back
+is_enabled  -- whether instrumentation is on
+reset  -- set all counters to zero
+snapshot  -- counters, as a dict
+format_table  -- counters, as a text table
+
+Enabling replaces each instrumented method, on its class, with a wrapper that
+counts and times it; disabling puts the original function back (or, for a
+method the class inherits, removes the wrapper). When
+instrumentation is off, the classes are exactly as if this module didn't
+exist: nothing is checked on each call.
+
+Instrumentation is switched on at import time when the environment variable
+GEOMETRY_INSTRUMENTATION is set (to anything but "", "0" or "false"); see
+geometry/__init__.py. Times are inclusive (a method calling another
+instrumented method counts the time of both), and counters are not
+thread-safe.
+
+    >>> enable()
+    >>> run_the_simulation()
+    >>> print(format_table())
+"""
+
+import functools
+import time
+
+from geometry.angle import AngleInRadians
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+
+ENVIRONMENT_VARIABLE = "GEOMETRY_INSTRUMENTATION"
+
+# (class, method name) instrumented by default
+DEFAULT_TARGETS = (
+    (Vec2d, "_o2"),
+    (Vec2d, "rotate_radians"),
+    (Vec2d, "angle_with_positive_x_axis"),
+    (Point, "distance_to"),
+    (Rect, "set_points"),
+    (Rect, "contains"),
+    (AngleInRadians, "__init__"),
+)
+
+# (class, method name) -> (original function, whether the class defines it), for the methods currently instrumented
+_originals = {}
+# "Class.method" -> [calls, total seconds]
+_stats = {}
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def _name_of(cls, method_name: str) -> str:
+    return "%s.%s" % (cls.__name__, method_name)
+
+
+def _instrumented(function, stats: list, timer):
+    @functools.wraps(function)
+    def counted_and_timed(*args, **kwargs):
+        start = timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats[1] += timer() - start
+            stats[0] += 1
+    return counted_and_timed
+
+
+def enable(targets=DEFAULT_TARGETS, timer=time.perf_counter):
+    """
+    Starts counting calls and time of methods (those already instrumented are left as they are).
+    :param targets: (class, method name) pairs; the method can be defined by the class or inherited.
+    :param timer: function giving the current time, in seconds.
+    """
+    for cls, method_name in targets:
+        if (cls, method_name) in _originals:
+            continue
+        defined_here = method_name in cls.__dict__
+        if defined_here:
+            original = cls.__dict__[method_name]
+        else:
+            original = next((base.__dict__[method_name] for base in cls.__mro__ if method_name in base.__dict__), None)
+            if original is None:
+                raise ValueError("%s has no method '%s'" % (cls.__name__, method_name))
+        stats = _stats.setdefault(_name_of(cls, method_name), [0, 0.0])
+        setattr(cls, method_name, _instrumented(original, stats, timer))
+        _originals[(cls, method_name)] = (original, defined_here)
+
+
+def disable():
+    """Puts all the original methods back (counters are kept, until 'reset')."""
+    while _originals:
+        (cls, method_name), (original, defined_here) = _originals.popitem()
+        if defined_here:
+            setattr(cls, method_name, original)
+        else:
+            delattr(cls, method_name)
+
+
+def reset():
+    """Sets all counters to zero."""
+    for stats in _stats.values():
+        stats[0], stats[1] = 0, 0.0
+
+
+def snapshot() -> dict:
+    """{"Class.method": {"calls": ..., "total_seconds": ..., "mean_seconds": ...}}, for all methods ever instrumented."""
+    return {name: {"calls": calls, "total_seconds": total, "mean_seconds": total / calls if calls else 0.0}
+            for name, (calls, total) in _stats.items()}
+
+
+def format_table(a_snapshot: dict = None) -> str:
+    """A snapshot (the current one if not given) as a text table, most time-consuming first."""
+    if a_snapshot is None:
+        a_snapshot = snapshot()
+    lines = ["%-36s %12s %14s %12s" % ("method", "calls", "total (ms)", "mean (us)")]
+    for name, counters in sorted(a_snapshot.items(), key=lambda item: -item[1]["total_seconds"]):
+        lines.append("%-36s %12d %14.3f %12.3f" % (name, counters["calls"], counters["total_seconds"] * 1e3,
+                                                    counters["mean_seconds"] * 1e6))
+    return "\n".join(lines)
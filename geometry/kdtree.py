@@ -0,0 +1,319 @@
+"""Static spatial index over a set of points.
+
+KDTree  -- k-nearest and radius queries, built once from Points or a PointArray
+
+The tree is a complete binary tree stored in flat arrays: every level splits
+each node at its median along the axis where the node is widest, so the build
+is one vectorized partition per level (no Python work per node). The point set
+is padded to 'leaf_size * 2**depth' entries with points at infinity, which are
+never reported.
+
+Distances are compared squared internally; pass 'squared=True' to get them
+back that way and skip the square roots.
+
+query_batch answers all its queries together, with one NumPy operation per
+tree level rather than one Python walk per query. Each query first takes a
+search radius from the node it falls in. The queries then go down the tree
+level by level, as (query, node) pairs, keeping the nodes whose bounding box
+is within the radius. Finally, the k nearest are picked among the points of
+the leaves reached. query_radius_batch, on the other hand, is a loop over
+query_radius.
+"""
+
+import heapq
+
+import numpy as np
+
+from geometry.point_array import PointArray
+from geometry.xy_array import as_coords_array, as_xy
+
+
+class KDTree(object):
+    """A 2d tree over a static set of points.
+
+    query  -- k nearest neighbours of a point
+    nearest  -- the nearest neighbour of a point
+    query_radius  -- all points within a distance of a point
+    query_batch  -- k nearest neighbours of many points (vectorized over the points)
+    query_radius_batch  -- all points within a distance, for many points (one query_radius per point)
+    """
+
+    # queries answered at once by query_batch (bounds the size of its temporary arrays)
+    BATCH_CHUNK_SIZE = 4096
+
+    def __init__(self, points, leaf_size: int = 16):
+        """
+        Builds the tree.
+        :param points: a PointArray, an iterable of Point, or a (N, 2) array.
+        :param leaf_size: maximum number of points in a leaf.
+        """
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive, got %d" % (leaf_size))
+        if not isinstance(points, PointArray):
+            points = PointArray(as_coords_array(points))
+        self.points = points
+        self.leaf_size = leaf_size
+        self._build()
+
+    def __len__(self):
+        return len(self.points)
+
+    def _build(self):
+        n_points = len(self.points)
+        depth = 0
+        while self.leaf_size * (1 << depth) < n_points:
+            depth += 1
+        self.depth = depth
+        padded_size = self.leaf_size * (1 << depth)
+        # x + iy: one gather per level moves both coordinates
+        coords = np.full(padded_size, np.inf, dtype=np.complex128)
+        coords[:n_points].real = self.points.xs
+        coords[:n_points].imag = self.points.ys
+        order = np.arange(padded_size)
+        n_internal = (1 << depth) - 1
+        split_dims = np.zeros(n_internal, dtype=np.intp)
+        split_values = np.zeros(n_internal)
+        with np.errstate(invalid='ignore'):
+            for level in range(depth):
+                n_nodes = 1 << level
+                node_size = padded_size // n_nodes
+                half = node_size // 2
+                xs = coords.real.reshape(n_nodes, node_size)
+                ys = coords.imag.reshape(n_nodes, node_size)
+                # split each node along its widest axis (padding gives nan spreads: split on x)
+                widest_on_y = (ys.max(axis=1) - ys.min(axis=1)) > (xs.max(axis=1) - xs.min(axis=1))
+                keys = np.where(widest_on_y[:, np.newaxis], ys, xs)
+                partition = np.argpartition(keys, half, axis=1)
+                first_node = n_nodes - 1
+                split_dims[first_node:first_node + n_nodes] = widest_on_y
+                split_values[first_node:first_node + n_nodes] = keys[np.arange(n_nodes), partition[:, half]]
+                partition += (np.arange(n_nodes) * node_size)[:, np.newaxis]
+                partition = partition.reshape(-1)
+                coords = coords[partition]
+                order = order[partition]
+        self._order = order
+        self._coords = np.column_stack((coords.real, coords.imag))
+        # Python lists are faster than arrays for the scalar walk of the queries:
+        self._split_dims = split_dims.tolist()
+        self._split_values = split_values.tolist()
+        self._n_internal = n_internal
+        # arrays for query_batch, built on first use (see _batch_arrays)
+        self._batch = None
+
+    def _batch_arrays(self):
+        """(split dims, split values, bounding boxes of all nodes as (lo x, lo y, hi x, hi y) columns)."""
+        if self._batch is None:
+            n_leaves = self._n_internal + 1
+            # padding points (at infinity) become nan, which fmin/fmax skip: an all-padding leaf has a nan box
+            leaf_coords = np.where(np.isfinite(self._coords), self._coords, np.nan).reshape(n_leaves, -1, 2)
+            with np.errstate(invalid='ignore'):
+                level_boxes = np.concatenate((np.fmin.reduce(leaf_coords, axis=1),
+                                              np.fmax.reduce(leaf_coords, axis=1)), axis=1)
+            boxes = [level_boxes]
+            while len(level_boxes) > 1:
+                lefts, rights = level_boxes[0::2], level_boxes[1::2]
+                level_boxes = np.concatenate((np.fmin(lefts[:, :2], rights[:, :2]),
+                                              np.fmax(lefts[:, 2:], rights[:, 2:])), axis=1)
+                boxes.append(level_boxes)
+            # heap order: root first, leaves last
+            self._batch = (np.array(self._split_dims, dtype=np.intp), np.array(self._split_values),
+                           np.concatenate(boxes[::-1]))
+        return self._batch
+
+    def _leaf_slice(self, node: int) -> slice:
+        leaf = node - self._n_internal
+        return slice(leaf * self.leaf_size, (leaf + 1) * self.leaf_size)
+
+    def query(self, a_point, k: int = 1, squared: bool = False):
+        """
+        Nearest neighbours of a point.
+        :param a_point: a Point (or anything with .x and .y, or a (x, y) pair).
+        :param k: how many neighbours.
+        :param squared: return squared distances (saves the square roots).
+        :return: (distances, indices) arrays, sorted by increasing distance; indices refer to
+            the points the tree was built from. At most len(self) entries are returned.
+        """
+        qx, qy = as_xy(a_point)
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        query_coords = (qx, qy)
+        split_dims, split_values, coords = self._split_dims, self._split_values, self._coords
+        n_internal = self._n_internal
+        # max-heap (on negated distances) of the best k so far:
+        best = []
+        worst = np.inf
+        stack = [(0, 0.0)]
+        while stack:
+            node, plane_dist_sqrd = stack.pop()
+            if plane_dist_sqrd > worst:
+                continue
+            while node < n_internal:
+                diff = query_coords[split_dims[node]] - split_values[node]
+                if diff <= 0:
+                    near, far = 2 * node + 1, 2 * node + 2
+                else:
+                    near, far = 2 * node + 2, 2 * node + 1
+                diff_sqrd = diff * diff
+                if diff_sqrd <= worst:
+                    stack.append((far, diff_sqrd))
+                node = near
+            a_slice = self._leaf_slice(node)
+            leaf_coords = coords[a_slice]
+            dists_sqrd = (leaf_coords[:, 0] - qx) ** 2 + (leaf_coords[:, 1] - qy) ** 2
+            for position in np.flatnonzero(dists_sqrd < worst).tolist():
+                item = (-dists_sqrd[position], a_slice.start + position)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                else:
+                    heapq.heappushpop(best, item)
+                if len(best) == k:
+                    worst = -best[0][0]
+        best.sort(reverse=True)
+        distances = np.array([-d for (d, _) in best])
+        indices = self._order[[position for (_, position) in best]]
+        if not squared:
+            distances = np.sqrt(distances)
+        return distances, indices
+
+    def nearest(self, a_point, squared: bool = False):
+        """(distance, index) of the point closest to 'a_point'."""
+        distances, indices = self.query(a_point, k=1, squared=squared)
+        if len(indices) == 0:
+            raise ValueError("Nearest point of an empty tree")
+        return float(distances[0]), int(indices[0])
+
+    def query_radius(self, a_point, radius: float, return_distances: bool = False,
+                     squared: bool = False, sort: bool = False):
+        """
+        All points within a distance of a point (boundary included).
+        :param a_point: a Point (or anything with .x and .y, or a (x, y) pair).
+        :param radius: the distance.
+        :param return_distances: also return the distances, as (distances, indices).
+        :param squared: distances are returned squared.
+        :param sort: sort the result by increasing distance.
+        :return: array of indices of the points the tree was built from.
+        """
+        qx, qy = as_xy(a_point)
+        query_coords = (qx, qy)
+        radius_sqrd = radius * radius
+        split_dims, split_values, coords = self._split_dims, self._split_values, self._coords
+        n_internal = self._n_internal
+        found_positions = []
+        found_dists = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if node < n_internal:
+                diff = query_coords[split_dims[node]] - split_values[node]
+                if diff <= 0:
+                    stack.append(2 * node + 1)
+                    if diff * diff <= radius_sqrd:
+                        stack.append(2 * node + 2)
+                else:
+                    stack.append(2 * node + 2)
+                    if diff * diff <= radius_sqrd:
+                        stack.append(2 * node + 1)
+                continue
+            a_slice = self._leaf_slice(node)
+            leaf_coords = coords[a_slice]
+            dists_sqrd = (leaf_coords[:, 0] - qx) ** 2 + (leaf_coords[:, 1] - qy) ** 2
+            inside = np.flatnonzero(dists_sqrd <= radius_sqrd)
+            if len(inside):
+                found_positions.append(inside + a_slice.start)
+                found_dists.append(dists_sqrd[inside])
+        if found_positions:
+            positions = np.concatenate(found_positions)
+            distances = np.concatenate(found_dists)
+        else:
+            positions = np.empty(0, dtype=np.intp)
+            distances = np.empty(0)
+        if sort:
+            by_distance = np.argsort(distances, kind='stable')
+            positions, distances = positions[by_distance], distances[by_distance]
+        indices = self._order[positions]
+        if not return_distances:
+            return indices
+        if not squared:
+            distances = np.sqrt(distances)
+        return distances, indices
+
+    def query_batch(self, points, k: int = 1, squared: bool = False):
+        """
+        Nearest neighbours of many points (see the module documentation for how).
+        :param points: a PointArray, an iterable of Point, or a (N, 2) array.
+        :return: (distances, indices), both of shape (N, min(k, len(self))).
+        """
+        query_coords = as_coords_array(points)
+        k = min(k, len(self))
+        distances = np.empty((len(query_coords), k))
+        indices = np.empty((len(query_coords), k), dtype=np.intp)
+        if k > 0:
+            for start in range(0, len(query_coords), self.BATCH_CHUNK_SIZE):
+                stop = start + self.BATCH_CHUNK_SIZE
+                distances[start:stop], indices[start:stop] = self._query_chunk(query_coords[start:stop], k)
+        if not squared:
+            np.sqrt(distances, out=distances)
+        return distances, indices
+
+    def _query_chunk(self, query_coords: np.ndarray, k: int):
+        """(squared distances, indices) of the k nearest points of each query."""
+        split_dims, split_values, boxes = self._batch_arrays()
+        n_queries, leaf_size, n_internal = len(query_coords), self.leaf_size, self._n_internal
+        qxs, qys = query_coords[:, 0], query_coords[:, 1]
+        # search radius: k-th distance among the points of the node each query falls in (one big enough for k)
+        level = self.depth
+        while level > 0 and (leaf_size << (self.depth - level)) < k:
+            level -= 1
+        nodes = np.zeros(n_queries, dtype=np.intp)
+        for _ in range(level):
+            goes_right = query_coords[np.arange(n_queries), split_dims[nodes]] > split_values[nodes]
+            nodes = 2 * nodes + 1 + goes_right
+        node_size = leaf_size << (self.depth - level)
+        first_positions = (nodes - ((1 << level) - 1)) * node_size
+        home_coords = self._coords[first_positions[:, np.newaxis] + np.arange(node_size)]
+        home_dists = (home_coords[:, :, 0] - qxs[:, np.newaxis]) ** 2 + (home_coords[:, :, 1] - qys[:, np.newaxis]) ** 2
+        radii_sqrd = np.partition(home_dists, k - 1, axis=1)[:, k - 1]
+        # (query, node) pairs, from the root down to the leaves
+        pair_queries = np.flatnonzero(np.isfinite(radii_sqrd))
+        pair_nodes = np.zeros(len(pair_queries), dtype=np.intp)
+        with np.errstate(invalid='ignore'):
+            while len(pair_nodes) and pair_nodes[0] < n_internal:
+                pair_queries = np.concatenate((pair_queries, pair_queries))
+                pair_nodes = np.concatenate((2 * pair_nodes + 1, 2 * pair_nodes + 2))
+                node_boxes = boxes[pair_nodes]
+                pair_qxs, pair_qys = qxs[pair_queries], qys[pair_queries]
+                dxs = np.maximum(np.maximum(node_boxes[:, 0] - pair_qxs, pair_qxs - node_boxes[:, 2]), 0.0)
+                dys = np.maximum(np.maximum(node_boxes[:, 1] - pair_qys, pair_qys - node_boxes[:, 3]), 0.0)
+                # nan boxes (padding only) are never kept
+                kept = dxs * dxs + dys * dys <= radii_sqrd[pair_queries]
+                pair_queries, pair_nodes = pair_queries[kept], pair_nodes[kept]
+        # points of the leaves reached, within the radius of their query: at least k per query
+        leaf_positions = ((pair_nodes - n_internal)[:, np.newaxis] * leaf_size + np.arange(leaf_size)).reshape(-1)
+        candidate_queries = np.repeat(pair_queries, leaf_size)
+        leaf_coords = self._coords[leaf_positions]
+        candidate_dists = ((leaf_coords[:, 0] - qxs[candidate_queries]) ** 2 +
+                           (leaf_coords[:, 1] - qys[candidate_queries]) ** 2)
+        within = candidate_dists <= radii_sqrd[candidate_queries]
+        candidate_queries, candidate_dists = candidate_queries[within], candidate_dists[within]
+        leaf_positions = leaf_positions[within]
+        # the first k of each query, by distance
+        by_query_and_distance = np.lexsort((candidate_dists, candidate_queries))
+        candidate_queries = candidate_queries[by_query_and_distance]
+        counts = np.bincount(candidate_queries, minlength=n_queries)
+        ranks = np.arange(len(candidate_queries)) - (np.cumsum(counts) - counts)[candidate_queries]
+        first_k = by_query_and_distance[ranks < k]
+        distances = np.full((n_queries, k), np.inf)
+        indices = np.zeros((n_queries, k), dtype=np.intp)
+        answered = np.isfinite(radii_sqrd)
+        distances[answered] = candidate_dists[first_k].reshape(-1, k)
+        indices[answered] = self._order[leaf_positions[first_k]].reshape(-1, k)
+        # queries whose home node has less than k points (it holds padding): one by one
+        for i in np.flatnonzero(~np.isfinite(radii_sqrd)).tolist():
+            distances[i], indices[i] = self.query(query_coords[i], k=k, squared=True)
+        return distances, indices
+
+    def query_radius_batch(self, points, radius: float, sort: bool = False):
+        """All points within a distance of each of many points, as a list of index arrays."""
+        return [self.query_radius((qx, qy), radius, sort=sort) for (qx, qy) in as_coords_array(points).tolist()]
+
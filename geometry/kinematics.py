@@ -0,0 +1,162 @@
+"""Integration of the motion of many entities at once.
+
+KinematicsIntegrator  -- owns position, velocity and acceleration arrays, and advances them in place
+
+All entities are stepped in a few NumPy operations writing into the
+integrator's own buffers, so a step allocates nothing per entity (nor any
+temporary array). Individual entities are reached through views: a Point (or
+Vec2d) whose x and y read and write the arrays directly.
+"""
+
+import numpy as np
+
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+from geometry.xy_array import as_coords
+
+
+class PointView(Point):
+    """A Point whose coordinates live in a row of an (N, 2) array."""
+
+    def __init__(self, buffer: np.ndarray, index: int):
+        self._buffer = buffer
+        self._index = index
+
+    @property
+    def x(self):
+        return self._buffer.item(self._index, 0)
+
+    @x.setter
+    def x(self, value):
+        self._buffer[self._index, 0] = value
+
+    @property
+    def y(self):
+        return self._buffer.item(self._index, 1)
+
+    @y.setter
+    def y(self, value):
+        self._buffer[self._index, 1] = value
+
+
+class Vec2dView(Vec2d):
+    """A Vec2d whose coordinates live in a row of an (N, 2) array."""
+
+    __slots__ = ['_buffer', '_index']
+
+    def __init__(self, buffer: np.ndarray, index: int):
+        self._buffer = buffer
+        self._index = index
+
+    @property
+    def x(self):
+        return self._buffer.item(self._index, 0)
+
+    @x.setter
+    def x(self, value):
+        self._buffer[self._index, 0] = value
+
+    @property
+    def y(self):
+        return self._buffer.item(self._index, 1)
+
+    @y.setter
+    def y(self, value):
+        self._buffer[self._index, 1] = value
+
+
+def _own_copy(values, n_entities: int) -> np.ndarray:
+    """(N, 2) copy of per-entity vectors, or of a single vector repeated."""
+    if isinstance(values, list):
+        values = [(a_vector[0], a_vector[1]) for a_vector in values]
+    return np.broadcast_to(np.asarray(as_coords(values), dtype=np.float64), (n_entities, 2)).copy()
+
+
+class KinematicsIntegrator(object):
+    """Positions, velocities and (optionally) accelerations of N entities.
+
+    step_euler  -- explicit Euler step
+    step_semi_implicit  -- semi-implicit (symplectic) Euler step
+    position, velocity, acceleration  -- views on one entity
+    positions_array, velocities_array  -- views on all entities
+    """
+
+    def __init__(self, positions, velocities=None, accelerations=None, bounds=None):
+        """
+        Initializes the integrator with copies of the given values.
+        :param positions: a PointArray, a list of Point, or a (N, 2) array.
+        :param velocities: a Vec2dArray, a list of Vec2d, a (N, 2) array or a single vector; zero if not given.
+        :param accelerations: same as velocities; no acceleration if not given.
+        :param bounds: a Rect positions are clamped to after each step; no clamping if not given.
+        """
+        if isinstance(positions, (list, tuple)):
+            positions = PointArray.from_points(positions)
+        self.positions = np.array(as_coords(positions), dtype=np.float64, order='C').reshape(-1, 2)
+        n_entities = len(self.positions)
+        self.velocities = np.zeros((n_entities, 2)) if velocities is None else _own_copy(velocities, n_entities)
+        self.accelerations = None if accelerations is None else _own_copy(accelerations, n_entities)
+        self.bounds = bounds
+        self._scratch = np.empty((n_entities, 2))
+
+    def __len__(self):
+        return len(self.positions)
+
+    def set_accelerations(self, accelerations):
+        """Sets (or, with None, removes) the accelerations."""
+        if accelerations is None:
+            self.accelerations = None
+        elif self.accelerations is None:
+            self.accelerations = _own_copy(accelerations, len(self))
+        else:
+            self.accelerations[:] = as_coords(accelerations)
+
+    def step_euler(self, dt: float):
+        """x += v.dt, then v += a.dt (the velocity used to move is the one before the step)."""
+        np.multiply(self.velocities, dt, out=self._scratch)
+        self.positions += self._scratch
+        if self.accelerations is not None:
+            np.multiply(self.accelerations, dt, out=self._scratch)
+            self.velocities += self._scratch
+        self._clamp()
+
+    def step_semi_implicit(self, dt: float):
+        """v += a.dt, then x += v.dt (more stable than explicit Euler for oscillating motion)."""
+        if self.accelerations is not None:
+            np.multiply(self.accelerations, dt, out=self._scratch)
+            self.velocities += self._scratch
+        np.multiply(self.velocities, dt, out=self._scratch)
+        self.positions += self._scratch
+        self._clamp()
+
+    def _clamp(self):
+        if self.bounds is None:
+            return
+        a_rect = self.bounds
+        min_y, max_y = min(a_rect.top, a_rect.bottom), max(a_rect.top, a_rect.bottom)
+        xs, ys = self.positions[:, 0], self.positions[:, 1]
+        np.clip(xs, a_rect.left, a_rect.right, out=xs)
+        np.clip(ys, min_y, max_y, out=ys)
+
+    def position(self, index: int) -> Point:
+        """Position of an entity, as a Point backed by the positions array (writes go through)."""
+        return PointView(self.positions, index)
+
+    def velocity(self, index: int) -> Vec2d:
+        """Velocity of an entity, as a Vec2d backed by the velocities array (writes go through)."""
+        return Vec2dView(self.velocities, index)
+
+    def acceleration(self, index: int) -> Vec2d:
+        """Acceleration of an entity, as a Vec2d backed by the accelerations array (writes go through)."""
+        if self.accelerations is None:
+            raise ValueError("This integrator has no accelerations")
+        return Vec2dView(self.accelerations, index)
+
+    def positions_array(self) -> PointArray:
+        """All positions, as a PointArray sharing the integrator's buffer."""
+        return PointArray.wrap(self.positions)
+
+    def velocities_array(self) -> Vec2dArray:
+        """All velocities, as a Vec2dArray sharing the integrator's buffer."""
+        return Vec2dArray.wrap(self.velocities)
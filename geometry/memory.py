@@ -0,0 +1,188 @@
+"""Memory used by geometry objects, and what the compact alternatives would save.
+
+bytes_per_instance  -- memory allocated per object, measured on many of them
+live_counts  -- number of instances of the geometry classes currently alive
+footprint_report  -- per class: bytes per instance, live count, slotted and array alternatives
+format_report  -- a report as a text table
+
+Bytes per instance are measured with tracemalloc: everything allocated to
+build many objects (with distinct float coordinates, so each one owns its
+floats), divided by their number. That includes the object, its __dict__ if
+it has one, and its floats; it does not include what is shared (classes,
+attribute names, enum members). Array alternatives are measured as bytes of
+array per entry, without the small fixed cost of the array object itself.
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from geometry.angle import AngleInRadians, AngleInDegrees
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import FrozenPoint, Point
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+
+# number of objects built to measure the bytes per instance (and per array entry)
+SAMPLE_SIZE = 2000
+
+
+def bytes_per_instance(make_instance, n: int = SAMPLE_SIZE) -> float:
+    """
+    Average memory allocated for one object.
+    :param make_instance: function of an index i in [0, n), building an object (with values depending on i).
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [make_instance(i) for i in range(n)]
+        allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(instances)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return allocated / n
+
+
+class _SlottedPoint(object):
+    """What Point would be with __slots__ (FrozenPoint also keeps its hash)."""
+    __slots__ = ['x', 'y']
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _SlottedAngle(object):
+    """What AngleInRadians would be with __slots__."""
+    __slots__ = ['value', '_cos_sin', '_cos_sin_value']
+
+    def __init__(self, value):
+        self.value = value
+        self._cos_sin = None
+        self._cos_sin_value = None
+
+
+def _sample_rect(i: int) -> Rect:
+    return Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(i + 0.5, i + 1.5), pt2=Point(i + 2.5, i + 3.5))
+
+
+def _rect_with_derived_points(i: int) -> Rect:
+    a_rect = _sample_rect(i)
+    for a_property in ('topleft', 'topright', 'bottomright', 'bottomleft', 'center',
+                       'midbottom', 'midtop', 'midleft', 'midright'):
+        getattr(a_rect, a_property)
+    return a_rect
+
+
+def _array_bytes_per_entry(kind: str) -> float:
+    """Bytes per entry of the array collection standing in for the objects of 'kind'."""
+    import numpy as np
+    n = SAMPLE_SIZE
+    if kind in ('Point', 'FrozenPoint', 'Vec2d'):
+        from geometry.point_array import PointArray
+        return PointArray.zeros(n).coords.nbytes / n
+    if kind == 'Rect':
+        from geometry.rect_array import RectArray
+        zeros = np.zeros(n)
+        rects = RectArray(zeros, zeros, zeros, zeros)
+        return sum(an_array.nbytes for an_array in
+                   (rects.lefts, rects.rights, rects.tops, rects.bottoms, rects.screen_direction)) / n
+    from geometry.angle_array import AngleArray
+    return AngleArray(np.zeros(n)).values.nbytes / n
+
+
+# name -> (class counted alive, builder of instances, builder of the slotted alternative (None if slotted already),
+#          name of the array alternative)
+_KINDS = {
+    'Point': (Point, lambda i: Point(i + 0.5, i + 1.5), lambda i: _SlottedPoint(i + 0.5, i + 1.5), 'PointArray'),
+    'FrozenPoint': (FrozenPoint, lambda i: FrozenPoint(i + 0.5, i + 1.5), None, 'PointArray'),
+    'Vec2d': (Vec2d, lambda i: Vec2d(i + 0.5, i + 1.5), None, 'Vec2dArray'),
+    'Rect': (Rect, _sample_rect, None, 'RectArray'),
+    'Rect (derived points built)': (None, _rect_with_derived_points, None, 'RectArray'),
+    'AngleInRadians': (AngleInRadians, lambda i: AngleInRadians(i * 1e-3), lambda i: _SlottedAngle(i * 1e-3),
+                       'AngleArray'),
+    'AngleInDegrees': (AngleInDegrees, lambda i: AngleInDegrees(i * 0.1), lambda i: _SlottedAngle(i * 0.1),
+                       'AngleArray'),
+}
+
+
+def live_counts(classes=(Point, FrozenPoint, Vec2d, Rect, AngleInRadians, AngleInDegrees)) -> dict:
+    """{class name: number of instances alive} (instances of subclasses are counted with their own class)."""
+    counts = dict.fromkeys((cls.__name__ for cls in classes), 0)
+    by_type = {cls: cls.__name__ for cls in classes}
+    for an_object in gc.get_objects():
+        name = by_type.get(type(an_object))
+        if name is not None:
+            counts[name] += 1
+    return counts
+
+
+class Footprint(object):
+    """Memory of one kind of object, and of its alternatives, for a population."""
+
+    def __init__(self, kind: str, live_count: int, population: int, bytes_per_instance: float,
+                 slotted_bytes: float, array_name: str, array_bytes: float):
+        self.kind = kind
+        self.live_count = live_count
+        self.population = population
+        self.bytes_per_instance = bytes_per_instance
+        # None if the class already has __slots__
+        self.slotted_bytes = slotted_bytes
+        self.array_name = array_name
+        self.array_bytes = array_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return int(self.bytes_per_instance * self.population)
+
+    @property
+    def slotted_savings(self) -> int:
+        """Bytes saved for the population by a slotted class (0 if already slotted)."""
+        if self.slotted_bytes is None:
+            return 0
+        return int((self.bytes_per_instance - self.slotted_bytes) * self.population)
+
+    @property
+    def array_savings(self) -> int:
+        """Bytes saved for the population by the array collection."""
+        return int((self.bytes_per_instance - self.array_bytes) * self.population)
+
+    def as_dict(self) -> dict:
+        return {"kind": self.kind, "live_count": self.live_count, "population": self.population,
+                "bytes_per_instance": self.bytes_per_instance, "total_bytes": self.total_bytes,
+                "slotted_bytes": self.slotted_bytes, "slotted_savings": self.slotted_savings,
+                "array": self.array_name, "array_bytes": self.array_bytes, "array_savings": self.array_savings}
+
+
+def footprint_report(population: int = None) -> list:
+    """
+    Memory of the geometry classes.
+    :param population: number of instances the savings are estimated for; the live count of each class if not given.
+    :return: list of Footprint, one per kind of object.
+    """
+    counts = live_counts()
+    report = []
+    for kind, (cls, make_instance, make_slotted, array_name) in _KINDS.items():
+        live_count = counts[cls.__name__] if cls is not None else 0
+        report.append(Footprint(kind, live_count, live_count if population is None else population,
+                                bytes_per_instance(make_instance),
+                                None if make_slotted is None else bytes_per_instance(make_slotted),
+                                array_name, _array_bytes_per_entry(kind.split()[0])))
+    return report
+
+
+def format_report(report: list) -> str:
+    """A report (from footprint_report) as a text table; sizes in bytes."""
+    lines = ["%-28s %10s %10s %10s %12s %8s %12s %-10s %8s %12s" %
+             ("kind", "live", "population", "bytes/obj", "total", "slotted", "saved", "array", "bytes", "saved")]
+    for a_footprint in report:
+        lines.append("%-28s %10d %10d %10.1f %12d %8s %12d %-10s %8.1f %12d" %
+                     (a_footprint.kind, a_footprint.live_count, a_footprint.population,
+                      a_footprint.bytes_per_instance, a_footprint.total_bytes,
+                      "-" if a_footprint.slotted_bytes is None else "%.1f" % (a_footprint.slotted_bytes),
+                      a_footprint.slotted_savings, a_footprint.array_name, a_footprint.array_bytes,
+                      a_footprint.array_savings))
+    return "\n".join(lines)
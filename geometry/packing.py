@@ -0,0 +1,66 @@
+"""Bulk conversion of lists of geometry objects to and from array collections.
+
+pack  -- a list of Point (or FrozenPoint), Vec2d, Rect or Angle, as one PointArray, Vec2dArray, RectArray or AngleArray
+unpack  -- back to a list of objects
+
+Pickling a million Points pickles a million objects; pickling their
+PointArray pickles one buffer. With pickle protocol 5 the collections hand
+their buffers to 'buffer_callback', so they can be sent to another process
+without being copied into the pickle:
+
+    >>> buffers = []
+    >>> data = pickle.dumps(pack(points), protocol=5, buffer_callback=buffers.append)
+    >>> points = unpack(pickle.loads(data, buffers=buffers))
+"""
+
+from geometry.angle import Angle
+from geometry.angle_array import AngleArray
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import FrozenPoint, Point
+from geometry.point_array import PointArray
+from geometry.rect_array import RectArray
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+from geometry.xy_array import XYArray
+
+
+def pack(items, item_class=None):
+    """
+    One collection holding all the items.
+    :param items: Points, Vec2ds, Rects or Angles (all of the same kind).
+    :param item_class: kind of the items (Point, Vec2d, Rect or Angle); guessed from the first one if not given.
+    :return: a PointArray, Vec2dArray, RectArray or AngleArray (in radians).
+    """
+    items = list(items)
+    if item_class is None:
+        if not items:
+            raise ValueError("Can't guess the kind of an empty list: give 'item_class'")
+        item_class = type(items[0])
+    if issubclass(item_class, Vec2d):
+        return Vec2dArray.from_vectors(items)
+    if issubclass(item_class, (Point, FrozenPoint)):
+        return PointArray.from_points(items)
+    if issubclass(item_class, Rect):
+        return RectArray.from_rects(items)
+    if issubclass(item_class, Angle):
+        return AngleArray.from_angles(items)
+    raise TypeError("Don't know how to pack a %s" % (item_class.__name__))
+
+
+def unpack(collection):
+    """
+    The items of a collection made by 'pack'.
+    :return: a list of Point or Vec2d, Rect, or AngleInRadians.
+    """
+    if isinstance(collection, XYArray):
+        return list(collection)
+    if isinstance(collection, RectArray):
+        screen, anti_screen = CoordinatesDirection.SCREEN_DIRECTION, CoordinatesDirection.ANTI_SCREEN_DIRECTION
+        return [Rect(direction=screen if is_screen else anti_screen, pt1=Point(left, top), pt2=Point(right, bottom))
+                for left, right, top, bottom, is_screen in
+                zip(collection.lefts.tolist(), collection.rights.tolist(), collection.tops.tolist(),
+                    collection.bottoms.tolist(), collection.screen_direction.tolist())]
+    if isinstance(collection, AngleArray):
+        return collection.to_angles()
+    raise TypeError("Don't know how to unpack a %s" % (type(collection).__name__))
@@ -3,6 +3,7 @@
 This code is in the public domain.
 
 Point  -- point with (x,y) coordinates
+FrozenPoint  -- immutable point, with its hash kept once computed (for dict keys and sets)
 Rect  -- two points, forming a rectangle
 
 Taken from https://wiki.python.org/moin/PointsAndRectangles
@@ -11,27 +12,16 @@ Taken from https://wiki.python.org/moin/PointsAndRectangles
 import math
 from typing import Tuple
 
-class Point:
-    """A point identified by (x,y) coordinates.
+from geometry import scalar
 
-    supports: +, -, *, /, str, repr
 
-    length  -- calculate length of vector to point from origin
-    distance_to  -- calculate distance between two points
-    as_tuple  -- construct tuple (x,y)
-    clone  -- construct a duplicate
-    integerize  -- convert x & y to integers
-    floatize  -- convert x & y to floats
-    move_to  -- reset x & y
-    slide  -- move (in place) +dx, +dy, as spec'd by point
-    slide_xy  -- move (in place) +dx, +dy
-    rotate  -- rotate around the origin
-    rotate_about  -- rotate around another point
-    """
+class _PointMethods:
+    """Methods shared by Point and FrozenPoint: those that don't change the point.
 
-    def __init__(self, x:float=0.0, y:float=0.0):
-        self.x = x
-        self.y = y
+    New points are built with the class '_result_class' of the point (Point
+    for Point and its subclasses, FrozenPoint for FrozenPoint).
+    """
+    __slots__ = []
 
     @classmethod
     def from_tuple(cls, pt_as_tuple:Tuple[float,float]):
@@ -48,42 +38,42 @@ class Point:
         else:
             raise RuntimeError("Index %d does not make sense in a point" % (item))
 
-    def __attrs(self):
-        """
-        All attributes in a single representation.
-        Returns:
-            A tuple with all attributes.
-
-        """
-        return (self.x, self.y)
-
-    def __eq__(self, other):
-        return isinstance(other, Point) and self.__attrs() == other.__attrs()
-
-    def __hash__(self):
-        return hash(self.__attrs())
-
     def __add__(self, another_pt):
         """Point(x1+x2, y1+y2)"""
-        return Point(self.x + another_pt.x, self.y + another_pt.y)
+        return self._result_class(self.x + another_pt.x, self.y + another_pt.y)
 
     def __sub__(self, another_point):
         """Point(x1-x2, y1-y2)"""
-        return Point(self.x - another_point.x, self.y - another_point.y)
-
-    def __isub__(self, another_point):
-        self.x += another_point.x
-        self.y += another_point.y
-        return self
-
+        return self._result_class(self.x - another_point.x, self.y - another_point.y)
 
     def __mul__(self, scalar):
         """Point(x1*x2, y1*y2)"""
-        return Point(self.x * scalar, self.y * scalar)
+        return self._result_class(self.x * scalar, self.y * scalar)
 
     def __div__(self, scalar):
         """Point(x1/x2, y1/y2)"""
-        return Point(self.x / scalar, self.y / scalar)
+        return self._result_class(self.x / scalar, self.y / scalar)
+    __truediv__ = __div__
+
+    # Allocation-free versions: the result goes to 'out' (anything with settable x & y), which is returned.
+
+    def add_into(self, another_point, out):
+        """out = self + another_point"""
+        out.x = self.x + another_point.x
+        out.y = self.y + another_point.y
+        return out
+
+    def sub_into(self, another_point, out):
+        """out = self - another_point"""
+        out.x = self.x - another_point.x
+        out.y = self.y - another_point.y
+        return out
+
+    def scale_into(self, scalar, out):
+        """out = self * scalar"""
+        out.x = self.x * scalar
+        out.y = self.y * scalar
+        return out
 
     def __str__(self):
         return "(%.2f, %.2f)" % (self.x, self.y)
@@ -93,20 +83,114 @@ class Point:
 
     def length(self) -> float:
         """norm of vector (0,0) to this point"""
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        return scalar.norm(self.x, self.y)
 
     def distance_to(self, another_point) -> float:
         """Calculate the distance between two points."""
-        return (self - another_point).length()
+        return scalar.distance(self.x, self.y, another_point.x, another_point.y)
 
     def as_tuple(self):
         """(x, y)"""
         return (self.x, self.y)
 
+    def rotate(self, rad):
+        """Rotate counter-clockwise by rad radians.
+
+        Positive y goes *up,* as in traditional mathematics.
+
+        Interestingly, you can use this in y-down computer graphics, if
+        you just remember that it turns clockwise, rather than
+        counter-clockwise.
+
+        The new position is returned as a new Point.
+        """
+        a_sinus, a_cosinus = math.sin(rad), math.cos(rad)
+        x, y = (a_cosinus * self.x - a_sinus * self.y, a_sinus * self.x + a_cosinus * self.y)
+        return self._result_class(x, y)
+
+    def rotate_about(self, a_point, rad):
+        """Rotate counter-clockwise around a point, by rad radians.
+
+        Positive y goes *up,* as in traditional mathematics.
+
+        The new position is returned as a new Point.
+        """
+        a_sinus, a_cosinus = math.sin(rad), math.cos(rad)
+        dx, dy = self.x - a_point.x, self.y - a_point.y
+        return self._result_class(a_point.x + a_cosinus * dx - a_sinus * dy,
+                                  a_point.y + a_sinus * dx + a_cosinus * dy)
+
+
+class Point(_PointMethods):
+    """A point identified by (x,y) coordinates.
+
+    supports: +, -, *, /, +=, -=, *=, /=, str, repr
+
+    add_into, sub_into, scale_into  -- same as +, -, *, writing into an existing point
+
+    length  -- calculate length of vector to point from origin
+    distance_to  -- calculate distance between two points
+    as_tuple  -- construct tuple (x,y)
+    clone  -- construct a duplicate
+    integerize  -- convert x & y to integers
+    floatize  -- convert x & y to floats
+    move_to  -- reset x & y
+    slide  -- move (in place) +dx, +dy, as spec'd by point
+    slide_xy  -- move (in place) +dx, +dy
+    rotate  -- rotate around the origin
+    rotate_about  -- rotate around another point
+    frozen  -- construct an immutable copy (FrozenPoint)
+    """
+
+    def __init__(self, x:float=0.0, y:float=0.0):
+        self.x = x
+        self.y = y
+
+    def __attrs(self):
+        """
+        All attributes in a single representation.
+        Returns:
+            A tuple with all attributes.
+
+        """
+        return (self.x, self.y)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenPoint):
+            return self.x == other.x and self.y == other.y
+        return isinstance(other, Point) and self.__attrs() == other.__attrs()
+
+    def __hash__(self):
+        return hash(self.__attrs())
+
+    def __iadd__(self, another_point):
+        self.x += another_point.x
+        self.y += another_point.y
+        return self
+
+    def __isub__(self, another_point):
+        self.x -= another_point.x
+        self.y -= another_point.y
+        return self
+
+    def __imul__(self, scalar):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __itruediv__(self, scalar):
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
     def clone(self):
         """Return a full copy of this point."""
         return Point(self.x, self.y)
 
+    def frozen(self):
+        """Return an immutable copy of this point."""
+        return FrozenPoint(self.x, self.y)
+
     def integerize(self):
         """Convert co-ordinate values to integers."""
         self.x = int(round(self.x))
@@ -142,33 +226,103 @@ class Point:
         self.x = self.x + dx
         self.y = self.y + dy
 
-    def rotate(self, rad):
-        """Rotate counter-clockwise by rad radians.
 
-        Positive y goes *up,* as in traditional mathematics.
+class FrozenPoint(_PointMethods):
+    """An immutable point identified by (x,y) coordinates.
 
-        Interestingly, you can use this in y-down computer graphics, if
-        you just remember that it turns clockwise, rather than
-        counter-clockwise.
+    Same methods as Point, but those that would move the point return a new
+    FrozenPoint instead. The hash is computed on first use and kept; it is
+    the hash of a Point with the same coordinates: a FrozenPoint and a Point
+    with the same coordinates are equal, and are the same dict key.
 
-        The new position is returned as a new Point.
-        """
-        a_sinus, a_cosinus = [f(rad) for f in (math.sin, math.cos)]
-        x, y = (a_cosinus * self.x - a_sinus * self.y, a_sinus * self.x + a_cosinus * self.y)
-        return Point(x, y)
+    supports: +, -, *, /, str, repr, hash, pickle
 
-    def rotate_about(self, a_point, theta):
-        """Rotate counter-clockwise around a point, by theta degrees.
+    add_into, sub_into, scale_into  -- same as +, -, *, writing into an existing (mutable) point
 
-        Positive y goes *up,* as in traditional mathematics.
+    length  -- calculate length of vector to point from origin
+    distance_to  -- calculate distance between two points
+    as_tuple  -- construct tuple (x,y)
+    clone  -- itself (it can't change)
+    integerize  -- construct a point with x & y converted to integers
+    floatize  -- construct a point with x & y converted to floats
+    move_to  -- construct a point at (x, y)
+    translate_following  -- construct a point at (x+dx, y+dy), as spec'd by a vector
+    slide_xy  -- construct a point at (x+dx, y+dy)
+    rotate  -- rotate around the origin
+    rotate_about  -- rotate around another point
+    thawed  -- construct a mutable copy (Point)
+    """
+    # '_hash' is left unset until the first hash
+    __slots__ = ['x', 'y', '_hash']
 
-        The new position is returned as a new Point.
-        """
-        result = self.clone()
-        result.slide_xy(-a_point.x, -a_point.y)
-        result.rotate(theta)
-        result.slide_xy(a_point.x, a_point.y)
-        return result
+    def __init__(self, x:float=0.0, y:float=0.0):
+        _set_x(self, x)
+        _set_y(self, y)
+
+    @classmethod
+    def from_point(cls, a_point):
+        """A FrozenPoint at the same place as a Point (or anything with .x and .y)."""
+        return cls(a_point.x, a_point.y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenPoint is immutable: can't set '%s'" % (name))
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenPoint is immutable: can't delete '%s'" % (name))
+
+    def __reduce__(self):
+        return (FrozenPoint, (self.x, self.y))
+
+    def __eq__(self, other):
+        if isinstance(other, (FrozenPoint, Point)):
+            return self.x == other.x and self.y == other.y
+        return False
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            a_hash = hash((self.x, self.y))
+            _set_hash(self, a_hash)
+            return a_hash
+
+    def clone(self):
+        """The point itself: it can't change."""
+        return self
+
+    def thawed(self) -> Point:
+        """Return a mutable copy of this point."""
+        return Point(self.x, self.y)
+
+    def integerize(self):
+        """The point with co-ordinate values converted to integers."""
+        return FrozenPoint(int(round(self.x)), int(round(self.y)))
+
+    def floatize(self):
+        """The point with co-ordinate values converted to floats."""
+        return FrozenPoint(float(self.x), float(self.y))
+
+    def move_to(self, x, y):
+        """The point at (x, y)."""
+        return FrozenPoint(x, y)
+
+    def translate_following(self, a_vector):
+        """The point at (x+dx,y+dy), following a 2D vector."""
+        return FrozenPoint(self.x + a_vector.x, self.y + a_vector.y)
+
+    def slide_xy(self, dx, dy):
+        """The point at (x+dx,y+dy)."""
+        return FrozenPoint(self.x + dx, self.y + dy)
+
+
+# class of the new points made by the shared methods
+Point._result_class = Point
+FrozenPoint._result_class = FrozenPoint
+
+# set the slots of a FrozenPoint, bypassing the __setattr__ that forbids it
+_set_x = FrozenPoint.x.__set__
+_set_y = FrozenPoint.y.__set__
+_set_hash = FrozenPoint._hash.__set__
 
 POINT_ZEROZERO = Point(x=0.0, y=0.0)
 
@@ -0,0 +1,85 @@
+"""Array-backed collection of points.
+
+PointArray  -- many (x,y) points stored in one contiguous NumPy buffer
+
+A PointArray keeps its coordinates in a single (N, 2) float64 array, so a
+million points cost 16MB instead of a million Python objects. Arithmetic is
+done in one NumPy pass over the whole collection; indexing with an integer
+gives back a regular `Point`.
+"""
+
+import numpy as np
+
+from geometry.point import Point
+from geometry.xy_array import XYArray, as_coords, as_scalars
+
+
+class PointArray(XYArray):
+    """A collection of points identified by (x,y) coordinates.
+
+    supports: +, -, *, /, len, iteration, indexing (int -> Point, slice -> PointArray)
+
+    xs, ys  -- views on the x and y coordinates
+    length  -- length of vectors to points from origin, as an array
+    distance_to  -- distances between points and a point (or another PointArray)
+    as_tuple  -- construct tuple (xs, ys) of arrays
+    to_points  -- construct a list of Point
+    clone  -- construct a duplicate
+    integerize  -- round x & y to integers (in place)
+    integer_coords  -- construct a (N, 2) array of ints
+    """
+
+    __slots__ = []
+
+    item_class = Point
+
+    @classmethod
+    def from_points(cls, points):
+        """Builds an array from an iterable of Point (or of anything with .x and .y)."""
+        points = list(points)
+        coords = np.empty((len(points), 2), dtype=np.float64)
+        coords[:, 0] = [a_pt.x for a_pt in points]
+        coords[:, 1] = [a_pt.y for a_pt in points]
+        return cls(coords)
+
+    def __add__(self, other):
+        """PointArray(x1+x2, y1+y2)"""
+        return self.__class__(self.coords + as_coords(other))
+
+    def __sub__(self, other):
+        """PointArray(x1-x2, y1-y2)"""
+        return self.__class__(self.coords - as_coords(other))
+
+    def __mul__(self, scalar):
+        """PointArray(x*scalar, y*scalar). 'scalar' can also be one value per point."""
+        return self.__class__(self.coords * as_scalars(scalar))
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        """PointArray(x/scalar, y/scalar)"""
+        return self.__class__(self.coords / as_scalars(scalar))
+
+    def __str__(self):
+        return "PointArray of %d points" % (len(self))
+
+    def length(self) -> np.ndarray:
+        """norm of vectors (0,0) to each point"""
+        return np.hypot(self.coords[:, 0], self.coords[:, 1])
+
+    def distance_to(self, another_point) -> np.ndarray:
+        """Distances between each point and another point (or the matching points of another array)."""
+        diff = self.coords - as_coords(another_point)
+        return np.hypot(diff[:, 0], diff[:, 1])
+
+    def to_points(self):
+        """A list with one Point per entry."""
+        return [Point(x, y) for (x, y) in self.coords.tolist()]
+
+    def integerize(self):
+        """Round co-ordinate values to integers, in place (halves to even, like Point.integerize)."""
+        np.rint(self.coords, out=self.coords)
+        return self
+
+    def integer_coords(self) -> np.ndarray:
+        """Co-ordinate values rounded like Point.integerize, as a (N, 2) int64 array (e.g. pixel indices)."""
+        return np.rint(self.coords).astype(np.int64)
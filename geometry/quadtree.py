@@ -0,0 +1,216 @@
+"""Quadtree over rectangles.
+
+RectQuadtree  -- point-hit, overlap and all-pairs-overlap queries over Rect objects
+
+Each rectangle is stored in the deepest node whose area fully contains it, so a
+query only descends into the quadrants it touches. Rectangles are indexed by
+their x/y extents, which makes SCREEN_DIRECTION and ANTI_SCREEN_DIRECTION
+rectangles (and queries) interchangeable.
+
+After each query, 'last_visits' holds the number of nodes the query looked at;
+use it to tune 'capacity' and 'max_depth'.
+"""
+
+from geometry.point import Point
+
+
+def _extent(a_rect):
+    """(min_x, min_y, max_x, max_y) of a Rect, whatever its coordinates direction."""
+    return (a_rect.left, min(a_rect.top, a_rect.bottom), a_rect.right, max(a_rect.top, a_rect.bottom))
+
+
+def _overlap(an_extent, another_extent) -> bool:
+    """Same rule as Rect.overlaps: touching borders don't count."""
+    return (an_extent[2] > another_extent[0] and an_extent[0] < another_extent[2] and
+            an_extent[3] > another_extent[1] and an_extent[1] < another_extent[3])
+
+
+class _QuadNode(object):
+    __slots__ = ['extent', 'depth', 'items', 'children']
+
+    def __init__(self, extent, depth: int):
+        self.extent = extent
+        self.depth = depth
+        self.items = []
+        self.children = None
+
+    def child_for(self, an_extent):
+        """The child fully containing an extent, if any."""
+        min_x, min_y, max_x, max_y = self.extent
+        mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+        if an_extent[2] <= mid_x:
+            column = 0
+        elif an_extent[0] >= mid_x:
+            column = 1
+        else:
+            return None
+        if an_extent[3] <= mid_y:
+            row = 0
+        elif an_extent[1] >= mid_y:
+            row = 1
+        else:
+            return None
+        return self.children[2 * row + column]
+
+    def split(self):
+        min_x, min_y, max_x, max_y = self.extent
+        mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+        depth = self.depth + 1
+        self.children = [_QuadNode((min_x, min_y, mid_x, mid_y), depth),
+                         _QuadNode((mid_x, min_y, max_x, mid_y), depth),
+                         _QuadNode((min_x, mid_y, mid_x, max_y), depth),
+                         _QuadNode((mid_x, mid_y, max_x, max_y), depth)]
+
+
+class RectQuadtree(object):
+    """A quadtree indexing Rect objects.
+
+    insert  -- add a rectangle, returns its index
+    query_point  -- indices of the rectangles containing a point
+    query_overlap  -- indices of the rectangles overlapping a rectangle
+    all_overlapping_pairs  -- all (i, j) pairs of overlapping rectangles
+    last_visits  -- nodes visited by the last query
+    """
+
+    def __init__(self, rects=(), bounds=None, capacity: int = 8, max_depth: int = 8):
+        """
+        Initializes the tree.
+        :param rects: rectangles to index.
+        :param bounds: Rect covering the indexed area; defaults to the extent of 'rects'.
+            Rectangles not inside it are still indexed (in the root).
+        :param capacity: number of rectangles a node holds before being split.
+        :param max_depth: nodes at this depth are never split.
+        """
+        rects = list(rects)
+        if bounds is not None:
+            root_extent = _extent(bounds)
+        elif rects:
+            extents = [_extent(a_rect) for a_rect in rects]
+            root_extent = (min(e[0] for e in extents), min(e[1] for e in extents),
+                           max(e[2] for e in extents), max(e[3] for e in extents))
+        else:
+            root_extent = (0.0, 0.0, 1.0, 1.0)
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.rects = []
+        self._extents = []
+        self._root = _QuadNode(root_extent, 0)
+        self.last_visits = 0
+        for a_rect in rects:
+            self.insert(a_rect)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def insert(self, a_rect) -> int:
+        """Adds a rectangle; returns its index."""
+        index = len(self.rects)
+        self.rects.append(a_rect)
+        an_extent = _extent(a_rect)
+        self._extents.append(an_extent)
+        node = self._root
+        root_extent = node.extent
+        if not (root_extent[0] <= an_extent[0] and an_extent[2] <= root_extent[2] and
+                root_extent[1] <= an_extent[1] and an_extent[3] <= root_extent[3]):
+            node.items.append(index)
+            return index
+        while node.children is not None:
+            child = node.child_for(an_extent)
+            if child is None:
+                break
+            node = child
+        node.items.append(index)
+        if node.children is None and len(node.items) > self.capacity and node.depth < self.max_depth:
+            self._split(node)
+        return index
+
+    def _split(self, node):
+        node.split()
+        staying = []
+        for index in node.items:
+            child = node.child_for(self._extents[index])
+            if child is None:
+                staying.append(index)
+            else:
+                child.items.append(index)
+        node.items = staying
+        for child in node.children:
+            if len(child.items) > self.capacity and child.depth < self.max_depth:
+                self._split(child)
+
+    def query_point(self, a_point) -> list:
+        """Indices of the rectangles containing a point (borders included, as in Rect.contains)."""
+        x, y = a_point
+        extents = self._extents
+        found = []
+        visits = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            visits += 1
+            for index in node.items:
+                min_x, min_y, max_x, max_y = extents[index]
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    found.append(index)
+            if node.children is not None:
+                for child in node.children:
+                    min_x, min_y, max_x, max_y = child.extent
+                    if min_x <= x <= max_x and min_y <= y <= max_y:
+                        stack.append(child)
+        self.last_visits = visits
+        return found
+
+    def query_overlap(self, a_rect) -> list:
+        """Indices of the rectangles overlapping a rectangle (as in Rect.overlaps)."""
+        an_extent = _extent(a_rect)
+        extents = self._extents
+        found = []
+        visits = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            visits += 1
+            for index in node.items:
+                if _overlap(extents[index], an_extent):
+                    found.append(index)
+            if node.children is not None:
+                for child in node.children:
+                    # rectangles in a child are inside it: touching its border is enough to look
+                    child_extent = child.extent
+                    if (child_extent[2] >= an_extent[0] and child_extent[0] <= an_extent[2] and
+                            child_extent[3] >= an_extent[1] and child_extent[1] <= an_extent[3]):
+                        stack.append(child)
+        self.last_visits = visits
+        return found
+
+    def all_overlapping_pairs(self) -> list:
+        """All (i, j) pairs (with i < j) of overlapping rectangles."""
+        extents = self._extents
+        pairs = []
+        visits = 0
+        # (node, indices of the rectangles stored in its ancestors that overlap the node)
+        stack = [(self._root, [])]
+        while stack:
+            node, from_ancestors = stack.pop()
+            visits += 1
+            items = node.items
+            for position, index in enumerate(items):
+                an_extent = extents[index]
+                for other in from_ancestors:
+                    if _overlap(an_extent, extents[other]):
+                        pairs.append((min(index, other), max(index, other)))
+                for other in items[position + 1:]:
+                    if _overlap(an_extent, extents[other]):
+                        pairs.append((min(index, other), max(index, other)))
+            if node.children is not None:
+                candidates = from_ancestors + items
+                for child in node.children:
+                    child_extent = child.extent
+                    stack.append((child, [index for index in candidates
+                                          if _overlap(extents[index], child_extent)]))
+        self.last_visits = visits
+        return pairs
+
+    def __str__(self):
+        return "RectQuadtree with %d rectangles, bounds %s-%s" % \
+               (len(self), Point(*self._root.extent[:2]), Point(*self._root.extent[2:]))
@@ -0,0 +1,159 @@
+"""Array-backed collection of rectangles, and batch containment tests.
+
+RectArray  -- many rectangles as a structure of arrays (left, right, top, bottom)
+contains_mask  -- which points of a point array are inside one Rect
+
+Both coordinates directions are handled without branching per element: a
+rectangle is inside [left, right] on x and between its top and bottom on y,
+whichever of the two is the smallest.
+"""
+
+import pickle
+
+import numpy as np
+
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.xy_array import as_coords_array
+
+# upper bound on the number of booleans of a (rects x points) mask built at once
+DEFAULT_CHUNK_CELLS = 1 << 22
+
+
+def _points_xy(points):
+    coords = as_coords_array(points)
+    return coords[:, 0], coords[:, 1]
+
+
+def contains_mask(a_rect: Rect, points) -> np.ndarray:
+    """
+    Batch version of Rect.contains.
+    :param a_rect: the rectangle.
+    :param points: a PointArray or a (N, 2) array.
+    :return: boolean array, True for the points inside the rectangle (borders included).
+    """
+    xs, ys = _points_xy(points)
+    min_y, max_y = min(a_rect.top, a_rect.bottom), max(a_rect.top, a_rect.bottom)
+    return (xs >= a_rect.left) & (xs <= a_rect.right) & (ys >= min_y) & (ys <= max_y)
+
+
+class RectArray(object):
+    """A collection of rectangles, stored as one array per bound.
+
+    supports: len, iteration, indexing (int -> Rect, slice -> RectArray),
+        pickle (with protocol 5, each bound is an out-of-band buffer)
+
+    contains_mask  -- (rects x points) boolean matrix of containment
+    contains_pairs  -- (rect index, point index) of all the containments, computed in chunks
+    """
+
+    __slots__ = ['lefts', 'rights', 'tops', 'bottoms', 'screen_direction']
+
+    def __init__(self, lefts, rights, tops, bottoms,
+                 direction: CoordinatesDirection = CoordinatesDirection.SCREEN_DIRECTION):
+        """
+        Initializes the collection from its bounds.
+        :param direction: one direction for all rectangles, or an array of booleans
+            (True for SCREEN_DIRECTION), one per rectangle.
+        """
+        self.lefts = np.array(lefts, dtype=np.float64)
+        self.rights = np.array(rights, dtype=np.float64)
+        self.tops = np.array(tops, dtype=np.float64)
+        self.bottoms = np.array(bottoms, dtype=np.float64)
+        if not (len(self.lefts) == len(self.rights) == len(self.tops) == len(self.bottoms)):
+            raise ValueError("All bounds must have the same length")
+        if isinstance(direction, CoordinatesDirection):
+            direction = np.full(len(self.lefts), direction == CoordinatesDirection.SCREEN_DIRECTION)
+        self.screen_direction = np.array(direction, dtype=bool)
+
+    @classmethod
+    def from_rects(cls, rects):
+        rects = list(rects)
+        return cls([a_rect.left for a_rect in rects], [a_rect.right for a_rect in rects],
+                   [a_rect.top for a_rect in rects], [a_rect.bottom for a_rect in rects],
+                   [a_rect.coord_direction == CoordinatesDirection.SCREEN_DIRECTION for a_rect in rects])
+
+    def __len__(self):
+        return len(self.lefts)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            direction = CoordinatesDirection.SCREEN_DIRECTION if self.screen_direction[item] \
+                else CoordinatesDirection.ANTI_SCREEN_DIRECTION
+            return Rect(direction=direction,
+                        pt1=Point(float(self.lefts[item]), float(self.tops[item])),
+                        pt2=Point(float(self.rights[item]), float(self.bottoms[item])))
+        return RectArray(self.lefts[item], self.rights[item], self.tops[item], self.bottoms[item],
+                         self.screen_direction[item])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return "%s(%d rectangles)" % (self.__class__.__name__, len(self))
+
+    def __reduce_ex__(self, protocol):
+        arrays = (self.lefts, self.rights, self.tops, self.bottoms, self.screen_direction)
+        if protocol >= 5:
+            return _from_buffers, tuple(pickle.PickleBuffer(np.ascontiguousarray(an_array)) for an_array in arrays)
+        return RectArray, arrays
+
+    @property
+    def min_ys(self) -> np.ndarray:
+        return np.minimum(self.tops, self.bottoms)
+
+    @property
+    def max_ys(self) -> np.ndarray:
+        return np.maximum(self.tops, self.bottoms)
+
+    def contains_mask(self, points) -> np.ndarray:
+        """
+        Containment of many points in many rectangles.
+        :param points: a PointArray or a (M, 2) array.
+        :return: (N, M) boolean array: [i, j] is True if rectangle i contains point j.
+        """
+        xs, ys = _points_xy(points)
+        return self._mask(slice(None), xs, ys, self.min_ys, self.max_ys)
+
+    def _mask(self, rows, xs, ys, min_ys, max_ys) -> np.ndarray:
+        column = np.newaxis
+        mask = xs >= self.lefts[rows, column]
+        mask &= xs <= self.rights[rows, column]
+        mask &= ys >= min_ys[rows, column]
+        mask &= ys <= max_ys[rows, column]
+        return mask
+
+    def contains_pairs(self, points, chunk_cells: int = DEFAULT_CHUNK_CELLS):
+        """
+        All containments of points in rectangles, without building the whole (N, M) mask.
+        :param points: a PointArray or a (M, 2) array.
+        :param chunk_cells: maximum size of the partial masks (rectangles x points) built at once.
+        :return: (rect_indices, point_indices) arrays: rectangle rect_indices[k] contains point point_indices[k].
+        """
+        xs, ys = _points_xy(points)
+        min_ys, max_ys = self.min_ys, self.max_ys
+        rows_per_chunk = max(1, chunk_cells // max(1, len(xs)))
+        # with more points than chunk_cells, the points are chunked too (rows then come one at a time)
+        columns_per_chunk = max(1, chunk_cells // rows_per_chunk)
+        rect_indices, point_indices = [], []
+        for start in range(0, len(self), rows_per_chunk):
+            rows = slice(start, start + rows_per_chunk)
+            for column_start in range(0, len(xs), columns_per_chunk):
+                columns = slice(column_start, column_start + columns_per_chunk)
+                chunk_rects, chunk_points = np.nonzero(self._mask(rows, xs[columns], ys[columns], min_ys, max_ys))
+                rect_indices.append(chunk_rects + start)
+                point_indices.append(chunk_points + column_start)
+        if not rect_indices:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        return np.concatenate(rect_indices), np.concatenate(point_indices)
+
+
+def _from_buffers(lefts, rights, tops, bottoms, screen_direction):
+    """Unpickles a RectArray over its buffers."""
+    rects = RectArray.__new__(RectArray)
+    rects.lefts, rects.rights, rects.tops, rects.bottoms = \
+        [np.frombuffer(a_buffer, dtype=np.float64) for a_buffer in (lefts, rights, tops, bottoms)]
+    rects.screen_direction = np.frombuffer(screen_direction, dtype=bool)
+    return rects
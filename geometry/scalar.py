@@ -0,0 +1,66 @@
+"""Geometry of single vectors and points, on plain Python floats.
+
+norm, norm_sqrd  -- length of (x, y)
+distance, distance_sqrd  -- distance between two (x, y)
+angle_with_positive_x_axis  -- angle of (x, y) with the X+ axis, in [0, 2*Pi)
+scaled_to_norm, normalized  -- (x, y) brought to a given length
+
+Vec2d and Point go through these for their one-vector computations; NumPy is
+only worth its call overhead on whole arrays (see vector_array, point_array).
+Everything here takes and returns Python floats, never NumPy scalars.
+"""
+
+import math
+
+TWO_PI = 2 * math.pi
+
+
+def norm(x: float, y: float) -> float:
+    """Length of (x, y)."""
+    return math.hypot(x, y)
+
+
+def norm_sqrd(x: float, y: float) -> float:
+    """Squared length of (x, y)."""
+    return x * x + y * y
+
+
+def distance(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Distance between (x1, y1) and (x2, y2)."""
+    return math.hypot(x1 - x2, y1 - y2)
+
+
+def distance_sqrd(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Squared distance between (x1, y1) and (x2, y2)."""
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy
+
+
+def angle_with_positive_x_axis(x: float, y: float) -> float:
+    """Angle (radians, counter-clockwise) from the X+ axis to (x, y), in [0, 2*Pi); 0 for the null vector."""
+    if x == 0 and y == 0:
+        # atan2 would give +-Pi for some signed zeros
+        return 0.0
+    # atan2 is in [-Pi, Pi]; adding 0.0 turns a -0.0 (from y == -0.0) into 0.0
+    the_value = math.atan2(y, x) + 0.0
+    if the_value < 0:
+        the_value += TWO_PI
+        # a tiny negative angle rounds up to exactly 2*Pi
+        if the_value >= TWO_PI:
+            the_value = 0.0
+    return the_value
+
+
+def scaled_to_norm(x: float, y: float, new_norm: float):
+    """(x, y) scaled to length 'new_norm'; raises ZeroDivisionError for the null vector."""
+    multiplier = new_norm / math.hypot(x, y)
+    return x * multiplier, y * multiplier
+
+
+def normalized(x: float, y: float):
+    """(x / length, y / length, length); the null vector stays null."""
+    length = math.hypot(x, y)
+    if length != 0:
+        return x / length, y / length, length
+    return x, y, length
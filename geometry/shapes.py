@@ -27,6 +27,16 @@ def random_between(a_float: float, another_float: float) -> float:
     the_max = max(a_float, another_float)
     return random() * (the_max - the_min) + the_min
 
+def _cached_point(slot_name: str, make_point):
+    """Read-only property computing a Point on first access, and keeping it in 'slot_name'."""
+    def get_point(self):
+        a_point = getattr(self, slot_name)
+        if a_point is None:
+            a_point = make_point(self)
+            setattr(self, slot_name, a_point)
+        return a_point
+    return property(get_point)
+
 class Rect(object):
     """A rectangle identified by two points.
 
@@ -42,13 +52,21 @@ class Rect(object):
 
     set_points  -- reset rectangle coordinates
     contains  -- is a point inside?
+    contains_points  -- which points of an array are inside?
     overlaps  -- does a rectangle overlap?
     top_left  -- get top-left corner
     bottom_right  -- get bottom-right corner
     expanded_by  -- grow (or shrink)
+
+    Only the four bounds and the direction are stored; corners, center and
+    middle points are built on first access and kept until the next set_points.
     TODO: add description of effect of 'direction'
     """
 
+    __slots__ = ['coord_direction', 'left', 'right', 'top', 'bottom',
+                 '_topleft', '_topright', '_bottomright', '_bottomleft', '_center',
+                 '_midbottom', '_midtop', '_midleft', '_midright']
+
     def __init__(self, direction: CoordinatesDirection, pt1: Point, pt2: Point):
         """Initialize a rectangle from two points."""
         self.coord_direction = direction
@@ -61,11 +79,22 @@ class Rect(object):
                             pt2=Point(x=top_left_pt.x + width,
                                       y=top_left_pt.y + height))
 
+    @classmethod
+    def _from_coordinates(cls, direction: CoordinatesDirection, x_pt1, y_pt1, x_pt2, y_pt2):
+        """Same as the constructor, without building the two points."""
+        a_rect = cls.__new__(cls)
+        a_rect.coord_direction = direction
+        a_rect._set_coordinates(x_pt1, y_pt1, x_pt2, y_pt2)
+        return a_rect
 
     def set_points(self, pt1, pt2):
         """Reset the rectangle coordinates."""
         (x_pt1, y_pt1) = pt1.as_tuple()
         (x_pt2, y_pt2) = pt2.as_tuple()
+        self._set_coordinates(x_pt1, y_pt1, x_pt2, y_pt2)
+
+    def _set_coordinates(self, x_pt1, y_pt1, x_pt2, y_pt2):
+        """Only the four bounds are stored; corners & co are computed (and cached) on first use."""
         self.left = min(x_pt1, x_pt2)
         self.right = max(x_pt1, x_pt2)
         if self.coord_direction == CoordinatesDirection.SCREEN_DIRECTION:
@@ -74,17 +103,26 @@ class Rect(object):
         else:
             self.top = max(y_pt1, y_pt2)
             self.bottom = min(y_pt1, y_pt2)
-        self.topleft = Point(self.left, self.top)
-        self.topright = Point(self.right, self.top)
-        self.bottomright = Point(self.right, self.bottom)
-        self.bottomleft = Point(self.left, self.bottom)
-        self.center = average_between(pt1 = self.topleft, pt2 = self.bottomright)
-        self.midbottom = Point(x =(self.topleft.x + self.bottomright.x) / 2, y = self.bottom)
-        self.midtop = Point(x =(self.topleft.x + self.bottomright.x) / 2, y = self.top)
-        self.height = self.bottom - self.top
-        self.width = self.right - self.left
-        self.midleft = Point(x = self.left, y = self.top + self.height/2)
-        self.midright = Point(x = self.right, y = self.top + self.height/2)
+        self._topleft = self._topright = self._bottomright = self._bottomleft = self._center = None
+        self._midbottom = self._midtop = self._midleft = self._midright = None
+
+    @property
+    def height(self):
+        return self.bottom - self.top
+
+    @property
+    def width(self):
+        return self.right - self.left
+
+    topleft = _cached_point('_topleft', lambda r: Point(r.left, r.top))
+    topright = _cached_point('_topright', lambda r: Point(r.right, r.top))
+    bottomright = _cached_point('_bottomright', lambda r: Point(r.right, r.bottom))
+    bottomleft = _cached_point('_bottomleft', lambda r: Point(r.left, r.bottom))
+    center = _cached_point('_center', lambda r: average_between(pt1=r.topleft, pt2=r.bottomright))
+    midbottom = _cached_point('_midbottom', lambda r: Point(x=(r.left + r.right) / 2, y=r.bottom))
+    midtop = _cached_point('_midtop', lambda r: Point(x=(r.left + r.right) / 2, y=r.top))
+    midleft = _cached_point('_midleft', lambda r: Point(x=r.left, y=r.top + r.height / 2))
+    midright = _cached_point('_midright', lambda r: Point(x=r.right, y=r.top + r.height / 2))
 
     def top_left(self) -> Point:
         """Return the top-left corner as a Point."""
@@ -103,7 +141,7 @@ class Rect(object):
         Returns:
 
         """
-        return Rect(direction=self.coord_direction, pt1=self.bottomright, pt2=self.topleft)
+        return Rect._from_coordinates(self.coord_direction, self.right, self.bottom, self.left, self.top)
 
     def get_random_point(self) -> Point:
         """
@@ -133,6 +171,11 @@ class Rect(object):
         )
         return ok_on_x and ok_on_y
 
+    def contains_points(self, points):
+        """Batch version of 'contains': boolean array, one entry per point of a PointArray (or (N, 2) array)."""
+        from geometry.rect_array import contains_mask
+        return contains_mask(self, points)
+
     def overlaps(self, other) -> bool:
         """Return true if a rectangle overlaps this rectangle."""
         return (self.right > other.left and self.left < other.right and
@@ -144,9 +187,9 @@ class Rect(object):
         Create a new rectangle that is wider and taller than the
         immediate one. All sides are extended by "n_units" points.
         """
-        pt1 = Point(self.left - n_units, self.top - n_units)
-        pt2 = Point(self.right + n_units, self.bottom + n_units)
-        return Rect(self.coord_direction, pt1, pt2)
+        return Rect._from_coordinates(self.coord_direction,
+                                      self.left - n_units, self.top - n_units,
+                                      self.right + n_units, self.bottom + n_units)
 
     def __attrs(self):
         """
@@ -0,0 +1,130 @@
+"""Snapping points to a grid, and merging the points that are closer than a tolerance.
+
+grid_cells  -- integer (column, row) of the grid node nearest to each point
+snap_to_grid  -- each point moved to its nearest grid node
+deduplicate  -- one point per grid cell, and which of them each input point became
+
+Points are compared by the grid cell they fall in, not by pairwise distance:
+the cell of a point is its nearest node of a grid of spacing 'epsilon', so
+two points of the same cell are less than epsilon * sqrt(2) apart. Two points
+closer than epsilon but on both sides of a cell border stay distinct; snap
+first (or use a kd-tree) if that matters. Rounding to the nearest node rounds
+halves to even, like Point.integerize.
+
+    >>> unique, inverse = deduplicate(readings, epsilon=1e-3)
+    >>> unique[inverse[i]]  # what reading i became
+"""
+
+import numpy as np
+
+from geometry.point_array import PointArray
+from geometry.xy_array import as_coords
+
+# cells are packed in one int64 key when both coordinates fit in 32 bits
+_CELL_LIMIT = 2 ** 31
+# cell coordinates must fit in an int64
+_MAX_CELL = 2.0 ** 62
+
+
+def _checked_coords(points) -> np.ndarray:
+    coords = np.asarray(as_coords(points), dtype=np.float64).reshape(-1, 2)
+    if not np.isfinite(coords).all():
+        raise ValueError("Can't put non-finite coordinates on a grid")
+    return coords
+
+
+def _checked_spacing(epsilon: float) -> float:
+    if not epsilon > 0:
+        raise ValueError("epsilon must be positive, got %s" % (epsilon))
+    return float(epsilon)
+
+
+def grid_cells(points, epsilon: float, origin=(0.0, 0.0)) -> np.ndarray:
+    """
+    Cells of the points on a grid.
+    :param points: a PointArray or a (N, 2) array.
+    :param epsilon: spacing of the grid.
+    :param origin: a node of the grid (a Point or (x, y) pair).
+    :return: (N, 2) int64 array of (column, row) of the node nearest to each point.
+    """
+    epsilon = _checked_spacing(epsilon)
+    cells = np.rint((_checked_coords(points) - as_coords(origin)) / epsilon)
+    if len(cells) and np.abs(cells).max() >= _MAX_CELL:
+        raise ValueError("epsilon %s is too small for coordinates this far from the origin" % (epsilon))
+    return cells.astype(np.int64)
+
+
+def snap_to_grid(points, epsilon: float, origin=(0.0, 0.0)) -> PointArray:
+    """
+    Points moved to the nearest node of a grid.
+    :param points: a PointArray or a (N, 2) array.
+    :param epsilon: spacing of the grid.
+    :param origin: a node of the grid (a Point or (x, y) pair).
+    """
+    cells = grid_cells(points, epsilon, origin)
+    return PointArray.wrap(cells * _checked_spacing(epsilon) + as_coords(origin))
+
+
+def _cell_keys(cells: np.ndarray):
+    """One int64 per cell, or None when the cells are too far apart to be packed."""
+    if len(cells) == 0:
+        return np.zeros(0, dtype=np.int64)
+    # column by column: min/max along axis 0 of a (N, 2) int array is much slower
+    columns, rows = cells[:, 0], cells[:, 1]
+    low_column, low_row = columns.min(), rows.min()
+    if columns.max() - low_column >= _CELL_LIMIT or rows.max() - low_row >= _CELL_LIMIT:
+        return None
+    return ((columns - low_column) << 32) | (rows - low_row)
+
+
+def _groups(keys: np.ndarray):
+    """
+    Groups of equal keys (one sort, then linear passes).
+    :param keys: (N,) array of int64, or (N, 2) array of int64 compared by rows.
+    :return: (index of the first key of each group, in increasing order,
+        int64 array giving for each key the number of its group in that order).
+    """
+    n = len(keys)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if keys.ndim == 1:
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        starts_group = np.empty(n, dtype=bool)
+        starts_group[0] = True
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=starts_group[1:])
+    else:
+        order = np.lexsort((keys[:, 1], keys[:, 0]))
+        sorted_keys = keys[order]
+        starts_group = np.empty(n, dtype=bool)
+        starts_group[0] = True
+        np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=starts_group[1:])
+    # the sort is not stable: the first key of a group is the smallest index in it
+    first_indices = np.minimum.reduceat(order, np.flatnonzero(starts_group))
+    is_first = np.zeros(n, dtype=bool)
+    is_first[first_indices] = True
+    # groups numbered by first appearance
+    group_numbers = (np.cumsum(is_first) - 1)[first_indices]
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[order] = group_numbers[np.cumsum(starts_group) - 1]
+    return np.flatnonzero(is_first), inverse
+
+
+def deduplicate(points, epsilon: float, origin=(0.0, 0.0), snap: bool = False):
+    """
+    Merges the points falling in the same cell of a grid.
+    :param points: a PointArray or a (N, 2) array.
+    :param epsilon: spacing of the grid (the tolerance).
+    :param origin: a node of the grid (a Point or (x, y) pair).
+    :param snap: if True, the unique points are the grid nodes; else the first point of each cell.
+    :return: (unique points as a PointArray, in order of first appearance,
+        int64 array 'inverse' such that point i became unique point inverse[i]).
+    """
+    cells = grid_cells(points, epsilon, origin)
+    keys = _cell_keys(cells)
+    first_indices, inverse = _groups(cells if keys is None else keys)
+    if snap:
+        unique = cells[first_indices] * _checked_spacing(epsilon) + as_coords(origin)
+    else:
+        unique = _checked_coords(points)[first_indices]
+    return PointArray.wrap(np.ascontiguousarray(unique, dtype=np.float64)), inverse
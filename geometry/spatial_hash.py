@@ -0,0 +1,285 @@
+"""Uniform-grid spatial hash for moving points.
+
+SpatialHashGrid  -- buckets integer ids by the grid cell their position falls in
+
+Meant for entities that move every frame: inserting, removing and moving an
+id are O(1) and only touch the buckets when the id changes cell. A whole
+position array (e.g. after an integration step) can be re-bucketed in one
+call: the cells are computed in one NumPy pass and only the ids that changed
+cell go through Python. All the pairs of ids closer than a distance (e.g. for
+a collision pass over every entity) are found in one vectorized call.
+
+Ids are non-negative integers, typically the row of the entity in a position
+array. Cell coordinates (position / cell_size) must fit in 32 bits.
+"""
+
+import math
+
+import numpy as np
+
+from geometry.point import Point
+from geometry.xy_array import as_coords
+
+_LOW_32_BITS = 0xFFFFFFFF
+# cell coordinates are in [-_CELL_LIMIT, _CELL_LIMIT)
+_CELL_LIMIT = 2 ** 31
+
+
+def _cell_key(cx: int, cy: int) -> int:
+    """Both cell coordinates in a single int (same as _cell_keys)."""
+    return (cx << 32) | (cy & _LOW_32_BITS)
+
+
+def _cell_keys(cxs: np.ndarray, cys: np.ndarray) -> np.ndarray:
+    """Vectorized _cell_key, over int64 arrays."""
+    return (cxs << 32) | (cys & _LOW_32_BITS)
+
+
+def _key_cells(keys: np.ndarray):
+    """(cxs, cys) of int64 keys; inverse of _cell_keys."""
+    return keys >> 32, (keys << 32) >> 32
+
+
+def _checked_id(an_id) -> int:
+    if isinstance(an_id, (bool, np.bool_)) or not isinstance(an_id, (int, np.integer)):
+        raise ValueError("ids must be integers, got %r" % (an_id,))
+    if an_id < 0:
+        raise ValueError("ids must be non-negative, got %d" % (an_id))
+    return int(an_id)
+
+
+class SpatialHashGrid(object):
+    """Points bucketed in square cells of a fixed size.
+
+    insert, remove, move  -- maintain a single id
+    rebucket  -- maintain ids 0..N-1 from a (N, 2) position array
+    query_radius  -- ids within a distance of a point
+    query_rect  -- ids inside a Rect
+    neighbours  -- ids within a distance of another id
+    neighbour_pairs  -- all the pairs of ids within a distance of each other
+    """
+
+    def __init__(self, cell_size: float, capacity: int = 1024):
+        """
+        Initializes an empty grid.
+        :param cell_size: side of the cells; around the typical query radius works best.
+        :param capacity: initial number of ids with storage (grows as needed).
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive, got %s" % (cell_size))
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self._cells = {}
+        self._positions = np.zeros((capacity, 2))
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._present = np.zeros(capacity, dtype=bool)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, an_id):
+        return 0 <= an_id < len(self._present) and bool(self._present[an_id])
+
+    def _ensure_capacity(self, size: int):
+        capacity = len(self._present)
+        if size <= capacity:
+            return
+        new_capacity = max(size, 2 * capacity)
+        self._positions = np.concatenate((self._positions, np.zeros((new_capacity - capacity, 2))))
+        self._keys = np.concatenate((self._keys, np.zeros(new_capacity - capacity, dtype=np.int64)))
+        self._present = np.concatenate((self._present, np.zeros(new_capacity - capacity, dtype=bool)))
+
+    def _cell_coords(self, x: float, y: float):
+        cx, cy = x * self._inv_cell_size, y * self._inv_cell_size
+        # also false for NaN
+        if not (-_CELL_LIMIT <= cx < _CELL_LIMIT and -_CELL_LIMIT <= cy < _CELL_LIMIT):
+            raise ValueError("(%s, %s) is too far from the origin for cell_size %s" % (x, y, self.cell_size))
+        return math.floor(cx), math.floor(cy)
+
+    def _clamped_cell_coords(self, x: float, y: float):
+        """Cell coordinates of a query bound, brought back into the range of the cells."""
+        cx = min(max(x * self._inv_cell_size, -_CELL_LIMIT), _CELL_LIMIT - 1)
+        cy = min(max(y * self._inv_cell_size, -_CELL_LIMIT), _CELL_LIMIT - 1)
+        return math.floor(cx), math.floor(cy)
+
+    def _add_to_bucket(self, an_id: int, key: int):
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = {an_id}
+        else:
+            bucket.add(an_id)
+
+    def _remove_from_bucket(self, an_id: int, key: int):
+        bucket = self._cells[key]
+        bucket.discard(an_id)
+        if not bucket:
+            del self._cells[key]
+
+    def insert(self, an_id: int, a_point):
+        """Adds an id (a non-negative integer) at a position (a Point or (x, y) pair); an id already there is moved."""
+        an_id = _checked_id(an_id)
+        if an_id in self:
+            self.move(an_id, a_point)
+            return
+        x, y = a_point
+        self._ensure_capacity(an_id + 1)
+        key = _cell_key(*self._cell_coords(x, y))
+        self._positions[an_id] = (x, y)
+        self._keys[an_id] = key
+        self._present[an_id] = True
+        self._add_to_bucket(an_id, key)
+        self._count += 1
+
+    def remove(self, an_id: int):
+        """Takes an id out of the grid."""
+        if an_id not in self:
+            raise KeyError(an_id)
+        self._remove_from_bucket(an_id, int(self._keys[an_id]))
+        self._present[an_id] = False
+        self._count -= 1
+
+    def move(self, an_id: int, a_point):
+        """Changes the position of an id; buckets are only touched when it changes cell."""
+        if an_id not in self:
+            raise KeyError(an_id)
+        x, y = a_point
+        key = _cell_key(*self._cell_coords(x, y))
+        old_key = int(self._keys[an_id])
+        if key != old_key:
+            self._remove_from_bucket(an_id, old_key)
+            self._add_to_bucket(an_id, key)
+            self._keys[an_id] = key
+        self._positions[an_id] = (x, y)
+
+    def position(self, an_id: int) -> Point:
+        if an_id not in self:
+            raise KeyError(an_id)
+        x, y = self._positions[an_id].tolist()
+        return Point(x, y)
+
+    def rebucket(self, positions):
+        """
+        Sets the positions of ids 0..N-1 (inserting the ones not there yet).
+        :param positions: a PointArray or a (N, 2) array.
+        """
+        coords = np.asarray(as_coords(positions), dtype=np.float64).reshape(-1, 2)
+        n_ids = len(coords)
+        self._ensure_capacity(n_ids)
+        cells = np.floor(coords * self._inv_cell_size)
+        # also false for NaN
+        if not ((cells >= -_CELL_LIMIT) & (cells < _CELL_LIMIT)).all():
+            raise ValueError("Positions too far from the origin (or not finite) for cell_size %s" % (self.cell_size))
+        cells = cells.astype(np.int64)
+        keys = _cell_keys(cells[:, 0], cells[:, 1])
+        present = self._present[:n_ids]
+        old_keys = self._keys[:n_ids]
+        changed = np.flatnonzero(~present | (keys != old_keys))
+        for an_id, key, old_key, was_present in zip(changed.tolist(), keys[changed].tolist(),
+                                                    old_keys[changed].tolist(), present[changed].tolist()):
+            if was_present:
+                self._remove_from_bucket(an_id, old_key)
+            else:
+                self._count += 1
+            self._add_to_bucket(an_id, key)
+        self._positions[:n_ids] = coords
+        self._keys[:n_ids] = keys
+        self._present[:n_ids] = True
+
+    def _candidates_in_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        """Ids in all the cells touched by a box (superset of the ids in the box)."""
+        min_cx, min_cy = self._clamped_cell_coords(min_x, min_y)
+        max_cx, max_cy = self._clamped_cell_coords(max_x, max_y)
+        cells = self._cells
+        candidates = []
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(cells):
+            # box larger than the populated area: walk the populated cells instead
+            keys = list(cells)
+            cxs, cys = _key_cells(np.array(keys, dtype=np.int64))
+            inside = (cxs >= min_cx) & (cxs <= max_cx) & (cys >= min_cy) & (cys <= max_cy)
+            for position in np.flatnonzero(inside).tolist():
+                candidates.extend(cells[keys[position]])
+        else:
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    bucket = cells.get(_cell_key(cx, cy))
+                    if bucket:
+                        candidates.extend(bucket)
+        return np.array(candidates, dtype=np.intp)
+
+    def query_radius(self, a_point, radius: float, exact: bool = True) -> np.ndarray:
+        """
+        Ids within a distance of a point (boundary included).
+        :param exact: if False, return all the candidates of the touched cells without checking distances.
+        """
+        x, y = a_point
+        candidates = self._candidates_in_box(x - radius, y - radius, x + radius, y + radius)
+        if not exact or len(candidates) == 0:
+            return candidates
+        diff = self._positions[candidates] - (x, y)
+        return candidates[np.einsum('ij,ij->i', diff, diff) <= radius * radius]
+
+    def query_rect(self, a_rect, exact: bool = True) -> np.ndarray:
+        """
+        Ids inside a Rect (boundary included), whatever its coordinates direction.
+        :param exact: if False, return all the candidates of the touched cells without checking bounds.
+        """
+        min_y, max_y = min(a_rect.top, a_rect.bottom), max(a_rect.top, a_rect.bottom)
+        candidates = self._candidates_in_box(a_rect.left, min_y, a_rect.right, max_y)
+        if not exact or len(candidates) == 0:
+            return candidates
+        xs, ys = self._positions[candidates].T
+        return candidates[(xs >= a_rect.left) & (xs <= a_rect.right) & (ys >= min_y) & (ys <= max_y)]
+
+    def neighbours(self, an_id: int, radius: float) -> np.ndarray:
+        """Ids (other than 'an_id') within a distance of 'an_id'."""
+        if an_id not in self:
+            raise KeyError(an_id)
+        found = self.query_radius(self._positions[an_id].tolist(), radius)
+        return found[found != an_id]
+
+    def neighbour_pairs(self, radius: float, exact: bool = True):
+        """
+        All the pairs of ids within a distance of each other (boundary included), in one pass.
+        Each pair comes once, with the smaller id first, in no particular order.
+        :param exact: if False, return all the pairs of ids in neighbouring cells without checking distances.
+        :return: (ids, other_ids) arrays: ids[k] and other_ids[k] are within 'radius' of each other.
+        """
+        ids = np.flatnonzero(self._present)
+        # ids sorted by cell, so that the ids of a cell are contiguous
+        keys = self._keys[ids]
+        order = np.argsort(keys, kind='stable')
+        ids, keys = ids[order], keys[order]
+        cxs, cys = _key_cells(keys)
+        positions = np.arange(len(ids))
+        reach = int(math.ceil(radius * self._inv_cell_size))
+        firsts, seconds = [], []
+        # half of the neighbouring cells, so that each pair of cells is seen once
+        for dx in range(0, reach + 1):
+            for dy in range(-reach if dx else 0, reach + 1):
+                other_cxs, other_cys = cxs + dx, cys + dy
+                valid = (other_cxs < _CELL_LIMIT) & (other_cys >= -_CELL_LIMIT) & (other_cys < _CELL_LIMIT)
+                other_keys = _cell_keys(other_cxs, other_cys)
+                ends = np.searchsorted(keys, other_keys, side='right')
+                if dx == 0 and dy == 0:
+                    # same cell: each id with the ones after it
+                    starts = positions + 1
+                else:
+                    starts = np.searchsorted(keys, other_keys, side='left')
+                counts = np.where(valid, ends - starts, 0)
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                sources = np.repeat(positions, counts)
+                targets = np.arange(total) - np.repeat(np.cumsum(counts) - counts - starts, counts)
+                firsts.append(sources)
+                seconds.append(targets)
+        if not firsts:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        sources, targets = np.concatenate(firsts), np.concatenate(seconds)
+        if exact:
+            diff = self._positions[ids[sources]] - self._positions[ids[targets]]
+            close = np.einsum('ij,ij->i', diff, diff) <= radius * radius
+            sources, targets = sources[close], targets[close]
+        firsts, seconds = ids[sources], ids[targets]
+        return np.minimum(firsts, seconds), np.maximum(firsts, seconds)
@@ -0,0 +1,258 @@
+"""Processing of point streams too big for memory, a chunk at a time.
+
+csv_chunks, binary_chunks, iterable_chunks  -- read a source as PointArrays of (at most) 'chunk_size' points
+csv_points  -- read a CSV file one Point at a time (Point.from_tuple)
+rechunk  -- regroup chunks (for example after filtering) to a fixed size
+Pipeline  -- a sequence of stages, run over chunks or over single points
+Mapping, ClipToRect, Dedup, Downsample  -- pipeline stages
+
+Every stage works on a whole chunk with NumPy (Stage.process), and on a single
+Point (Stage.process_point). Both give the same points, whatever the size of
+the chunks: running a pipeline point by point (Pipeline.run_points) is the
+slow but easy-to-debug version of running it chunk by chunk (Pipeline.run).
+
+    >>> a_pipeline = Pipeline([Mapping(a_transform), ClipToRect(a_rect), Dedup(), Downsample(10)])
+    >>> for a_chunk in a_pipeline.run(csv_chunks("positions.csv", skip_rows=1)):
+    ...     process(a_chunk)
+"""
+
+import abc
+import itertools
+
+import numpy as np
+
+from geometry import binary_io
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.rect_array import contains_mask
+from geometry.shapes import Rect
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _data_lines(a_file, skip_rows: int):
+    """The lines of a text file holding values: after 'skip_rows', without comments ('#' to the end of the line) nor blanks."""
+    for a_line in itertools.islice(a_file, skip_rows, None):
+        if "#" in a_line:
+            a_line = a_line[:a_line.index("#")]
+        a_line = a_line.strip()
+        if a_line:
+            yield a_line
+
+
+def csv_chunks(path, chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: str = ",", columns=(0, 1),
+               skip_rows: int = 0):
+    """
+    Reads points from a text file, 'chunk_size' points at a time.
+    :param path: the file.
+    :param delimiter: between the values of a row.
+    :param columns: positions (in a row) of x and y.
+    :param skip_rows: number of rows (headers) to ignore at the start of the file.
+    Empty lines and comments (from '#' to the end of the line) are ignored.
+    """
+    with open(path) as a_file:
+        lines = _data_lines(a_file, skip_rows)
+        while True:
+            some_lines = list(itertools.islice(lines, chunk_size))
+            if not some_lines:
+                return
+            yield PointArray(np.loadtxt(some_lines, dtype=np.float64, delimiter=delimiter, usecols=columns,
+                                        ndmin=2, comments=None))
+
+
+def csv_points(path, delimiter: str = ",", columns=(0, 1), skip_rows: int = 0):
+    """Same as csv_chunks, one Point at a time."""
+    x_column, y_column = columns
+    with open(path) as a_file:
+        for a_line in _data_lines(a_file, skip_rows):
+            values = a_line.split(delimiter)
+            yield Point.from_tuple((float(values[x_column]), float(values[y_column])))
+
+
+def binary_chunks(path, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Reads points from a file of binary_io, 'chunk_size' at a time (only the current chunk is in memory)."""
+    a_dataset = binary_io.open_dataset(path)
+    if a_dataset.kind != binary_io.KIND_POINTS:
+        raise ValueError("%s does not contain points" % (path))
+    for start in range(0, len(a_dataset), chunk_size):
+        yield a_dataset[start:start + chunk_size]
+
+
+def iterable_chunks(points, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Groups an iterable of Point (or of (x, y) tuples) in PointArrays of 'chunk_size' points."""
+    points = iter(points)
+    while True:
+        some_points = list(itertools.islice(points, chunk_size))
+        if not some_points:
+            return
+        if hasattr(some_points[0], 'x'):
+            yield PointArray.from_points(some_points)
+        else:
+            yield PointArray.from_tuples(some_points)
+
+
+def rechunk(chunks, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Same points as 'chunks', in PointArrays of exactly 'chunk_size' points (except the last one)."""
+    pending, n_pending = [], 0
+    for a_chunk in chunks:
+        pending.append(a_chunk.coords)
+        n_pending += len(a_chunk)
+        if n_pending < chunk_size:
+            continue
+        coords = np.concatenate(pending)
+        n_full = (n_pending // chunk_size) * chunk_size
+        for start in range(0, n_full, chunk_size):
+            yield PointArray.wrap(coords[start:start + chunk_size])
+        pending, n_pending = [coords[n_full:]], n_pending - n_full
+    if n_pending > 0:
+        yield PointArray.wrap(np.concatenate(pending))
+
+
+class Stage(metaclass=abc.ABCMeta):
+    """A step of a Pipeline.
+
+    process  -- the points of a chunk that go on to the next stage (maybe changed)
+    process_point  -- same, for one point (None if it is dropped)
+    reset  -- forget what was seen so far (before a new stream)
+    """
+
+    @abc.abstractmethod
+    def process(self, a_chunk: PointArray) -> PointArray:
+        pass
+
+    @abc.abstractmethod
+    def process_point(self, a_point: Point):
+        pass
+
+    def reset(self):
+        pass
+
+
+class Mapping(Stage):
+    """Moves all points with a transformation (a Transform2D, or anything with 'apply_to_coords' and 'apply')."""
+
+    def __init__(self, a_transform):
+        self.transform = a_transform
+
+    def process(self, a_chunk: PointArray) -> PointArray:
+        return PointArray.wrap(self.transform.apply_to_coords(a_chunk.coords))
+
+    def process_point(self, a_point: Point):
+        return self.transform.apply(a_point)
+
+
+class ClipToRect(Stage):
+    """Keeps the points inside a Rect (borders included)."""
+
+    def __init__(self, a_rect: Rect):
+        self.rect = a_rect
+
+    def process(self, a_chunk: PointArray) -> PointArray:
+        return a_chunk[contains_mask(self.rect, a_chunk)]
+
+    def process_point(self, a_point: Point):
+        return a_point if self.rect.contains(a_point) else None
+
+
+class Dedup(Stage):
+    """
+    Drops repeated points.
+    :param consecutive_only: only drop a point equal to the one just before it (constant memory);
+        otherwise drop any point already seen in the stream (keeps every distinct point in memory).
+    """
+
+    def __init__(self, consecutive_only: bool = False):
+        self.consecutive_only = consecutive_only
+        self.reset()
+
+    def reset(self):
+        self._last = None
+        self._seen = set()
+
+    def process(self, a_chunk: PointArray) -> PointArray:
+        if len(a_chunk) == 0:
+            return a_chunk
+        # one complex number per point: cheap to compare, sort and hash
+        keys = np.ascontiguousarray(a_chunk.coords).view(np.complex128).ravel()
+        if self.consecutive_only:
+            keep = np.empty(len(keys), dtype=bool)
+            keep[0] = self._last is None or keys[0] != self._last
+            np.not_equal(keys[1:], keys[:-1], out=keep[1:])
+            self._last = keys[-1]
+            return a_chunk[keep]
+        _, first_indices = np.unique(keys, return_index=True)
+        first_indices.sort()
+        seen = self._seen
+        new_keys = keys[first_indices].tolist()
+        unseen = np.fromiter((a_key not in seen for a_key in new_keys), dtype=bool, count=len(new_keys))
+        seen.update(new_keys)
+        return a_chunk[first_indices[unseen]]
+
+    def process_point(self, a_point: Point):
+        a_key = complex(a_point.x, a_point.y)
+        if self.consecutive_only:
+            is_repeated = a_key == self._last
+            self._last = a_key
+        else:
+            is_repeated = a_key in self._seen
+            self._seen.add(a_key)
+        return None if is_repeated else a_point
+
+
+class Downsample(Stage):
+    """Keeps one point every 'every' (the first one, then the 'every'-th after it, ...)."""
+
+    def __init__(self, every: int):
+        if every < 1:
+            raise ValueError("Can only keep one point every 1 or more, not %d" % (every))
+        self.every = every
+        self.reset()
+
+    def reset(self):
+        # position in the stream of the next point to come
+        self._position = 0
+
+    def process(self, a_chunk: PointArray) -> PointArray:
+        first_kept = (-self._position) % self.every
+        self._position += len(a_chunk)
+        return a_chunk[first_kept::self.every]
+
+    def process_point(self, a_point: Point):
+        is_kept = self._position % self.every == 0
+        self._position += 1
+        return a_point if is_kept else None
+
+
+class Pipeline(object):
+    """Stages applied one after the other.
+
+    run  -- process a stream of chunks
+    run_points  -- process a stream of points, one at a time
+    """
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+
+    def run(self, chunks):
+        """Processed chunks (empty ones are skipped); chunks keep the size they had, minus the dropped points."""
+        for a_stage in self.stages:
+            a_stage.reset()
+        for a_chunk in chunks:
+            for a_stage in self.stages:
+                a_chunk = a_stage.process(a_chunk)
+                if len(a_chunk) == 0:
+                    break
+            else:
+                yield a_chunk
+
+    def run_points(self, points):
+        """Processed points, one at a time."""
+        for a_stage in self.stages:
+            a_stage.reset()
+        for a_point in points:
+            for a_stage in self.stages:
+                a_point = a_stage.process_point(a_point)
+                if a_point is None:
+                    break
+            else:
+                yield a_point
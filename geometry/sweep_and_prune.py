@@ -0,0 +1,187 @@
+"""Incremental sweep-and-prune broad phase for axis-aligned rectangles.
+
+SweepAndPrune  -- keeps the set of overlapping rectangle pairs up to date as they move
+
+The interval endpoints of every rectangle are kept sorted on x and on y across
+frames. When rectangles move a little, re-sorting is an insertion sort that
+does almost no work; every swap of a start endpoint with an end endpoint is
+the only moment a pair can start or stop overlapping, so only those pairs get
+checked. Each 'update' reports the pairs that started and stopped overlapping
+since the previous one.
+
+Overlap follows Rect.overlaps: rectangles that only touch do not overlap.
+Rectangles of both coordinates directions are accepted.
+"""
+
+import numpy as np
+
+
+class SweepAndPrune(object):
+    """Broad-phase collision detection over moving rectangles.
+
+    add  -- start tracking a Rect, returns its handle
+    remove  -- stop tracking a handle
+    move  -- change the Rect of a handle
+    set_bounds  -- change all rectangles at once from bound arrays
+    update  -- re-sort, returns (added, removed) pairs since last update
+    pairs  -- currently overlapping pairs of handles, as (small, big) tuples
+    """
+
+    def __init__(self, rects=()):
+        """Starts tracking some rectangles (handles are their positions in 'rects')."""
+        # per axis (0: x, 1: y), lower and upper bound of each handle:
+        self._mins = ([], [])
+        self._maxs = ([], [])
+        self._alive = []
+        # per axis, sorted endpoints; an endpoint is 2 * handle + (1 if lower bound else 0)
+        self._endpoints = ([], [])
+        self.pairs = set()
+        self._partners = {}
+        # state (overlapping or not) at the last update, of the pairs that changed since
+        self._changed = {}
+        for a_rect in rects:
+            self._append(*_bounds_of(a_rect))
+        self._rebuild()
+
+    @classmethod
+    def from_bounds(cls, lefts, rights, tops, bottoms):
+        """Builds the engine from compact arrays of bounds (one entry per rectangle)."""
+        engine = cls()
+        lefts, rights, tops, bottoms = (np.asarray(a, dtype=np.float64) for a in (lefts, rights, tops, bottoms))
+        engine._mins = (np.minimum(lefts, rights).tolist(), np.minimum(tops, bottoms).tolist())
+        engine._maxs = (np.maximum(lefts, rights).tolist(), np.maximum(tops, bottoms).tolist())
+        engine._alive = [True] * len(lefts)
+        engine._endpoints = (list(range(2 * len(lefts))), list(range(2 * len(lefts))))
+        engine._rebuild()
+        return engine
+
+    def __len__(self):
+        return sum(self._alive)
+
+    def _append(self, min_x: float, max_x: float, min_y: float, max_y: float) -> int:
+        handle = len(self._alive)
+        for axis, (a_min, a_max) in enumerate(((min_x, max_x), (min_y, max_y))):
+            self._mins[axis].append(a_min)
+            self._maxs[axis].append(a_max)
+            self._endpoints[axis].extend((2 * handle + 1, 2 * handle))
+        self._alive.append(True)
+        return handle
+
+    def _sort_key(self, axis: int):
+        mins, maxs = self._mins[axis], self._maxs[axis]
+        # on ties, upper bounds go first: touching intervals do not overlap
+        return lambda endpoint: (mins[endpoint >> 1], 1) if endpoint & 1 else (maxs[endpoint >> 1], 0)
+
+    def _rebuild(self):
+        """Sorts from scratch and recomputes all pairs with one sweep on x."""
+        for axis in (0, 1):
+            self._endpoints[axis].sort(key=self._sort_key(axis))
+        self.pairs = set()
+        self._partners = {}
+        self._changed = {}
+        active = set()
+        for endpoint in self._endpoints[0]:
+            handle = endpoint >> 1
+            if endpoint & 1:
+                for other in active:
+                    if self._overlap(handle, other):
+                        self._set_pair(handle, other, True)
+                active.add(handle)
+            else:
+                active.discard(handle)
+        self._changed = {}
+
+    def _overlap(self, a_handle: int, another_handle: int) -> bool:
+        (min_x, min_y), (max_x, max_y) = self._mins, self._maxs
+        return (min_x[a_handle] < max_x[another_handle] and min_x[another_handle] < max_x[a_handle] and
+                min_y[a_handle] < max_y[another_handle] and min_y[another_handle] < max_y[a_handle])
+
+    def _set_pair(self, a_handle: int, another_handle: int, overlapping: bool):
+        pair = (a_handle, another_handle) if a_handle < another_handle else (another_handle, a_handle)
+        if (pair in self.pairs) == overlapping:
+            return
+        if pair not in self._changed:
+            self._changed[pair] = not overlapping
+        if overlapping:
+            self.pairs.add(pair)
+            self._partners.setdefault(a_handle, set()).add(another_handle)
+            self._partners.setdefault(another_handle, set()).add(a_handle)
+        else:
+            self.pairs.discard(pair)
+            self._partners[a_handle].discard(another_handle)
+            self._partners[another_handle].discard(a_handle)
+
+    def add(self, a_rect) -> int:
+        """Starts tracking a rectangle; its overlaps are reported on the next update."""
+        # its endpoints start at the end of the lists, as if it were far away
+        return self._append(*_bounds_of(a_rect))
+
+    def remove(self, handle: int):
+        """Stops tracking a handle; its overlaps are reported as removed on the next update."""
+        if not self._alive[handle]:
+            raise KeyError(handle)
+        for other in list(self._partners.get(handle, ())):
+            self._set_pair(handle, other, False)
+        self._partners.pop(handle, None)
+        self._alive[handle] = False
+        for axis in (0, 1):
+            self._endpoints[axis][:] = [e for e in self._endpoints[axis] if e >> 1 != handle]
+
+    def move(self, handle: int, a_rect):
+        """Changes the rectangle of a handle; takes effect on the next update."""
+        if not self._alive[handle]:
+            raise KeyError(handle)
+        min_x, max_x, min_y, max_y = _bounds_of(a_rect)
+        self._mins[0][handle], self._maxs[0][handle] = min_x, max_x
+        self._mins[1][handle], self._maxs[1][handle] = min_y, max_y
+
+    def set_bounds(self, lefts, rights, tops, bottoms):
+        """Changes the rectangles of handles 0..N-1 from arrays of bounds; takes effect on the next update."""
+        lefts, rights, tops, bottoms = (np.asarray(a, dtype=np.float64) for a in (lefts, rights, tops, bottoms))
+        n_handles = len(lefts)
+        if n_handles > len(self._alive):
+            raise ValueError("%d bounds for %d handles" % (n_handles, len(self._alive)))
+        self._mins[0][:n_handles] = np.minimum(lefts, rights).tolist()
+        self._maxs[0][:n_handles] = np.maximum(lefts, rights).tolist()
+        self._mins[1][:n_handles] = np.minimum(tops, bottoms).tolist()
+        self._maxs[1][:n_handles] = np.maximum(tops, bottoms).tolist()
+
+    def _insertion_sort(self, axis: int):
+        endpoints = self._endpoints[axis]
+        mins, maxs = self._mins[axis], self._maxs[axis]
+        values = [mins[e >> 1] if e & 1 else maxs[e >> 1] for e in endpoints]
+        set_pair, overlap = self._set_pair, self._overlap
+        for i in range(1, len(endpoints)):
+            endpoint, value = endpoints[i], values[i]
+            is_lower = endpoint & 1
+            j = i - 1
+            while j >= 0 and (values[j] > value or (values[j] == value and (endpoints[j] & 1) > is_lower)):
+                other = endpoints[j]
+                if (other & 1) != is_lower and (other >> 1) != (endpoint >> 1):
+                    # a lower bound crossed an upper bound: the pair might have changed
+                    set_pair(endpoint >> 1, other >> 1, overlap(endpoint >> 1, other >> 1))
+                endpoints[j + 1], values[j + 1] = other, values[j]
+                j -= 1
+            endpoints[j + 1], values[j + 1] = endpoint, value
+
+    def update(self):
+        """
+        Brings the overlapping pairs up to date with the moves since the last update.
+        :return: (added, removed): sets of pairs that started / stopped overlapping.
+        """
+        self._insertion_sort(0)
+        self._insertion_sort(1)
+        added, removed = set(), set()
+        for pair, was_overlapping in self._changed.items():
+            is_overlapping = pair in self.pairs
+            if is_overlapping and not was_overlapping:
+                added.add(pair)
+            elif was_overlapping and not is_overlapping:
+                removed.add(pair)
+        self._changed = {}
+        return added, removed
+
+
+def _bounds_of(a_rect):
+    """(min_x, max_x, min_y, max_y) of a Rect, whatever its coordinates direction."""
+    return a_rect.left, a_rect.right, min(a_rect.top, a_rect.bottom), max(a_rect.top, a_rect.bottom)
@@ -1,6 +1,8 @@
+import math
 import unittest
 
-from geometry.angle import AngleInRadians, AngleInDegrees
+from geometry.angle import AngleInRadians, AngleInDegrees, TrigLookupTable, TRIG_STATS, \
+    enable_trig_lookup_table, disable_trig_lookup_table
 
 class UnitTestAngle(unittest.TestCase):
     def setUp(self):
@@ -14,3 +16,42 @@ class UnitTestAngle(unittest.TestCase):
         a_rads = AngleInRadians(value = AngleInRadians.THREE_HALFS_OF_PI)
         a_degrees = AngleInDegrees.from_radians(angle_in_radians=a_rads)
         self.assertAlmostEqual(a_degrees.value, 270)
+
+    def test_cached_trigonometry(self):
+        """cos/sin are computed once, and recomputed when the angle changes."""
+        TRIG_STATS.enable()
+        try:
+            an_angle = AngleInRadians(value=1.0)
+            self.assertEqual(an_angle.cos_sin(), (math.cos(1.0), math.sin(1.0)))
+            self.assertEqual(an_angle.cos_sin(), (math.cos(1.0), math.sin(1.0)))
+            self.assertEqual((TRIG_STATS.cache_misses, TRIG_STATS.cache_hits), (1, 1))
+        finally:
+            TRIG_STATS.disable()
+        an_angle.cos_sin()
+        self.assertEqual(TRIG_STATS.cache_hits, 1)
+        an_angle += 0.5
+        self.assertEqual(an_angle.cos_sin(), (math.cos(1.5), math.sin(1.5)))
+        an_angle -= 1.0
+        self.assertAlmostEqual(an_angle.sin(), math.sin(0.5))
+        an_angle.randomly_mutate()
+        self.assertAlmostEqual(an_angle.cos(), math.cos(an_angle.value))
+        an_angle.value = 2.0
+        self.assertEqual(an_angle.cos_sin(), (math.cos(2.0), math.sin(2.0)))
+
+    def test_lookup_table(self):
+        """Approximations stay within the advertised error."""
+        a_table = enable_trig_lookup_table(resolution=360)
+        TRIG_STATS.enable()
+        try:
+            for _ in range(100):
+                an_angle = AngleInRadians.random()
+                self.assertLessEqual(abs(an_angle.cos() - math.cos(an_angle.value)), a_table.max_error)
+                self.assertLessEqual(abs(an_angle.sin() - math.sin(an_angle.value)), a_table.max_error)
+                self.assertEqual(an_angle.cos_sin(), (an_angle.cos(), an_angle.sin()))
+            self.assertGreater(TRIG_STATS.table_lookups, 0)
+        finally:
+            TRIG_STATS.disable()
+            disable_trig_lookup_table()
+        self.assertEqual(AngleInRadians(value=1.0).cos(), math.cos(1.0))
+        self.assertEqual(AngleInRadians(value=1.0).cos_sin(), (math.cos(1.0), math.sin(1.0)))
+        self.assertLessEqual(TrigLookupTable.for_max_error(1e-3).max_error, 1e-3)
@@ -0,0 +1,50 @@
+import math
+import unittest
+
+from random import random
+from geometry.angle import AngleInRadians, AngleInDegrees
+from geometry.angle_array import AngleArray, normalize_radians
+
+
+class UnitTestAngleArray(unittest.TestCase):
+    def setUp(self):
+        self.raw_values = [(random() - 0.5) * 20 * math.pi for _ in range(50)]
+        self.angles = AngleArray(self.raw_values)
+
+    def test_normalization(self):
+        """Same as AngleInRadians.normalize, but never 2*Pi."""
+        for a_value, normalized in zip(self.raw_values, self.angles.values):
+            self.assertAlmostEqual(normalized, AngleInRadians(a_value).value)
+            self.assertTrue(0 <= normalized < 2 * math.pi)
+        self.assertEqual(normalize_radians([-1e-18, 2 * math.pi]).tolist(), [0.0, 0.0])
+
+    def test_arithmetic_wraps(self):
+        a_sum = self.angles + AngleInRadians(3.0)
+        a_difference = self.angles - 3.0
+        for i, an_angle in enumerate(self.angles):
+            self.assertTrue(a_sum[i:i + 1].isclose(AngleInRadians(an_angle.value + 3.0))[0])
+            self.assertTrue(a_difference[i:i + 1].isclose(an_angle - 3.0)[0])
+
+    def test_tolerant_comparisons(self):
+        around_zero = AngleArray([2 * math.pi - 1e-5, 1e-5, 0.5])
+        self.assertEqual(around_zero.isclose(0.0).tolist(), [True, True, False])
+        self.assertEqual(around_zero.less_than(0.25).tolist(), [False, True, False])
+        self.assertEqual(around_zero.greater_than(AngleInRadians(0.25)).tolist(), [True, False, True])
+        self.assertTrue(self.angles.isclose(self.angles + 1e-4).all())
+
+    def test_sort(self):
+        sorted_angles = self.angles.sort()
+        self.assertEqual(sorted_angles.values.tolist(), sorted(self.angles.values.tolist()))
+        self.assertEqual(self.angles[self.angles.argsort()].values.tolist(), sorted_angles.values.tolist())
+
+    def test_degrees(self):
+        degrees = AngleArray.from_degrees([AngleInDegrees(90), AngleInDegrees(270)])
+        self.assertEqual(degrees[0], AngleInRadians(AngleInRadians.PI_HALF))
+        self.assertEqual(degrees[1], AngleInRadians(AngleInRadians.THREE_HALFS_OF_PI))
+        for an_angle, in_degrees in zip(self.angles, self.angles.to_degree_angles()):
+            self.assertAlmostEqual(AngleInDegrees.from_radians(an_angle).value, in_degrees.value)
+        self.assertEqual(AngleArray.from_angles([AngleInDegrees(180)])[0], AngleInRadians(math.pi))
+
+
+if __name__ == '__main__':
+    unittest.main()
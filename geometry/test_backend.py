@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from random import random
+from geometry import backend
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+
+SCALAR_MODULES = "geometry.point, geometry.vector, geometry.angle, geometry.shapes, geometry.backend"
+# where 'import geometry' works
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_in_fresh_interpreter(code: str) -> bytes:
+    """Output of 'code' run by a new Python process."""
+    return subprocess.check_output([sys.executable, "-c", code], cwd=REPOSITORY_ROOT).strip()
+
+
+def time_imports_in_fresh_interpreter(modules: str) -> float:
+    """Seconds taken by 'import <modules>' in a new Python process."""
+    code = "import time; t = time.perf_counter(); import %s; print(time.perf_counter() - t)" % (modules)
+    return float(run_in_fresh_interpreter(code))
+
+
+class UnitTestBackend(unittest.TestCase):
+    def setUp(self):
+        """Fixtures, and the automatic choice of backend."""
+        backend.set_backend(None)
+        self.points = [Point((random() - 0.5) * 10, (random() - 0.5) * 10) for _ in range(100)]
+        self.a_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(-2, -3), pt2=Point(4, 1))
+
+    def tearDown(self):
+        backend.set_backend(None)
+
+    def test_backends_agree(self):
+        python_backend, numpy_backend = backend.PythonBackend(), backend.NumpyBackend()
+        as_vectors = [Vec2d(p.x, p.y) for p in self.points]
+        as_tuples = [(p.x, p.y) for p in self.points]
+        for items in (self.points, as_vectors, as_tuples, PointArray.from_points(self.points)):
+            for a_backend in (python_backend, numpy_backend):
+                for norm, p in zip(a_backend.norms(items), self.points):
+                    self.assertAlmostEqual(norm, p.length())
+                for a_distance, p in zip(a_backend.distances_to(items, 1.0, -1.0), self.points):
+                    self.assertAlmostEqual(a_distance, p.distance_to(Point(1, -1)))
+                for an_angle, v in zip(a_backend.angles_with_positive_x_axis(items), as_vectors):
+                    self.assertAlmostEqual(an_angle, v.angle_with_positive_x_axis().value)
+                self.assertEqual(a_backend.translated(items, 1.0, 2.0), [(p.x + 1.0, p.y + 2.0) for p in self.points])
+                self.assertEqual(a_backend.contained_in(items, -2, 4, -3, 1),
+                                 [self.a_rect.contains(p) for p in self.points])
+        self.assertEqual(backend.contained_in(self.points, self.a_rect), [self.a_rect.contains(p) for p in self.points])
+
+    def test_null_vectors_angles(self):
+        """Null vectors (signed zeros included) have angle 0 whatever the backend."""
+        null_vectors = [Vec2d(0.0, 0.0), Vec2d(-0.0, -0.0), Vec2d(0.0, -0.0), Vec2d(-0.0, 0.0)]
+        for a_backend in (backend.PythonBackend(), backend.NumpyBackend()):
+            self.assertEqual(a_backend.angles_with_positive_x_axis(null_vectors), [0.0] * 4)
+            self.assertEqual(a_backend.angles_with_positive_x_axis(PointArray.from_points(null_vectors)), [0.0] * 4)
+
+    def test_automatic_choice(self):
+        self.assertEqual(backend.get_backend().name, backend.PYTHON)
+        self.assertEqual(backend.get_backend(self.points).name, backend.PYTHON)
+        big_array = PointArray.from_points(self.points * 10)
+        small_array = big_array[:backend.NUMPY_MIN_SIZE - 1]
+        self.assertEqual(backend.get_backend(small_array).name, backend.PYTHON)
+        self.assertEqual(backend.get_backend(big_array).name, backend.NUMPY)
+        self.assertEqual(backend.get_backend(big_array.coords).name, backend.NUMPY)
+
+    def test_override(self):
+        backend.set_backend(backend.NUMPY)
+        self.assertEqual(backend.get_backend([Point(1, 1)]).name, backend.NUMPY)
+        self.assertEqual(backend.norms([Vec2d(3, 4)]), [5.0])
+        backend.set_backend(backend.PYTHON)
+        self.assertEqual(backend.get_backend(PointArray.zeros(1000)).name, backend.PYTHON)
+        with self.assertRaises(ValueError):
+            backend.set_backend("fortran")
+
+    def test_scalar_modules_do_not_import_numpy(self):
+        code = "import sys; import %s; print('numpy' in sys.modules)" % (SCALAR_MODULES)
+        self.assertEqual(run_in_fresh_interpreter(code), b"False")
+
+    def test_import_time(self):
+        """Importing the scalar classes costs less than importing NumPy alone."""
+        scalar_time = min(time_imports_in_fresh_interpreter(SCALAR_MODULES) for _ in range(3))
+        numpy_time = min(time_imports_in_fresh_interpreter("numpy") for _ in range(3))
+        self.assertLess(scalar_time, numpy_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from random import random
+from geometry import binary_io
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.rect_array import RectArray
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+
+
+class UnitTestBinaryIO(unittest.TestCase):
+    def setUp(self):
+        """A temporary directory, and some content to save."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "dataset.bin")
+        self.points = [Point(random() * 100, random() * 100) for _ in range(500)]
+        self.rects = [Rect(direction=CoordinatesDirection.ANTI_SCREEN_DIRECTION,
+                           pt1=Point(random() * 10, random() * 10), pt2=Point(random() * 10, random() * 10))
+                      for _ in range(50)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_points_round_trip(self):
+        binary_io.write_points(self.path, self.points, direction=CoordinatesDirection.SCREEN_DIRECTION)
+        a_dataset = binary_io.open_dataset(self.path)
+        self.assertIsInstance(a_dataset.columns, np.memmap)
+        self.assertEqual(len(a_dataset), len(self.points))
+        self.assertEqual(a_dataset.direction, CoordinatesDirection.SCREEN_DIRECTION)
+        self.assertEqual(os.path.getsize(self.path), binary_io.HEADER_SIZE + 2 * 8 * len(self.points))
+        self.assertEqual(a_dataset[123], self.points[123])
+        self.assertEqual(list(a_dataset), self.points)
+        self.assertEqual(a_dataset[10:20], PointArray.from_points(self.points[10:20]))
+        self.assertEqual(a_dataset.load(), PointArray.from_points(self.points))
+        self.assertEqual(a_dataset.xs.tolist(), [p.x for p in self.points])
+
+    def test_vectors_from_arrays_in_float32(self):
+        vectors = Vec2dArray.from_vectors([Vec2d(p.x, -p.y) for p in self.points])
+        binary_io.write_vectors(self.path, vectors, dtype=np.float32)
+        a_header = binary_io.read_header(self.path)
+        self.assertEqual((a_header.kind, a_header.dtype, a_header.count, a_header.direction),
+                         (binary_io.KIND_VECTORS, np.dtype("<f4"), len(self.points), None))
+        a_dataset = binary_io.open_dataset(self.path)
+        self.assertIsInstance(a_dataset[0], Vec2d)
+        self.assertTrue(np.allclose(a_dataset.load().coords, vectors.coords, rtol=1e-6))
+        with self.assertRaises(AttributeError):
+            a_dataset.lefts
+
+    def test_rects(self):
+        binary_io.write_rects(self.path, self.rects)
+        a_dataset = binary_io.open_dataset(self.path)
+        self.assertEqual(a_dataset.direction, CoordinatesDirection.ANTI_SCREEN_DIRECTION)
+        self.assertEqual(list(a_dataset), self.rects)
+        self.assertIsInstance(a_dataset[np.array([1, 3])], RectArray)
+        mixed = self.rects + [Rect(direction=CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(0, 0), pt2=Point(1, 1))]
+        with self.assertRaises(ValueError):
+            binary_io.write_rects(self.path, mixed)
+
+    def test_empty(self):
+        binary_io.write_points(self.path, [])
+        a_dataset = binary_io.open_dataset(self.path)
+        self.assertEqual(len(a_dataset), 0)
+        self.assertEqual(len(a_dataset.load()), 0)
+
+    def test_bad_files(self):
+        with open(self.path, "wb") as a_file:
+            a_file.write(b"x,y\n1,2\n" * 10)
+        with self.assertRaises(ValueError):
+            binary_io.open_dataset(self.path)
+        binary_io.write_points(self.path, self.points)
+        with open(self.path, "r+b") as a_file:
+            a_file.truncate(binary_io.HEADER_SIZE + 100)
+        with self.assertRaises(ValueError):
+            binary_io.open_dataset(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
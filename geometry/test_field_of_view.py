@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for field-of-view queries.
+
+Results are checked against the per-point computation with Vec2d angles.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from random import random
+from geometry.angle import AngleInRadians
+from geometry.coordinates import CoordinatesDirection
+from geometry.field_of_view import FieldOfViewIndex, sector_mask
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.vector import Vec2d
+
+
+def sees(origin, heading, half_width, radius, a_point):
+    """One candidate at a time, the slow way."""
+    if a_point.distance_to(origin) > radius:
+        return False
+    to_point = Vec2d.from_to(from_pt=origin, to_pt=a_point)
+    if to_point.is_null():
+        return True
+    offset = Vec2d.from_angle(heading).angle_to(to_point).value
+    return min(offset, 2 * math.pi - offset) <= half_width
+
+
+class TestFieldOfView(unittest.TestCase):
+    """Tests sector queries."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.points = [Point(random() * 100, random() * 100) for _ in range(400)]
+        self.index = FieldOfViewIndex(self.points)
+
+    def test_queries(self):
+        for _ in range(30):
+            origin = Point(random() * 100, random() * 100)
+            heading = AngleInRadians.random()
+            half_width, radius = random() * math.pi / 2, random() * 40
+            expected = {i for i, p in enumerate(self.points) if sees(origin, heading, half_width, radius, p)}
+            self.assertEqual(set(self.index.query(origin, heading, half_width, radius).tolist()), expected)
+
+    def test_sector_crossing_zero(self):
+        origin = Point(0, 0)
+        points = PointArray([(1, 0.1), (1, -0.1), (-1, 0), (0, 1)])
+        self.assertEqual(sector_mask(points, origin, 0.0, 0.2, 10).tolist(), [True, True, False, False])
+        self.assertEqual(sector_mask(points, origin, AngleInRadians(2 * math.pi - 0.05), 0.2, 10).tolist(),
+                         [True, True, False, False])
+        # full disc:
+        self.assertTrue(sector_mask(points, origin, 1.0, math.pi, 10).all())
+
+    def test_screen_direction(self):
+        """Headings are Vec2d angles whatever the coordinates direction: Pi / 2 faces y increasing."""
+        points = PointArray([(0, -1), (0, 5)])
+        expected = [sees(Point(0, 0), AngleInRadians(AngleInRadians.PI_HALF), 0.1, 5, p) for p in (Point(0, -1), Point(0, 5))]
+        self.assertEqual(expected, [False, True])
+        for direction in (CoordinatesDirection.SCREEN_DIRECTION, CoordinatesDirection.ANTI_SCREEN_DIRECTION):
+            self.assertEqual(sector_mask(points, Point(0, 0), AngleInRadians.PI_HALF, 0.1, 5,
+                                         direction=direction).tolist(), expected)
+
+    def test_screen_direction_queries(self):
+        index = FieldOfViewIndex(self.points, direction=CoordinatesDirection.SCREEN_DIRECTION)
+        for _ in range(10):
+            origin = Point(random() * 100, random() * 100)
+            heading = AngleInRadians.random()
+            half_width, radius = random() * math.pi / 2, random() * 40
+            expected = {i for i, p in enumerate(self.points) if sees(origin, heading, half_width, radius, p)}
+            self.assertEqual(set(index.query(origin, heading, half_width, radius).tolist()), expected)
+
+    def test_many_viewers(self):
+        origins = [Point(random() * 100, random() * 100) for _ in range(5)]
+        headings = np.array([random() * 2 * math.pi for _ in range(5)])
+        results = self.index.query_many(origins, headings, 0.5, 30)
+        for origin, heading, found in zip(origins, headings, results):
+            self.assertEqual(set(found.tolist()), set(self.index.query(origin, heading, 0.5, 30).tolist()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from geometry import instrumentation
+from geometry.angle import AngleInRadians
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+
+# where 'import geometry' works
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class UnitTestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        """Instrumentation off, counters at zero."""
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_counts_calls(self):
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        a_vector = Vec2d(3, 4)
+        for _ in range(5):
+            a_vector / 2
+        a_vector.rotate_radians(AngleInRadians(0.5))
+        a_vector.angle_to(Vec2d(1, 0))
+        a_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(0, 0), pt2=Point(5, 5))
+        a_rect.contains(Point(1, 1))
+        Point(0, 0).distance_to(Point(3, 4))
+        counters = instrumentation.snapshot()
+        self.assertEqual(counters["Vec2d._o2"]["calls"], 5)
+        self.assertEqual(counters["Vec2d.rotate_radians"]["calls"], 1)
+        self.assertEqual(counters["Vec2d.angle_with_positive_x_axis"]["calls"], 2)
+        self.assertEqual(counters["Rect.set_points"]["calls"], 1)
+        self.assertEqual(counters["Rect.contains"]["calls"], 1)
+        self.assertEqual(counters["Point.distance_to"]["calls"], 1)
+        # one for rotate_radians, two for angle_to (and the difference)
+        self.assertGreaterEqual(counters["AngleInRadians.__init__"]["calls"], 3)
+        self.assertGreater(counters["Vec2d._o2"]["total_seconds"], 0.0)
+        table = instrumentation.format_table()
+        self.assertIn("Vec2d._o2", table)
+        self.assertEqual(len(table.splitlines()), 1 + len(instrumentation.DEFAULT_TARGETS))
+
+    def test_disabled_means_untouched(self):
+        original = Vec2d.__dict__["_o2"]
+        instrumentation.enable()
+        self.assertIsNot(Vec2d.__dict__["_o2"], original)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Vec2d.__dict__["_o2"], original)
+        Vec2d(1, 2) / 2
+        self.assertEqual(instrumentation.snapshot()["Vec2d._o2"]["calls"], 0)
+        with self.assertRaises(ValueError):
+            instrumentation.enable([(Point, "no_such_method")])
+
+    def test_inherited_method(self):
+        """Point inherits distance_to: the wrapper is put on Point, and taken away afterwards."""
+        self.assertNotIn("distance_to", Point.__dict__)
+        instrumentation.enable([(Point, "distance_to")])
+        self.assertIn("distance_to", Point.__dict__)
+        self.assertEqual(Point(0, 0).distance_to(Point(3, 4)), 5.0)
+        instrumentation.disable()
+        self.assertNotIn("distance_to", Point.__dict__)
+        self.assertEqual(Point(0, 0).distance_to(Point(3, 4)), 5.0)
+        self.assertEqual(instrumentation.snapshot()["Point.distance_to"]["calls"], 1)
+
+    def test_environment_variable(self):
+        code = "from geometry import instrumentation; print(instrumentation.is_enabled())"
+        for value, expected in (("1", b"True"), ("0", b"False")):
+            output = subprocess.check_output([sys.executable, "-c", code], cwd=REPOSITORY_ROOT,
+                                             env=dict(os.environ, GEOMETRY_INSTRUMENTATION=value))
+            self.assertEqual(output.strip(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for the KD-tree.
+
+Results are checked against brute force over Point.distance_to.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+from random import random
+from geometry.kdtree import KDTree
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+
+class TestKDTree(unittest.TestCase):
+    """Tests KDTree queries."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.points = [Point(random() * 100, random() * 100) for _ in range(500)]
+        self.tree = KDTree(self.points, leaf_size=8)
+
+    def brute_force(self, a_point):
+        return sorted(range(len(self.points)), key=lambda i: self.points[i].distance_to(a_point))
+
+    def test_k_nearest(self):
+        for _ in range(20):
+            a_point = Point(random() * 120 - 10, random() * 120 - 10)
+            distances, indices = self.tree.query(a_point, k=5)
+            self.assertEqual(list(indices), self.brute_force(a_point)[:5])
+            for a_distance, i in zip(distances, indices):
+                self.assertAlmostEqual(a_distance, self.points[i].distance_to(a_point))
+            squared, _ = self.tree.query(a_point, k=5, squared=True)
+            for a_distance, a_squared in zip(distances, squared):
+                self.assertAlmostEqual(a_distance ** 2, a_squared)
+
+    def test_nearest(self):
+        a_point = Point(50, 50)
+        a_distance, an_index = self.tree.nearest(a_point)
+        self.assertEqual(an_index, self.brute_force(a_point)[0])
+        self.assertAlmostEqual(a_distance, self.points[an_index].distance_to(a_point))
+
+    def test_radius(self):
+        for _ in range(20):
+            a_point = Point(random() * 100, random() * 100)
+            radius = random() * 20
+            expected = {i for i, p in enumerate(self.points) if p.distance_to(a_point) <= radius}
+            self.assertEqual(set(self.tree.query_radius(a_point, radius).tolist()), expected)
+            distances, indices = self.tree.query_radius(a_point, radius, return_distances=True, sort=True)
+            self.assertEqual(list(distances), sorted(distances))
+
+    def test_batch(self):
+        queries = PointArray.from_points([Point(random() * 100, random() * 100) for _ in range(10)])
+        distances, indices = self.tree.query_batch(queries, k=3)
+        self.assertEqual(indices.shape, (10, 3))
+        for a_query, some_indices in zip(queries, indices):
+            self.assertEqual(list(some_indices), self.brute_force(a_query)[:3])
+        in_range = self.tree.query_radius_batch(queries, 10.0)
+        for a_query, some_indices in zip(queries, in_range):
+            self.assertEqual(set(some_indices.tolist()), set(self.tree.query_radius(a_query, 10.0).tolist()))
+
+    def test_batch_matches_single_queries(self):
+        """Vectorized batch against one query at a time: k above the leaf size, padded leaves, far queries."""
+        queries = [Point(random() * 160 - 30, random() * 160 - 30) for _ in range(200)] + [Point(1e6, -1e6)]
+        for a_tree in (self.tree, KDTree(self.points[:37], leaf_size=4), KDTree(self.points[:3], leaf_size=16),
+                       KDTree([Point(round(p.x / 10), round(p.y / 10)) for p in self.points], leaf_size=8)):
+            for k in (1, 3, 11, 50):
+                distances, indices = a_tree.query_batch(queries, k=k, squared=True)
+                self.assertEqual(distances.shape, (len(queries), min(k, len(a_tree))))
+                for a_query, some_distances, some_indices in zip(queries, distances, indices):
+                    expected, _ = a_tree.query(a_query, k=k, squared=True)
+                    self.assertEqual(some_distances.tolist(), expected.tolist())
+                    obtained = [a_tree.points[i].distance_to(a_query) ** 2 for i in some_indices.tolist()]
+                    for a_distance, another in zip(obtained, expected.tolist()):
+                        self.assertAlmostEqual(a_distance, another, delta=1e-9 * max(1.0, another))
+        self.assertEqual(self.tree.query_batch([], k=3)[1].shape, (0, 3))
+
+    def test_small_trees(self):
+        """Asking for more neighbours than there are points."""
+        a_tree = KDTree([Point(1, 1), Point(5, 5)])
+        distances, indices = a_tree.query(Point(0, 0), k=10)
+        self.assertEqual(list(indices), [0, 1])
+        self.assertEqual(len(KDTree([]).query(Point(0, 0))[1]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for the kinematics integrator.
+
+Steps are checked against Point.translate_following, one entity at a time.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+from random import random
+from geometry.coordinates import CoordinatesDirection
+from geometry.kinematics import KinematicsIntegrator
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+
+
+class TestKinematicsIntegrator(unittest.TestCase):
+    """Tests KinematicsIntegrator definition."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.positions = [Point(random() * 10, random() * 10) for _ in range(20)]
+        self.velocities = [Vec2d(random() - 0.5, random() - 0.5) for _ in range(20)]
+        self.gravity = Vec2d(0, -9.8)
+
+    def assertPointsAlmostEqual(self, a_pt, another_pt):
+        self.assertAlmostEqual(a_pt.x, another_pt.x)
+        self.assertAlmostEqual(a_pt.y, another_pt.y)
+
+    def test_euler_matches_scalar_loop(self):
+        integrator = KinematicsIntegrator(self.positions, self.velocities, accelerations=self.gravity)
+        dt = 0.1
+        for _ in range(5):
+            integrator.step_euler(dt)
+            for a_point, a_velocity in zip(self.positions, self.velocities):
+                a_point.translate_following(a_velocity * dt)
+                a_velocity += self.gravity * dt
+        for i, a_point in enumerate(self.positions):
+            self.assertPointsAlmostEqual(integrator.position(i), a_point)
+            self.assertPointsAlmostEqual(integrator.velocity(i), self.velocities[i])
+
+    def test_semi_implicit(self):
+        integrator = KinematicsIntegrator([Point(0, 0)], [Vec2d(1, 0)], accelerations=[Vec2d(0, 2)])
+        integrator.step_semi_implicit(0.5)
+        self.assertEqual(integrator.velocity(0), Vec2d(1, 1))
+        self.assertEqual(integrator.position(0), Point(0.5, 0.5))
+
+    def test_views_write_through(self):
+        integrator = KinematicsIntegrator(self.positions)
+        a_view = integrator.position(3)
+        a_view.move_to(100, 200)
+        self.assertEqual(integrator.positions[3].tolist(), [100, 200])
+        integrator.velocity(3).x = 5
+        integrator.step_euler(1.0)
+        self.assertEqual(a_view, Point(105, 200))
+        self.assertEqual(integrator.positions_array()[3], Point(105, 200))
+
+    def test_clamping(self):
+        bounds = Rect(direction=CoordinatesDirection.ANTI_SCREEN_DIRECTION, pt1=Point(0, 0), pt2=Point(10, 10))
+        integrator = KinematicsIntegrator(self.positions, Vec2d(100, -100), bounds=bounds)
+        integrator.step_semi_implicit(1.0)
+        for i in range(len(integrator)):
+            self.assertEqual(integrator.position(i), Point(10, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from geometry import memory
+from geometry.point import Point
+from geometry.vector import Vec2d
+
+
+class UnitTestMemory(unittest.TestCase):
+    def test_bytes_per_instance(self):
+        point_bytes = memory.bytes_per_instance(lambda i: Point(i + 0.5, i + 1.5))
+        vector_bytes = memory.bytes_per_instance(lambda i: Vec2d(i + 0.5, i + 1.5))
+        self.assertGreater(vector_bytes, 0)
+        # Point has a __dict__, Vec2d has __slots__
+        self.assertGreater(point_bytes, vector_bytes)
+
+    def test_live_counts(self):
+        before = memory.live_counts()["Point"]
+        points = [Point(i, i) for i in range(100)]
+        self.assertGreaterEqual(memory.live_counts()["Point"], before + 100)
+        self.assertEqual(len(points), 100)
+
+    def test_footprint_report(self):
+        report = memory.footprint_report(population=1000)
+        by_kind = {a_footprint.kind: a_footprint for a_footprint in report}
+        self.assertEqual(set(by_kind), {'Point', 'FrozenPoint', 'Vec2d', 'Rect', 'Rect (derived points built)',
+                                        'AngleInRadians', 'AngleInDegrees'})
+        for a_footprint in report:
+            self.assertEqual(a_footprint.population, 1000)
+            self.assertGreater(a_footprint.array_savings, 0)
+        self.assertLess(by_kind['Point'].slotted_bytes, by_kind['Point'].bytes_per_instance)
+        self.assertGreater(by_kind['Point'].slotted_savings, 0)
+        self.assertIsNone(by_kind['Vec2d'].slotted_bytes)
+        self.assertEqual(by_kind['Vec2d'].slotted_savings, 0)
+        self.assertEqual(by_kind['Point'].array_bytes, 16)
+        self.assertGreater(by_kind['Rect (derived points built)'].bytes_per_instance,
+                           by_kind['Rect'].bytes_per_instance)
+
+    def test_population_defaults_to_live_count(self):
+        points = [Point(i, i) for i in range(10)]
+        for a_footprint in memory.footprint_report():
+            self.assertEqual(a_footprint.population, a_footprint.live_count)
+        self.assertEqual(len(points), 10)
+
+    def test_format_report(self):
+        report = memory.footprint_report(population=10)
+        lines = memory.format_report(report).splitlines()
+        self.assertEqual(len(lines), len(report) + 1)
+        self.assertTrue(lines[1].startswith("Point"))
+        self.assertIn("total_bytes", report[0].as_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
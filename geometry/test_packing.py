@@ -0,0 +1,69 @@
+import math
+import pickle
+import unittest
+
+import numpy as np
+
+from random import random
+from geometry.angle import AngleInRadians, AngleInDegrees
+from geometry.angle_array import AngleArray
+from geometry.coordinates import CoordinatesDirection
+from geometry.packing import pack, unpack
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.rect_array import RectArray
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+
+
+class UnitTestPacking(unittest.TestCase):
+    def setUp(self):
+        """One list of each kind of object."""
+        self.points = [Point(random(), random()) for _ in range(100)]
+        self.vectors = [Vec2d(random(), random()) for _ in range(100)]
+        self.rects = [Rect(direction=CoordinatesDirection.SCREEN_DIRECTION if random() > 0.5
+                           else CoordinatesDirection.ANTI_SCREEN_DIRECTION,
+                           pt1=Point(random() * 10, random() * 10), pt2=Point(random() * 10, random() * 10))
+                      for _ in range(30)]
+        self.angles = [AngleInRadians(random() * 2 * math.pi) for _ in range(50)]
+
+    def test_pack_unpack(self):
+        self.assertIsInstance(pack(self.points), PointArray)
+        self.assertIsInstance(pack(self.vectors), Vec2dArray)
+        self.assertIsInstance(pack(self.rects), RectArray)
+        self.assertIsInstance(pack(self.angles), AngleArray)
+        for items in (self.points, self.vectors, self.rects, self.angles):
+            self.assertEqual(unpack(pack(items)), items)
+        self.assertEqual(unpack(pack([AngleInDegrees(90)])), [AngleInRadians(math.pi / 2)])
+        self.assertEqual(len(pack([], item_class=Point)), 0)
+        with self.assertRaises(ValueError):
+            pack([])
+        with self.assertRaises(TypeError):
+            pack(["a string"])
+
+    def test_pickle_in_band(self):
+        for items in (self.points, self.vectors, self.rects, self.angles):
+            for protocol in (2, 4, 5):
+                collection = pickle.loads(pickle.dumps(pack(items), protocol=protocol))
+                self.assertEqual(unpack(collection), items)
+
+    def test_pickle_out_of_band(self):
+        """With protocol 5 and a buffer callback, the data is not copied."""
+        for items, n_buffers in ((self.points, 1), (self.vectors, 1), (self.rects, 5), (self.angles, 1)):
+            collection = pack(items)
+            buffers = []
+            data = pickle.dumps(collection, protocol=5, buffer_callback=buffers.append)
+            self.assertEqual(len(buffers), n_buffers)
+            self.assertLess(len(data), 500)
+            unpickled = pickle.loads(data, buffers=buffers)
+            self.assertIs(type(unpickled), type(collection))
+            self.assertEqual(unpack(unpickled), items)
+        points = pack(self.points)
+        buffers = []
+        unpickled = pickle.loads(pickle.dumps(points, protocol=5, buffer_callback=buffers.append), buffers=buffers)
+        self.assertTrue(np.shares_memory(unpickled.coords, points.coords))
+
+
+if __name__ == '__main__':
+    unittest.main()
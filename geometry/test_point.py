@@ -13,8 +13,10 @@ TODO:
 import unittest
 
 import math
+import pickle
 from random import randint, random
-from geometry.point import Point
+from geometry.point import FrozenPoint, Point
+from geometry.vector import Vec2d
 
 class TestPoint(unittest.TestCase):
     """Tests Point definition."""
@@ -55,4 +57,117 @@ class TestPoint(unittest.TestCase):
         self.assertTrue(a_pt1.x == math.ceil(a_pt.x) if a_pt.x > 0.5 else a_pt1.x == math.floor(a_pt.x), "[x failed] a_pt = %s, a_pt1 = %s" % (a_pt, a_pt1))
         self.assertTrue(a_pt1.y == math.ceil(a_pt.y) if a_pt.y > 0.5 else a_pt1.y == math.floor(a_pt.y), "[y failed] a_pt = %s, a_pt1 = %s" % (a_pt, a_pt1))
 
+    def test_inplace_operators(self):
+        """In-place operators mutate the point itself."""
+        a_pt = Point(5.0, 7.0)
+        same_pt = a_pt
+        a_pt -= Point(1.0, 2.0)
+        self.assertIs(a_pt, same_pt)
+        self.assertEqual(a_pt, Point(4.0, 5.0))
+        a_pt += Point(1.0, 1.0)
+        self.assertEqual(a_pt, Point(5.0, 6.0))
+        a_pt *= 2
+        self.assertEqual(a_pt, Point(10.0, 12.0))
+        a_pt /= 4
+        self.assertIs(a_pt, same_pt)
+        self.assertEqual(a_pt, Point(2.5, 3.0))
 
+    def test_rotate_about(self):
+        """Rotates around the point, in radians, into a new point."""
+        a_pt = Point(2.0, 1.0)
+        rotated = a_pt.rotate_about(Point(1.0, 1.0), math.pi / 2)
+        self.assertIsInstance(rotated, Point)
+        self.assertAlmostEqual(rotated.x, 1.0)
+        self.assertAlmostEqual(rotated.y, 2.0)
+        self.assertEqual(a_pt, Point(2.0, 1.0))
+
+    def test_into_variants(self):
+        """Results written into an existing point."""
+        a_pt, another_pt, out = Point(1.0, 2.0), Point(3.0, 5.0), Point()
+        self.assertIs(a_pt.add_into(another_pt, out), out)
+        self.assertEqual(out, a_pt + another_pt)
+        self.assertEqual(a_pt.sub_into(another_pt, out), a_pt - another_pt)
+        self.assertEqual(a_pt.scale_into(3, out), a_pt * 3)
+        a_pt.add_into(another_pt, out=a_pt)
+        self.assertEqual(a_pt, Point(4.0, 7.0))
+
+
+class TestFrozenPoint(unittest.TestCase):
+    """Tests FrozenPoint definition."""
+
+    def test_immutable(self):
+        a_pt = FrozenPoint(1.0, 2.0)
+        with self.assertRaises(AttributeError):
+            a_pt.x = 3.0
+        with self.assertRaises(AttributeError):
+            del a_pt.y
+        with self.assertRaises(AttributeError):
+            a_pt.z = 3.0
+        self.assertEqual(a_pt.as_tuple(), (1.0, 2.0))
+
+    def test_equality_and_hash_with_point(self):
+        a_pt = FrozenPoint(1.5, -2.0)
+        self.assertEqual(a_pt, FrozenPoint(1.5, -2.0))
+        self.assertNotEqual(a_pt, FrozenPoint(1.5, 2.0))
+        self.assertEqual(a_pt, Point(1.5, -2.0))
+        self.assertEqual(Point(1.5, -2.0), a_pt)
+        self.assertNotEqual(a_pt, (1.5, -2.0))
+        self.assertEqual(hash(a_pt), hash(Point(1.5, -2.0)))
+        self.assertEqual(len({a_pt, FrozenPoint(1.5, -2.0), Point(1.5, -2.0)}), 1)
+        self.assertEqual(hash(a_pt), hash(a_pt))
+        self.assertEqual({a_pt: "here"}[FrozenPoint(1.5, -2.0)], "here")
+
+    def test_conversions(self):
+        a_pt = Point(3.0, 4.0)
+        frozen_pt = a_pt.frozen()
+        self.assertIsInstance(frozen_pt, FrozenPoint)
+        self.assertEqual(FrozenPoint.from_point(a_pt), frozen_pt)
+        self.assertEqual(FrozenPoint.from_tuple((3.0, 4.0)), frozen_pt)
+        thawed_pt = frozen_pt.thawed()
+        self.assertIs(type(thawed_pt), Point)
+        thawed_pt.move_to(0.0, 0.0)
+        self.assertEqual(frozen_pt, FrozenPoint(3.0, 4.0))
+        self.assertEqual(list(frozen_pt), [3.0, 4.0])
+        self.assertEqual(frozen_pt[1], 4.0)
+
+    def test_methods_return_new_points(self):
+        a_pt = FrozenPoint(1.4, 2.6)
+        self.assertEqual(a_pt + Point(1.0, 1.0), FrozenPoint(2.4, 3.6))
+        self.assertIsInstance(a_pt - a_pt, FrozenPoint)
+        self.assertEqual(a_pt * 2, FrozenPoint(2.8, 5.2))
+        self.assertEqual(a_pt / 2, FrozenPoint(0.7, 1.3))
+        moved = a_pt
+        moved += FrozenPoint(1.0, 0.0)
+        self.assertEqual(a_pt, FrozenPoint(1.4, 2.6))
+        self.assertEqual(moved, FrozenPoint(2.4, 2.6))
+        self.assertEqual(a_pt.integerize(), FrozenPoint(1, 3))
+        self.assertEqual(FrozenPoint(1, 3).floatize().as_tuple(), (1.0, 3.0))
+        self.assertEqual(a_pt.move_to(5, 6), FrozenPoint(5, 6))
+        self.assertEqual(a_pt.slide_xy(1.0, -1.0), FrozenPoint(2.4, 1.6))
+        self.assertEqual(a_pt.translate_following(Vec2d(1.0, -1.0)), FrozenPoint(2.4, 1.6))
+        self.assertIs(a_pt.clone(), a_pt)
+        self.assertEqual(a_pt, FrozenPoint(1.4, 2.6))
+
+    def test_geometry(self):
+        a_pt = FrozenPoint(3.0, 4.0)
+        self.assertEqual(a_pt.length(), 5.0)
+        self.assertEqual(a_pt.distance_to(Point(0.0, 0.0)), 5.0)
+        rotated = FrozenPoint(1.0, 0.0).rotate(math.pi / 2)
+        self.assertAlmostEqual(rotated.x, 0.0)
+        self.assertAlmostEqual(rotated.y, 1.0)
+        rotated = FrozenPoint(2.0, 1.0).rotate_about(Point(1.0, 1.0), math.pi)
+        self.assertAlmostEqual(rotated.x, 0.0)
+        self.assertAlmostEqual(rotated.y, 1.0)
+        self.assertIsInstance(rotated, FrozenPoint)
+        # same results as Point, in the same units
+        for name, args in (("rotate", (0.7,)), ("rotate_about", (Point(-1.0, 2.0), 0.7))):
+            self.assertEqual(getattr(a_pt, name)(*args), getattr(a_pt.thawed(), name)(*args))
+        out = Point()
+        self.assertEqual(a_pt.add_into(Point(1.0, 1.0), out), Point(4.0, 5.0))
+
+    def test_pickle(self):
+        a_pt = FrozenPoint(1.5, 2.5)
+        copied = pickle.loads(pickle.dumps(a_pt))
+        self.assertEqual(copied, a_pt)
+        self.assertEqual(hash(copied), hash(a_pt))
+        self.assertEqual(repr(copied), "FrozenPoint(1.5, 2.5)")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for PointArray.
+
+Checks that bulk operations agree with the ones on Point.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+from random import random
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.xy_array import as_coords_array, as_xy
+
+
+class TestPointArray(unittest.TestCase):
+    """Tests PointArray definition."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.points = [Point(random() * 100, random() * 100) for _ in range(20)]
+        self.pt_array = PointArray.from_points(self.points)
+
+    def test_construction(self):
+        """All constructors agree."""
+        from_tuples = PointArray.from_tuples([a_pt.as_tuple() for a_pt in self.points])
+        from_xy = PointArray.from_xy([a_pt.x for a_pt in self.points], [a_pt.y for a_pt in self.points])
+        self.assertEqual(self.pt_array, from_tuples)
+        self.assertEqual(self.pt_array, from_xy)
+        self.assertEqual(len(PointArray([])), 0)
+        self.assertEqual(PointArray(self.points), self.pt_array)
+        self.assertEqual(PointArray([Point(1, 2), (3, 4)]).coords.tolist(), [[1, 2], [3, 4]])
+        self.assertEqual(PointArray(self.pt_array), self.pt_array)
+        with self.assertRaises(ValueError):
+            PointArray([(1, 2, 3)])
+        with self.assertRaises(ValueError):
+            PointArray([Point(1, 2), (3,)])
+
+    def test_indexing(self):
+        """Integers give Points, slices give arrays."""
+        self.assertEqual(len(self.pt_array), len(self.points))
+        self.assertEqual(self.pt_array[3], self.points[3])
+        self.assertEqual(self.pt_array[-1], self.points[-1])
+        a_slice = self.pt_array[2:5]
+        self.assertIsInstance(a_slice, PointArray)
+        self.assertEqual(a_slice.to_points(), self.points[2:5])
+        self.assertEqual(list(self.pt_array), self.points)
+
+    def test_arithmetic(self):
+        """Bulk operations match Point's."""
+        a_pt = Point(3.0, -4.0)
+        self.assertEqual((self.pt_array + a_pt).to_points(), [p + a_pt for p in self.points])
+        self.assertEqual((self.pt_array - a_pt).to_points(), [p - a_pt for p in self.points])
+        self.assertEqual((self.pt_array * 2.5).to_points(), [p * 2.5 for p in self.points])
+        self.assertEqual((self.pt_array - self.pt_array).to_points(), [Point(0, 0)] * len(self.points))
+        for i, a_length in enumerate(self.pt_array.length()):
+            self.assertAlmostEqual(a_length, self.points[i].length())
+        for i, a_distance in enumerate(self.pt_array.distance_to(a_pt)):
+            self.assertAlmostEqual(a_distance, self.points[i].distance_to(a_pt))
+        xs, ys = self.pt_array.as_tuple()
+        self.assertEqual(list(zip(xs.tolist(), ys.tolist())), [p.as_tuple() for p in self.points])
+
+    def test_coercion_helpers(self):
+        """Points of any kind as a (N, 2) array, or as one (x, y) pair."""
+        expected = self.pt_array.coords
+        for points in (self.pt_array, expected, self.points, [a_pt.as_tuple() for a_pt in self.points],
+                       (a_pt for a_pt in self.points)):
+            self.assertEqual(as_coords_array(points).tolist(), expected.tolist())
+        self.assertEqual(as_coords_array(Point(1, 2)).tolist(), [[1.0, 2.0]])
+        self.assertEqual(as_coords_array([]).shape, (0, 2))
+        self.assertEqual(as_xy(Point(1, 2)), (1.0, 2.0))
+        self.assertEqual(as_xy((3, 4)), (3.0, 4.0))
+
+    def test_integerize(self):
+        """Same rounding as Point.integerize, halves included."""
+        coords = [(0.5, 1.5), (2.5, -0.5), (-1.5, 3.49), (7.2, -7.8)]
+        expected = [Point(x, y).integerize().as_tuple() for (x, y) in coords]
+        self.assertEqual([tuple(row) for row in PointArray(coords).integer_coords().tolist()], expected)
+        pt_array = PointArray(coords)
+        self.assertIs(pt_array.integerize(), pt_array)
+        self.assertEqual(pt_array.coords.tolist(), [list(pair) for pair in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
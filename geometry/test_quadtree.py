@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for the rectangle quadtree.
+
+Results are checked against pairwise Rect.contains / Rect.overlaps.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+from random import random
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.quadtree import RectQuadtree
+from geometry.shapes import Rect
+
+
+def random_rect(direction=CoordinatesDirection.SCREEN_DIRECTION, max_size=10.0):
+    a_pt = Point(random() * 100, random() * 100)
+    return Rect(direction=direction, pt1=a_pt, pt2=Point(a_pt.x + random() * max_size, a_pt.y + random() * max_size))
+
+
+def as_screen(a_rect):
+    """Rect.overlaps only makes sense for SCREEN_DIRECTION rectangles."""
+    return Rect(direction=CoordinatesDirection.SCREEN_DIRECTION, pt1=a_rect.topleft, pt2=a_rect.bottomright)
+
+
+class TestRectQuadtree(unittest.TestCase):
+    """Tests RectQuadtree queries."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.rects = [random_rect(CoordinatesDirection.SCREEN_DIRECTION if random() > 0.5
+                                  else CoordinatesDirection.ANTI_SCREEN_DIRECTION) for _ in range(300)]
+        self.screen_rects = [as_screen(r) for r in self.rects]
+        self.tree = RectQuadtree(self.rects, capacity=4)
+
+    def test_point_hits(self):
+        for _ in range(50):
+            a_point = Point(random() * 110, random() * 110)
+            expected = {i for i, r in enumerate(self.rects) if r.contains(a_point)}
+            self.assertEqual(set(self.tree.query_point(a_point)), expected)
+            self.assertGreater(self.tree.last_visits, 0)
+
+    def test_overlaps(self):
+        for direction in CoordinatesDirection:
+            for _ in range(20):
+                a_rect = random_rect(direction, max_size=30.0)
+                expected = {i for i, r in enumerate(self.screen_rects) if r.overlaps(as_screen(a_rect))}
+                self.assertEqual(set(self.tree.query_overlap(a_rect)), expected)
+
+    def test_all_pairs(self):
+        expected = {(i, j) for i in range(len(self.rects)) for j in range(i + 1, len(self.rects))
+                    if self.screen_rects[i].overlaps(self.screen_rects[j])}
+        pairs = self.tree.all_overlapping_pairs()
+        self.assertEqual(len(pairs), len(set(pairs)))
+        self.assertEqual(set(pairs), expected)
+
+    def test_insert_outside_bounds(self):
+        far_away = Rect(direction=CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(500, 500), pt2=Point(510, 510))
+        index = self.tree.insert(far_away)
+        self.assertEqual(self.tree.query_point(Point(505, 505)), [index])
+
+    def test_visits_are_pruned(self):
+        """A small query does not look at the whole tree."""
+        self.tree.all_overlapping_pairs()
+        total_nodes = self.tree.last_visits
+        self.tree.query_point(Point(1, 1))
+        self.assertLess(self.tree.last_visits, total_nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for batch containment.
+
+Results are checked against Rect.contains, in both coordinates directions.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+import numpy as np
+
+from random import random
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.rect_array import RectArray
+from geometry.shapes import Rect
+
+
+class TestRectArray(unittest.TestCase):
+    """Tests RectArray definition."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.rects = [Rect(direction=CoordinatesDirection.SCREEN_DIRECTION if random() > 0.5
+                           else CoordinatesDirection.ANTI_SCREEN_DIRECTION,
+                           pt1=Point(random() * 10, random() * 10), pt2=Point(random() * 10, random() * 10))
+                      for _ in range(30)]
+        self.points = PointArray.from_points([Point(random() * 10, random() * 10) for _ in range(200)])
+        self.expected = np.array([[a_rect.contains(a_pt) for a_pt in self.points] for a_rect in self.rects])
+
+    def test_single_rect(self):
+        for i, a_rect in enumerate(self.rects):
+            self.assertEqual(a_rect.contains_points(self.points).tolist(), self.expected[i].tolist())
+
+    def test_mask(self):
+        rect_array = RectArray.from_rects(self.rects)
+        self.assertTrue(np.array_equal(rect_array.contains_mask(self.points), self.expected))
+
+    def test_pairs_in_chunks(self):
+        rect_array = RectArray.from_rects(self.rects)
+        for chunk_cells in (1, 500, 10 ** 6):
+            rect_indices, point_indices = rect_array.contains_pairs(self.points, chunk_cells=chunk_cells)
+            self.assertEqual(set(zip(rect_indices.tolist(), point_indices.tolist())),
+                             set(zip(*np.nonzero(self.expected))))
+
+    def test_pairs_with_more_points_than_chunk_cells(self):
+        """Points are chunked too: no partial mask is larger than chunk_cells."""
+        mask_sizes = []
+
+        class RecordingRectArray(RectArray):
+            __slots__ = []
+
+            def _mask(self, rows, xs, ys, min_ys, max_ys):
+                mask = super()._mask(rows, xs, ys, min_ys, max_ys)
+                mask_sizes.append(mask.size)
+                return mask
+
+        rect_array = RecordingRectArray.from_rects(self.rects)
+        rect_indices, point_indices = rect_array.contains_pairs(self.points, chunk_cells=64)
+        self.assertLessEqual(max(mask_sizes), 64)
+        self.assertEqual(list(zip(rect_indices.tolist(), point_indices.tolist())),
+                         list(zip(*[indices.tolist() for indices in np.nonzero(self.expected)])))
+
+    def test_indexing(self):
+        rect_array = RectArray.from_rects(self.rects)
+        self.assertEqual(list(rect_array), self.rects)
+        self.assertEqual(len(rect_array[3:7]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import math
+import unittest
+
+from random import random
+from geometry import scalar
+from geometry.point import Point
+from geometry.vector import Vec2d, NULL_VECTOR
+
+
+def legacy_angle(x, y):
+    """What Vec2d.angle_with_positive_x_axis computed before (arctan of the slope, fixed by quadrant)."""
+    if x == 0:
+        if y == 0:
+            return 0.0
+        return math.pi / 2 if y > 0 else 3 * math.pi / 2
+    the_value = math.atan(y / x) + (math.pi if x < 0 else 2 * math.pi)
+    return the_value % (2 * math.pi)
+
+
+class UnitTestScalar(unittest.TestCase):
+    def setUp(self):
+        self.pairs = [((random() - 0.5) * 100, (random() - 0.5) * 100) for _ in range(200)]
+
+    def test_results_are_python_floats(self):
+        a_vector = Vec2d(3, 4)
+        for a_result in (a_vector.norm(), a_vector.get_length(), a_vector.angle_with_positive_x_axis().value,
+                         Point(3, 4).length(), Point(3, 4).distance_to(Point(0, 0))):
+            self.assertIs(type(a_result), float)
+        self.assertEqual(a_vector.norm(), 5.0)
+
+    def test_angle_matches_legacy(self):
+        for x, y in self.pairs + [(1, 0), (0, 1), (-1, 0), (0, -1), (-1, -1e-300), (1, -0.0)]:
+            an_angle = scalar.angle_with_positive_x_axis(x, y)
+            self.assertTrue(0 <= an_angle < 2 * math.pi)
+            difference = abs(an_angle - legacy_angle(x, y))
+            self.assertAlmostEqual(min(difference, 2 * math.pi - difference), 0.0, places=9)
+
+    def test_null_vector(self):
+        self.assertEqual(scalar.angle_with_positive_x_axis(0.0, 0.0), 0.0)
+        self.assertEqual(scalar.angle_with_positive_x_axis(-0.0, -0.0), 0.0)
+        self.assertEqual(NULL_VECTOR.angle_with_positive_x_axis().value, 0.0)
+        self.assertEqual(scalar.normalized(0.0, 0.0), (0.0, 0.0, 0.0))
+        with self.assertRaises(ZeroDivisionError):
+            NULL_VECTOR.scaled_to_norm(1.0)
+
+    def test_lengths_and_distances(self):
+        for (x, y), (u, v) in zip(self.pairs, reversed(self.pairs)):
+            self.assertAlmostEqual(scalar.norm(x, y), math.sqrt(x ** 2 + y ** 2))
+            self.assertAlmostEqual(scalar.distance(x, y, u, v), math.sqrt((x - u) ** 2 + (y - v) ** 2))
+            self.assertAlmostEqual(scalar.distance_sqrd(x, y, u, v), (x - u) ** 2 + (y - v) ** 2)
+            sx, sy = scalar.scaled_to_norm(x, y, 2.5)
+            self.assertAlmostEqual(scalar.norm(sx, sy), 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,6 +77,27 @@ class TestShapes(unittest.TestCase):
             a_pt = a_rect.get_random_point()
             self.assertTrue(a_rect.contains(a_pt))
 
+    def test_derived_points(self):
+        """Corners & co are computed on demand, and follow set_points."""
+        a_rect = Rect(
+            direction=CoordinatesDirection.SCREEN_DIRECTION,
+            pt1=Point(x=4.0, y=0.0),
+            pt2=Point(x=0.0, y=2.0))
+        self.assertEqual(a_rect.topleft, Point(0.0, 0.0))
+        self.assertEqual(a_rect.bottomright, Point(4.0, 2.0))
+        self.assertEqual(a_rect.center, Point(2.0, 1.0))
+        self.assertEqual(a_rect.midleft, Point(0.0, 1.0))
+        self.assertEqual(a_rect.midtop, Point(2.0, 0.0))
+        self.assertEqual((a_rect.width, a_rect.height), (4.0, 2.0))
+        self.assertIs(a_rect.center, a_rect.center)
+        a_rect.set_points(pt1=Point(x=10.0, y=10.0), pt2=Point(x=12.0, y=14.0))
+        self.assertEqual(a_rect.center, Point(11.0, 12.0))
+        self.assertEqual(a_rect.expanded_by(1), Rect(
+            direction=CoordinatesDirection.SCREEN_DIRECTION,
+            pt1=Point(x=9.0, y=9.0),
+            pt2=Point(x=13.0, y=15.0)))
+        self.assertFalse(hasattr(a_rect, '__dict__'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.snapping import deduplicate, grid_cells, snap_to_grid
+
+
+class UnitTestSnapping(unittest.TestCase):
+    def test_grid_cells(self):
+        points = PointArray([(0.24, 0.26), (-0.26, 1.0), (0.25, 0.75)])
+        self.assertEqual(grid_cells(points, 0.5).tolist(), [[0, 1], [-1, 2], [0, 2]])
+        self.assertEqual(grid_cells(points, 0.5, origin=Point(0.25, 0.25)).tolist(), [[0, 0], [-1, 2], [0, 1]])
+        with self.assertRaises(ValueError):
+            grid_cells(points, 0.0)
+        with self.assertRaises(ValueError):
+            grid_cells([(float('nan'), 0.0)], 1.0)
+        with self.assertRaises(ValueError):
+            grid_cells([(1e300, 0.0)], 1e-3)
+
+    def test_snap_to_grid(self):
+        snapped = snap_to_grid(PointArray([(1.1, 2.9), (-0.4, 0.6)]), 0.5, origin=(0.1, 0.0))
+        self.assertIsInstance(snapped, PointArray)
+        np.testing.assert_allclose(snapped.coords, [[1.1, 3.0], [-0.4, 0.5]])
+        self.assertEqual(len(snap_to_grid(PointArray([]), 1.0)), 0)
+
+    def test_deduplicate(self):
+        points = PointArray([(1.0, 1.0), (5.0, 5.0), (1.0001, 0.9999), (5.0002, 5.0), (9.0, 0.0), (1.0, 1.0)])
+        unique, inverse = deduplicate(points, 1e-3)
+        self.assertEqual(unique.coords.tolist(), [[1.0, 1.0], [5.0, 5.0], [9.0, 0.0]])
+        self.assertEqual(inverse.tolist(), [0, 1, 0, 1, 2, 0])
+        np.testing.assert_allclose(unique.coords[inverse], points.coords, atol=1e-3)
+
+    def test_deduplicate_snapped(self):
+        unique, inverse = deduplicate(np.array([(0.9, 2.1), (1.2, 1.8), (3.4, 0.0)]), 1.0, snap=True)
+        self.assertEqual(unique.coords.tolist(), [[1.0, 2.0], [3.0, 0.0]])
+        self.assertEqual(inverse.tolist(), [0, 0, 1])
+
+    def test_deduplicate_agrees_with_grid_cells(self):
+        rng = np.random.default_rng(3)
+        coords = rng.random((2000, 2)) * 10
+        unique, inverse = deduplicate(coords, 0.5)
+        cells = grid_cells(coords, 0.5)
+        self.assertEqual(len(unique), len({tuple(cell) for cell in cells.tolist()}))
+        np.testing.assert_array_equal(grid_cells(unique, 0.5)[inverse], cells)
+
+    def test_deduplicate_far_apart(self):
+        """Cells too far apart to be packed in one key."""
+        points = PointArray([(0.0, 0.0), (1e12, -1e12), (0.0, 0.0)])
+        unique, inverse = deduplicate(points, 1e-3)
+        self.assertEqual(unique.coords.tolist(), [[0.0, 0.0], [1e12, -1e12]])
+        self.assertEqual(inverse.tolist(), [0, 1, 0])
+
+    def test_deduplicate_empty(self):
+        unique, inverse = deduplicate(PointArray([]), 1.0)
+        self.assertEqual(len(unique), 0)
+        self.assertEqual(len(inverse), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for the spatial hash grid.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+import numpy as np
+
+from random import random
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.spatial_hash import SpatialHashGrid
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+    """Tests SpatialHashGrid definition."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.points = [Point(random() * 100 - 50, random() * 100 - 50) for _ in range(300)]
+        self.grid = SpatialHashGrid(cell_size=7.0, capacity=16)
+        for an_id, a_point in enumerate(self.points):
+            self.grid.insert(an_id, a_point)
+
+    def within(self, a_point, radius):
+        return {i for i, p in enumerate(self.points) if p.distance_to(a_point) <= radius}
+
+    def test_radius_queries(self):
+        self.assertEqual(len(self.grid), len(self.points))
+        for _ in range(20):
+            a_point = Point(random() * 100 - 50, random() * 100 - 50)
+            radius = random() * 15
+            self.assertEqual(set(self.grid.query_radius(a_point, radius).tolist()), self.within(a_point, radius))
+        self.assertEqual(set(self.grid.neighbours(0, 10).tolist()), self.within(self.points[0], 10) - {0})
+
+    def test_move_and_remove(self):
+        self.grid.move(3, Point(1000, 1000))
+        self.assertEqual(self.grid.position(3), Point(1000, 1000))
+        self.assertEqual(self.grid.query_radius(Point(1000, 1000), 1).tolist(), [3])
+        self.grid.remove(3)
+        self.assertNotIn(3, self.grid)
+        self.assertEqual(len(self.grid.query_radius(Point(1000, 1000), 1)), 0)
+        with self.assertRaises(KeyError):
+            self.grid.remove(3)
+
+    def test_rect_queries(self):
+        for direction in CoordinatesDirection:
+            a_rect = Rect(direction=direction, pt1=Point(-10, -20), pt2=Point(15, 5))
+            expected = {i for i, p in enumerate(self.points) if a_rect.contains(p)}
+            self.assertEqual(set(self.grid.query_rect(a_rect).tolist()), expected)
+        everything = Rect(direction=CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(-1e6, -1e6), pt2=Point(1e6, 1e6))
+        self.assertEqual(len(self.grid.query_rect(everything)), len(self.points))
+
+    def test_rebucket(self):
+        coords = np.array([p.as_tuple() for p in self.points])
+        coords += np.random.normal(size=coords.shape) * 5
+        self.grid.rebucket(coords)
+        self.points = [Point(x, y) for (x, y) in coords.tolist()]
+        self.assertEqual(len(self.grid), len(self.points))
+        for _ in range(10):
+            a_point = Point(random() * 100 - 50, random() * 100 - 50)
+            self.assertEqual(set(self.grid.query_radius(a_point, 8).tolist()), self.within(a_point, 8))
+
+    def test_neighbour_pairs(self):
+        self.grid.remove(5)
+        del self.points[5]
+        ids = [i for i in range(len(self.points) + 1) if i != 5]
+        for radius in (5, 10, 20):
+            expected = {(ids[i], ids[j]) for i in range(len(self.points)) for j in range(i + 1, len(self.points))
+                        if self.points[i].distance_to(self.points[j]) <= radius}
+            firsts, seconds = self.grid.neighbour_pairs(radius)
+            self.assertEqual(len(firsts), len(expected))
+            self.assertEqual(set(zip(firsts.tolist(), seconds.tolist())), expected)
+        candidates = set(zip(*[some_ids.tolist() for some_ids in self.grid.neighbour_pairs(20, exact=False)]))
+        self.assertTrue(expected <= candidates)
+        self.assertEqual([len(some_ids) for some_ids in SpatialHashGrid(cell_size=1.0).neighbour_pairs(1.0)], [0, 0])
+
+    def test_invalid_ids(self):
+        for an_id in (-1, 1.0, "1", None, True):
+            with self.assertRaises(ValueError):
+                self.grid.insert(an_id, Point(0, 0))
+        self.assertEqual(len(self.grid), len(self.points))
+        self.grid.insert(np.int64(400), Point(0, 0))
+        self.assertIn(400, self.grid)
+
+    def test_far_positions(self):
+        """Keys are packed the same way one id at a time and in bulk; cells must fit in 32 bits."""
+        a_grid = SpatialHashGrid(cell_size=1e-6)
+        a_grid.insert(0, Point(-1e3, 1e3))
+        a_grid.rebucket(np.array([[-1e3, 1e3], [1e3, -1e3]]))
+        self.assertEqual(len(a_grid), 2)
+        self.assertEqual(a_grid.query_radius(Point(-1e3, 1e3), 1e-6).tolist(), [0])
+        a_grid.move(1, Point(-1e3, 1e3))
+        self.assertEqual(sorted(a_grid.query_radius(Point(-1e3, 1e3), 1e-6).tolist()), [0, 1])
+        with self.assertRaises(ValueError):
+            SpatialHashGrid(cell_size=1e-9).insert(0, Point(1e3, 0))
+        with self.assertRaises(ValueError):
+            SpatialHashGrid(cell_size=1e-9).rebucket(np.array([[1e3, 0.0]]))
+        with self.assertRaises(ValueError):
+            a_grid.move(0, Point(float('nan'), 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
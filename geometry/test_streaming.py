@@ -0,0 +1,107 @@
+import math
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+
+from random import randint
+from geometry import binary_io
+from geometry.angle import AngleInRadians
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import FrozenPoint, Point
+from geometry.point_array import PointArray
+from geometry.shapes import Rect
+from geometry.streaming import (csv_chunks, csv_points, binary_chunks, iterable_chunks, rechunk,
+                                Pipeline, Mapping, ClipToRect, Dedup, Downsample)
+from geometry.transform import Transform2D
+
+
+def all_points(chunks):
+    return [a_point for a_chunk in chunks for a_point in a_chunk]
+
+
+class UnitTestStreaming(unittest.TestCase):
+    def setUp(self):
+        """Points on a small grid, so that there are duplicates; saved as CSV and as binary."""
+        self.points = [Point(float(randint(0, 20)), float(randint(0, 20))) for _ in range(1000)]
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "points.csv")
+        with open(self.csv_path, "w") as a_file:
+            a_file.write("t,x,y\n")
+            for i, a_point in enumerate(self.points):
+                a_file.write("%d,%r,%r\n" % (i, a_point.x, a_point.y))
+                if i % 100 == 0:
+                    a_file.write("\n# a comment\n")
+        self.binary_path = os.path.join(self.directory, "points.bin")
+        binary_io.write_points(self.binary_path, self.points)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_readers(self):
+        for chunks in (csv_chunks(self.csv_path, chunk_size=64, columns=(1, 2), skip_rows=1),
+                       binary_chunks(self.binary_path, chunk_size=64),
+                       iterable_chunks(self.points, chunk_size=64),
+                       iterable_chunks((a_point.as_tuple() for a_point in self.points), chunk_size=64)):
+            chunks = list(chunks)
+            self.assertTrue(all(isinstance(a_chunk, PointArray) and len(a_chunk) <= 64 for a_chunk in chunks))
+            self.assertEqual(all_points(chunks), self.points)
+        self.assertEqual(list(csv_points(self.csv_path, columns=(1, 2), skip_rows=1)), self.points)
+
+    def test_csv_comments(self):
+        """Comments and blank lines don't count in the chunk size, and inline comments are ignored."""
+        a_path = os.path.join(self.directory, "commented.csv")
+        with open(a_path, "w") as a_file:
+            a_file.write("# only comments and blanks first\n" + "#\n\n" * 10)
+            for i, a_point in enumerate(self.points[:100]):
+                a_file.write("%r,%r  # point %d\n" % (a_point.x, a_point.y, i))
+                if i % 7 == 0:
+                    a_file.write("# a comment\n\n" * 5)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            chunks = list(csv_chunks(a_path, chunk_size=8))
+        self.assertEqual([len(a_chunk) for a_chunk in chunks], [8] * 12 + [4])
+        self.assertEqual(all_points(chunks), self.points[:100])
+        self.assertEqual(list(csv_points(a_path)), self.points[:100])
+
+    def test_rechunk(self):
+        chunks = list(rechunk(iterable_chunks(self.points, chunk_size=7), chunk_size=50))
+        self.assertEqual([len(a_chunk) for a_chunk in chunks], [50] * 20)
+        self.assertEqual(all_points(chunks), self.points)
+
+    def test_stages_do_not_depend_on_chunking(self):
+        """Chunk by chunk, with any chunk size, gives the same as point by point."""
+        a_transform = Transform2D.rotation(AngleInRadians(math.pi / 2), about=Point(10, 10)).translated(1, 0)
+        a_rect = Rect(CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(3, 2), pt2=Point(16, 18))
+        for a_pipeline in (Pipeline([Mapping(a_transform), ClipToRect(a_rect), Dedup(), Downsample(3)]),
+                           Pipeline([Dedup(consecutive_only=True), Downsample(2)]),
+                           Pipeline([Downsample(5), Dedup()])):
+            expected = list(a_pipeline.run_points(self.points))
+            self.assertTrue(0 < len(expected) < len(self.points))
+            for chunk_size in (1, 13, 1000):
+                obtained = all_points(a_pipeline.run(iterable_chunks(self.points, chunk_size=chunk_size)))
+                self.assertEqual(len(obtained), len(expected))
+                for a_point, expected_point in zip(obtained, expected):
+                    self.assertAlmostEqual(a_point.distance_to(expected_point), 0.0)
+
+    def test_frozen_points(self):
+        """Point by point, frozen points go through the stages and stay frozen."""
+        a_transform = Transform2D.rotation(AngleInRadians(math.pi / 2), about=Point(10, 10)).translated(1, 0)
+        a_pipeline = Pipeline([Mapping(a_transform), Dedup()])
+        frozen = list(a_pipeline.run_points([a_point.frozen() for a_point in self.points]))
+        self.assertTrue(all(isinstance(a_point, FrozenPoint) for a_point in frozen))
+        self.assertEqual(frozen, list(a_pipeline.run_points(self.points)))
+
+    def test_dedup(self):
+        kept = all_points(Pipeline([Dedup()]).run(iterable_chunks(self.points, chunk_size=100)))
+        self.assertEqual(kept, list(dict.fromkeys(self.points)))
+        repeated = [Point(0, 0), Point(0, 0), Point(1, 0), Point(0, 0)]
+        kept = all_points(Pipeline([Dedup(consecutive_only=True)]).run(iterable_chunks(repeated, chunk_size=1)))
+        self.assertEqual(kept, [Point(0, 0), Point(1, 0), Point(0, 0)])
+        with self.assertRaises(ValueError):
+            Downsample(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for sweep-and-prune.
+
+Overlapping pairs are checked against pairwise Rect.overlaps, frame after frame.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import unittest
+
+from random import random
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import Point
+from geometry.shapes import Rect
+from geometry.sweep_and_prune import SweepAndPrune
+
+
+def a_rect_at(x, y, width, height):
+    return Rect(direction=CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(x, y), pt2=Point(x + width, y + height))
+
+
+def brute_force_pairs(rects):
+    return {(i, j) for i in range(len(rects)) for j in range(i + 1, len(rects))
+            if rects[i] is not None and rects[j] is not None and rects[i].overlaps(rects[j])}
+
+
+class TestSweepAndPrune(unittest.TestCase):
+    """Tests SweepAndPrune definition."""
+
+    def setUp(self):
+        """
+        Creates proper structures to test.
+        Returns:
+
+        """
+        self.rects = [a_rect_at(random() * 100, random() * 100, random() * 10, random() * 10) for _ in range(150)]
+        self.engine = SweepAndPrune(self.rects)
+
+    def test_initial_pairs(self):
+        self.assertEqual(self.engine.pairs, brute_force_pairs(self.rects))
+        self.assertEqual(self.engine.update(), (set(), set()))
+
+    def test_frames(self):
+        """Rects move a little each frame; events account for all the changes."""
+        for _ in range(10):
+            before = set(self.engine.pairs)
+            for handle, a_rect in enumerate(self.rects):
+                moved = a_rect_at(a_rect.left + random() * 4 - 2, a_rect.top + random() * 4 - 2,
+                                  a_rect.width, a_rect.height)
+                self.rects[handle] = moved
+                self.engine.move(handle, moved)
+            added, removed = self.engine.update()
+            self.assertEqual(self.engine.pairs, brute_force_pairs(self.rects))
+            self.assertEqual(added, self.engine.pairs - before)
+            self.assertEqual(removed, before - self.engine.pairs)
+
+    def test_add_and_remove(self):
+        handle = self.engine.add(a_rect_at(0, 0, 100, 100))
+        self.rects.append(a_rect_at(0, 0, 100, 100))
+        added, removed = self.engine.update()
+        self.assertEqual(self.engine.pairs, brute_force_pairs(self.rects))
+        self.assertTrue(all(handle in pair for pair in added))
+        self.engine.remove(handle)
+        self.rects[handle] = None
+        added, removed = self.engine.update()
+        self.assertEqual(self.engine.pairs, brute_force_pairs(self.rects))
+        self.assertTrue(all(handle in pair for pair in removed))
+        self.assertEqual(len(self.engine), len(self.rects) - 1)
+
+    def test_bounds_arrays(self):
+        """Compact arrays of bounds, in anti-screen direction (top above bottom)."""
+        lefts = [a_rect.left for a_rect in self.rects]
+        rights = [a_rect.right for a_rect in self.rects]
+        tops = [a_rect.bottom for a_rect in self.rects]
+        bottoms = [a_rect.top for a_rect in self.rects]
+        engine = SweepAndPrune.from_bounds(lefts, rights, tops, bottoms)
+        self.assertEqual(engine.pairs, self.engine.pairs)
+        shifted = [x + 50 for x in lefts]
+        engine.set_bounds(shifted, [x + 50 for x in rights], tops, bottoms)
+        engine.update()
+        self.assertEqual(engine.pairs, self.engine.pairs)
+
+    def test_touching_rects_do_not_overlap(self):
+        engine = SweepAndPrune([a_rect_at(0, 0, 1, 1), a_rect_at(1, 0, 1, 1)])
+        self.assertEqual(engine.pairs, set())
+        engine.move(1, a_rect_at(0.5, 0, 1, 1))
+        self.assertEqual(engine.update(), ({(0, 1)}, set()))
+        engine.move(1, a_rect_at(1, 0, 1, 1))
+        self.assertEqual(engine.update(), (set(), {(0, 1)}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Unit Tests for affine transformations.
+
+Attributes:
+    None
+
+TODO:
+
+"""
+
+import math
+import unittest
+
+from random import random
+from geometry.angle import AngleInRadians
+from geometry.coordinates import CoordinatesDirection
+from geometry.point import FrozenPoint, Point
+from geometry.point_array import PointArray
+from geometry.shapes import Rect
+from geometry.transform import Transform2D
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+
+
+class TestTransform2D(unittest.TestCase):
+    """Tests Transform2D definition."""
+
+    def assertPointsAlmostEqual(self, a_pt, another_pt):
+        self.assertAlmostEqual(a_pt.x, another_pt.x)
+        self.assertAlmostEqual(a_pt.y, another_pt.y)
+
+    def test_chain_is_fused(self):
+        """rotate -> translate -> scale, as one transformation."""
+        an_angle = AngleInRadians(random() * 2 * math.pi)
+        a_transform = Transform2D.rotation(an_angle).translated(3, -1).scaled(2)
+        for _ in range(10):
+            a_pt = Point(random() * 10, random() * 10)
+            expected = (a_pt.rotate(an_angle.value) + Point(3, -1)) * 2
+            self.assertPointsAlmostEqual(a_transform.apply(a_pt), expected)
+
+    def test_rotation_about(self):
+        """Rotation around a point agrees with the scalar one."""
+        center = Point(2, 3)
+        a_transform = Transform2D.rotation(math.pi / 2, about=center)
+        self.assertPointsAlmostEqual(a_transform.apply(Point(3, 3)), Point(2, 4))
+        self.assertPointsAlmostEqual(a_transform.apply(center), center)
+
+    def test_frozen_point(self):
+        a_transform = Transform2D.rotation(math.pi / 2, about=Point(2, 3)).translated(1, 0)
+        transformed = a_transform.apply(FrozenPoint(3, 3))
+        self.assertIsInstance(transformed, FrozenPoint)
+        self.assertPointsAlmostEqual(transformed, a_transform.apply(Point(3, 3)))
+
+    def test_vectors_ignore_translation(self):
+        an_angle = AngleInRadians(1.0)
+        a_transform = Transform2D.rotation(an_angle).translated(5, 5)
+        a_vector = Vec2d(1, 2)
+        self.assertPointsAlmostEqual(a_transform.apply(a_vector), a_vector.rotated_radians(an_angle))
+
+    def test_bulk_matches_scalar(self):
+        a_transform = Transform2D.rotation(0.3).translated(1, 2).scaled(1.5, 0.5)
+        points = [Point(random(), random()) for _ in range(20)]
+        transformed = a_transform.apply(PointArray.from_points(points))
+        for a_pt, transformed_pt in zip(points, transformed):
+            self.assertPointsAlmostEqual(a_transform.apply(a_pt), transformed_pt)
+        vectors = Vec2dArray.from_vectors([Vec2d(random(), random()) for _ in range(20)])
+        transformed = a_transform.apply(vectors)
+        for a_vector, transformed_vector in zip(vectors, transformed):
+            self.assertPointsAlmostEqual(a_transform.apply(a_vector), transformed_vector)
+
+    def test_inverse(self):
+        a_transform = Transform2D.rotation(0.7).translated(-3, 4).scaled(2, 3)
+        a_pt = Point(random(), random())
+        self.assertPointsAlmostEqual(a_transform.inverse().apply(a_transform.apply(a_pt)), a_pt)
+        with self.assertRaises(ValueError):
+            Transform2D.scaling(0).inverse()
+
+    def test_rect_corners(self):
+        a_rect = Rect(direction=CoordinatesDirection.SCREEN_DIRECTION, pt1=Point(0, 0), pt2=Point(2, 1))
+        corners = Transform2D.translation(1, 1).apply(a_rect)
+        self.assertEqual(corners.to_points(), [Point(1, 1), Point(3, 1), Point(3, 2), Point(1, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
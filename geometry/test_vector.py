@@ -208,3 +208,22 @@ class UnitTestVec2D(unittest.TestCase):
             scale_to = randint(1, 30)
             new_vector = a_vector.scaled_to_norm(new_norm = scale_to)
             self.assertAlmostEqual(new_vector.norm(), scale_to)
+
+    def test_into_variants(self):
+        """Allocation-free versions agree with the operators."""
+        v, w, out = Vec2d(3, 4), Vec2d(-1, 2), Vec2d(0, 0)
+        self.assertIs(v.add_into(w, out), out)
+        self.assertEqual(out, v + w)
+        self.assertEqual(v.sub_into(w, out), v - w)
+        self.assertEqual(v.scale_into(2.5, out), v * 2.5)
+        self.assertEqual(Vec2d.axpy(2, v, w, out), v * 2 + w)
+        self.assertEqual(v.lerp_into(w, 0.25, out), v.interpolate_to(w, 0.25))
+        self.assertIs(v.normalize_into(out), out)
+        self.assertEqual(out, v.normalized())
+        self.assertEqual(NULL_VECTOR.normalize_into(out), NULL_VECTOR)
+        # a Point can be the destination (or an operand):
+        a_pt = Point(0, 0)
+        Vec2d.axpy(0.5, v, Point(1, 1), a_pt)
+        self.assertEqual(a_pt, Point(2.5, 3))
+        v /= 2
+        self.assertEqual(v, Vec2d(1.5, 2))
@@ -0,0 +1,106 @@
+import math
+import unittest
+
+import numpy as np
+
+from random import random
+from geometry.angle import AngleInRadians
+from geometry.vector import Vec2d, X_UNIT_VECTOR, Y_UNIT_VECTOR
+from geometry.vector_array import Vec2dArray
+
+
+####################################################################
+class UnitTestVec2dArray(unittest.TestCase):
+    def setUp(self):
+        self.vectors = [Vec2d(random() * 20 - 10, random() * 20 - 10) for _ in range(25)]
+        self.others = [Vec2d(random() * 20 - 10, random() * 20 - 10) for _ in range(25)]
+        self.v_array = Vec2dArray.from_vectors(self.vectors)
+        self.o_array = Vec2dArray.from_vectors(self.others)
+
+    def assertVectorsAlmostEqual(self, v_array, vectors):
+        self.assertEqual(len(v_array), len(vectors))
+        for a_vector, expected in zip(v_array, vectors):
+            self.assertAlmostEqual(a_vector.x, expected.x)
+            self.assertAlmostEqual(a_vector.y, expected.y)
+
+    def testIndexing(self):
+        self.assertIsInstance(self.v_array[0], Vec2d)
+        self.assertEqual(self.v_array[4], self.vectors[4])
+        self.assertEqual(self.v_array[1:3].to_vectors(), self.vectors[1:3])
+
+    def testScalarResults(self):
+        """Operations returning one number per vector."""
+        other = Vec2d(2, -3)
+        for i, (a_vector, another) in enumerate(zip(self.vectors, self.others)):
+            self.assertAlmostEqual(self.v_array.dot(other)[i], a_vector.dot(other))
+            self.assertAlmostEqual(self.v_array.dot(self.o_array)[i], a_vector.dot(another))
+            self.assertAlmostEqual(self.v_array.cross(self.o_array)[i], a_vector.cross(another))
+            self.assertAlmostEqual(self.v_array.get_dist_sqrd(self.o_array)[i], a_vector.get_dist_sqrd(another))
+            self.assertAlmostEqual(self.v_array.get_length()[i], a_vector.get_length())
+
+    def testVectorResults(self):
+        """Operations returning one vector per vector."""
+        self.assertVectorsAlmostEqual(self.v_array.normalized(), [v.normalized() for v in self.vectors])
+        self.assertVectorsAlmostEqual(self.v_array.perpendicular(), [v.perpendicular() for v in self.vectors])
+        self.assertVectorsAlmostEqual(
+            self.v_array.projection(self.o_array),
+            [v.projection(o) for v, o in zip(self.vectors, self.others)])
+        self.assertVectorsAlmostEqual(
+            self.v_array.interpolate_to(self.o_array, 0.3),
+            [v.interpolate_to(o, 0.3) for v, o in zip(self.vectors, self.others)])
+        x_basis, y_basis = Vec2d(2, 0), Vec2d(1, 1)
+        self.assertVectorsAlmostEqual(
+            self.v_array.convert_to_basis(x_basis, y_basis),
+            [v.convert_to_basis(x_basis, y_basis) for v in self.vectors])
+        self.assertVectorsAlmostEqual(self.v_array * 3 + X_UNIT_VECTOR, [v * 3 + X_UNIT_VECTOR for v in self.vectors])
+        self.assertVectorsAlmostEqual(self.v_array - Y_UNIT_VECTOR, [v - Y_UNIT_VECTOR for v in self.vectors])
+
+    def testAngles(self):
+        """Batch angles agree with the ones of Vec2d."""
+        angles = self.v_array.angle_with_positive_x_axis()
+        angles_to = self.v_array.angle_to(self.o_array)
+        for i, (a_vector, another) in enumerate(zip(self.vectors, self.others)):
+            self.assertAlmostEqual(angles[i], a_vector.angle_with_positive_x_axis().value)
+            self.assertAlmostEqual(
+                AngleInRadians(angles_to[i]), a_vector.angle_to(another))
+        self.assertTrue(((angles >= 0) & (angles < 2 * math.pi)).all())
+        axes = Vec2dArray([(0, 0), (1, 0), (0, 1), (-1, 0), (0, -1)]).angle_with_positive_x_axis()
+        for an_angle, expected in zip(axes, [0, 0, AngleInRadians.PI_HALF, AngleInRadians.PI,
+                                             AngleInRadians.THREE_HALFS_OF_PI]):
+            self.assertAlmostEqual(an_angle, expected)
+        # null vectors, signed zeros included, give 0 like Vec2d
+        null_vectors = -Vec2dArray([(0, 0), (0.0, -0.0)])
+        self.assertEqual(null_vectors.angle_with_positive_x_axis().tolist(), [0.0, 0.0])
+        self.assertEqual(Vec2d(-0.0, -0.0).angle_with_positive_x_axis().value, 0.0)
+        self.assertEqual(null_vectors.angle_to(Vec2d(0, 1)).tolist(), [math.pi / 2] * 2)
+        # going from a vector to itself (or a colineal one) sweeps nothing:
+        swept = self.v_array.angle_to(self.v_array * 10)
+        self.assertTrue((np.minimum(swept, 2 * math.pi - swept) < 1e-9).all())
+
+    def testNullVectorNormalization(self):
+        self.assertEqual(Vec2dArray([(0, 0)]).normalized()[0], Vec2d(0, 0))
+
+    def testOneScalarPerVector(self):
+        """Per-vector scalars go through scaled_each or a (N, 1) array, whatever N is."""
+        for n in (2, 3):
+            v_array = Vec2dArray([(1, 0)] * n)
+            scalars = np.arange(2., 2. + n)
+            expected = [[s, 0] for s in scalars.tolist()]
+            self.assertEqual(v_array.scaled_each(scalars).coords.tolist(), expected)
+            self.assertEqual(v_array.scaled_to_norm(scalars).coords.tolist(), expected)
+            self.assertEqual((v_array * scalars[:, np.newaxis]).coords.tolist(), expected)
+            self.assertEqual((v_array / (1 / scalars[:, np.newaxis])).coords.tolist(), expected)
+
+    def testPairOperandIsOneVector(self):
+        """Like Vec2d, a pair is one vector for every operator, even with 2 vectors in the array."""
+        for n in (2, 3):
+            v_array = Vec2dArray([(1, 1)] * n)
+            for a_vector in (Vec2d(2, 3), (2, 3), [2, 3], np.array([2., 3.]), np.array([[2., 3.]])):
+                self.assertEqual((v_array * a_vector).coords.tolist(), [[2, 3]] * n)
+                self.assertEqual((v_array + a_vector).coords.tolist(), [[3, 4]] * n)
+                self.assertEqual((v_array / a_vector).coords.tolist(), [[0.5, 1 / 3]] * n)
+            self.assertEqual(((2, 3) * v_array).coords.tolist(), [[2, 3]] * n)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Affine transformations of the plane.
+
+Transform2D  -- 3x3 affine matrix, composable and applicable in bulk
+
+A chain like "rotate, then translate, then scale" is fused into a single
+matrix; applying it to N points is then one matrix multiply, with the sin/cos
+of the rotation computed once when the transform is built.
+
+    >>> t = Transform2D.rotation(AngleInRadians(math.pi / 2)).translated(1, 0).scaled(2)
+    >>> t.apply(Point(1, 0))
+    Point(2.0, 2.0)
+"""
+
+import math
+
+import numpy as np
+
+from geometry.angle import Angle, AngleInRadians
+from geometry.point import FrozenPoint, Point
+from geometry.point_array import PointArray
+from geometry.shapes import Rect
+from geometry.vector import Vec2d
+from geometry.vector_array import Vec2dArray
+
+
+class Transform2D(object):
+    """An affine transformation, stored as a 3x3 matrix in homogeneous coordinates.
+
+    identity, translation, rotation, scaling  -- building blocks
+    compose  -- matrix product (the argument is applied first)
+    then  -- chain another transformation after this one
+    translated, rotated, scaled  -- shortcuts for 'then'
+    inverse  -- the transformation that undoes this one
+    apply  -- transform a Point, Vec2d, PointArray, Vec2dArray or the corners of a Rect
+    """
+
+    __slots__ = ['matrix']
+
+    def __init__(self, matrix=None):
+        """
+        Initializes a transformation.
+        :param matrix: 3x3 matrix (last row must be (0, 0, 1)); identity if not given.
+        """
+        if matrix is None:
+            matrix = np.eye(3)
+        matrix = np.array(matrix, dtype=np.float64)
+        if matrix.shape != (3, 3):
+            raise ValueError("Expected a 3x3 matrix, got shape %s" % (matrix.shape,))
+        if not np.array_equal(matrix[2], (0.0, 0.0, 1.0)):
+            raise ValueError("Not an affine matrix: last row is %s" % (matrix[2],))
+        self.matrix = matrix
+
+    @classmethod
+    def identity(cls):
+        return cls()
+
+    @classmethod
+    def translation(cls, dx: float, dy: float):
+        """Moves everything by (dx, dy)."""
+        return cls(((1.0, 0.0, dx),
+                    (0.0, 1.0, dy),
+                    (0.0, 0.0, 1.0)))
+
+    @classmethod
+    def rotation(cls, angle, about: Point = None):
+        """
+        Counter-clockwise rotation (positive y goes *up*, as in Point.rotate).
+        :param angle: an Angle, or a float in radians.
+        :param about: center of the rotation; origin if not given.
+        """
+        if isinstance(angle, Angle):
+            a_cosinus, a_sinus = angle.cos_sin()
+        else:
+            a_cosinus, a_sinus = math.cos(angle), math.sin(angle)
+        a_rotation = cls(((a_cosinus, -a_sinus, 0.0),
+                          (a_sinus, a_cosinus, 0.0),
+                          (0.0, 0.0, 1.0)))
+        return a_rotation._about(about)
+
+    @classmethod
+    def scaling(cls, sx: float, sy: float = None, about: Point = None):
+        """Scales by 'sx' on x and 'sy' (defaults to 'sx') on y, keeping 'about' (or the origin) fixed."""
+        if sy is None:
+            sy = sx
+        a_scaling = cls(((sx, 0.0, 0.0),
+                         (0.0, sy, 0.0),
+                         (0.0, 0.0, 1.0)))
+        return a_scaling._about(about)
+
+    def _about(self, a_point):
+        """Same transformation, but keeping 'a_point' (instead of the origin) fixed."""
+        if a_point is None:
+            return self
+        return Transform2D.translation(-a_point.x, -a_point.y).then(self).translated(a_point.x, a_point.y)
+
+    def compose(self, other):
+        """Transformation that applies 'other' first, then this one."""
+        return Transform2D(self.matrix @ other.matrix)
+
+    __matmul__ = compose
+
+    def then(self, other):
+        """Transformation that applies this one first, then 'other'."""
+        return other.compose(self)
+
+    def translated(self, dx: float, dy: float):
+        return self.then(Transform2D.translation(dx, dy))
+
+    def rotated(self, angle, about: Point = None):
+        return self.then(Transform2D.rotation(angle, about=about))
+
+    def scaled(self, sx: float, sy: float = None, about: Point = None):
+        return self.then(Transform2D.scaling(sx, sy, about=about))
+
+    def inverse(self):
+        """The transformation that undoes this one."""
+        (a, b, tx), (c, d, ty) = self.matrix[:2].tolist()
+        determinant = a * d - b * c
+        if determinant == 0:
+            raise ValueError("Transformation is not invertible")
+        inv_a, inv_b, inv_c, inv_d = d / determinant, -b / determinant, -c / determinant, a / determinant
+        return Transform2D(((inv_a, inv_b, -(inv_a * tx + inv_b * ty)),
+                            (inv_c, inv_d, -(inv_c * tx + inv_d * ty)),
+                            (0.0, 0.0, 1.0)))
+
+    def apply(self, something):
+        """
+        Transforms a geometric object.
+        Points are fully transformed; vectors are directions, so translations leave them unchanged.
+        :param something: a Point, FrozenPoint, Vec2d, PointArray, Vec2dArray, Rect or (N, 2) array of point coordinates.
+        :return: an object of the same kind; for a Rect, a PointArray with its transformed corners
+            (topleft, topright, bottomright, bottomleft), as the result might not be axis-aligned.
+        """
+        if isinstance(something, Vec2dArray):
+            return Vec2dArray(self._apply_linear(something.coords))
+        if isinstance(something, PointArray):
+            return PointArray(self.apply_to_coords(something.coords))
+        if isinstance(something, Vec2d):
+            (a, b, _), (c, d, _) = self.matrix[:2].tolist()
+            return Vec2d(a * something.x + b * something.y, c * something.x + d * something.y)
+        if isinstance(something, Point):
+            (a, b, tx), (c, d, ty) = self.matrix[:2].tolist()
+            return Point(a * something.x + b * something.y + tx, c * something.x + d * something.y + ty)
+        if isinstance(something, FrozenPoint):
+            (a, b, tx), (c, d, ty) = self.matrix[:2].tolist()
+            return FrozenPoint(a * something.x + b * something.y + tx, c * something.x + d * something.y + ty)
+        if isinstance(something, Rect):
+            corners = np.array(((something.left, something.top), (something.right, something.top),
+                                (something.right, something.bottom), (something.left, something.bottom)))
+            return PointArray(self.apply_to_coords(corners))
+        if isinstance(something, np.ndarray):
+            return self.apply_to_coords(something)
+        raise TypeError("Don't know how to transform a %s" % (type(something).__name__))
+
+    def apply_to_coords(self, coords: np.ndarray) -> np.ndarray:
+        """Transforms a (N, 2) array of point coordinates; returns a new array."""
+        result = self._apply_linear(coords)
+        result += self.matrix[:2, 2]
+        return result
+
+    def _apply_linear(self, coords: np.ndarray) -> np.ndarray:
+        return coords @ self.matrix[:2, :2].T
+
+    def __eq__(self, other):
+        return isinstance(other, Transform2D) and np.array_equal(self.matrix, other.matrix)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.matrix.tolist())
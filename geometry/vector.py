@@ -6,8 +6,8 @@
 
 import math
 import operator
-import numpy as np
 
+from geometry import scalar
 from geometry.point import Point
 from geometry.angle import AngleInRadians
 
@@ -37,25 +37,11 @@ class Vec2d(object):
 
     @classmethod
     def from_angle(cls, angle_in_radians: AngleInRadians):
-        return cls(x_or_pair=(angle_in_radians.cos(), angle_in_radians.sin()))
+        return cls(x_or_pair=angle_in_radians.cos_sin())
 
     def angle_with_positive_x_axis(self) -> AngleInRadians:
-        """Returns the angle this vector makes with the X+ axis."""
-        if self.x == 0:
-            if self.y == 0:
-                return AngleInRadians(0)
-            elif self.y > 0:
-                return AngleInRadians(AngleInRadians.PI_HALF)
-            else:
-                return AngleInRadians(AngleInRadians.THREE_HALFS_OF_PI)
-        else:
-            the_value = np.arctan(self.y / self.x)
-            if self.x < 0:
-                the_value += AngleInRadians.PI
-            else:
-                the_value += 2 * AngleInRadians.PI
-            a_in_rads = AngleInRadians(the_value)
-            return a_in_rads
+        """Returns the angle this vector makes with the X+ axis (0 for the null vector)."""
+        return AngleInRadians(scalar.angle_with_positive_x_axis(self.x, self.y))
 
     def angle_to(self, another_vector) -> AngleInRadians:
         """Returns angle that I sweep when I go from 'me' to another vector."""
@@ -231,7 +217,7 @@ class Vec2d(object):
     def __rtruediv__(self, other):
         return self._r_o2(other, operator.truediv)
     def __itruediv__(self, other):
-        return self._io(other, operator.floordiv)
+        return self._io(other, operator.truediv)
 
     # Modulo
     def __mod__(self, other):
@@ -288,10 +274,10 @@ class Vec2d(object):
 
     # vectory functions
     def get_length_sqrd(self):
-        return self.x**2 + self.y**2
+        return scalar.norm_sqrd(self.x, self.y)
 
     def get_length(self):
-        return math.sqrt(self.x**2 + self.y**2)
+        return scalar.norm(self.x, self.y)
     def __setlength(self, value):
         length = self.get_length()
         self.x *= value/length
@@ -314,9 +300,7 @@ class Vec2d(object):
 
     def rotate_radians(self, angle_radians: AngleInRadians):
         """Rotates this vector, returns same instance, modified."""
-        radians = angle_radians.value
-        cos = math.cos(radians)
-        sin = math.sin(radians)
+        cos, sin = angle_radians.cos_sin()
         x = self.x*cos - self.y*sin
         y = self.x*sin + self.y*cos
         self.x = x
@@ -347,48 +331,41 @@ class Vec2d(object):
         return math.degrees(math.atan2(cross, dot))
 
     def norm(self) -> float:
-        """Norm of the vector. Forced it to be a Python float (not a numpy float64)"""
-        return float(np.linalg.norm(np.asarray([self.x, self.y])))
+        """Norm of the vector, as a Python float."""
+        return scalar.norm(self.x, self.y)
 
     def normalized(self):
-        length = self.length
-        if length != 0:
-            return self/length
-        return Vec2d(self)
+        x, y, _ = scalar.normalized(self.x, self.y)
+        return Vec2d(x, y)
 
     def scaled_to_norm(self, new_norm: float):
         """Returns new vector with specified norm, on same direction than the current one."""
         assert new_norm >= 0
-        current_norm = self.norm()
-        multiplier = new_norm / current_norm
-        return Vec2d(self.x * multiplier, self.y * multiplier)
+        return Vec2d(*scalar.scaled_to_norm(self.x, self.y, new_norm))
 
 
 
     def normalize_return_length(self):
-        length = self.length
-        if length != 0:
-            self.x /= length
-            self.y /= length
+        self.x, self.y, length = scalar.normalized(self.x, self.y)
         return length
 
     def perpendicular(self):
         return Vec2d(-self.y, self.x)
 
     def perpendicular_normal(self):
-        length = self.length
+        x, y, length = scalar.normalized(self.x, self.y)
         if length != 0:
-            return Vec2d(-self.y/length, self.x/length)
+            return Vec2d(-y, x)
         return Vec2d(self)
 
     def dot(self, other):
         return float(self.x*other[0] + self.y*other[1])
 
     def get_distance(self, other):
-        return math.sqrt((self.x - other[0])**2 + (self.y - other[1])**2)
+        return scalar.distance(self.x, self.y, other[0], other[1])
 
     def get_dist_sqrd(self, other):
-        return (self.x - other[0])**2 + (self.y - other[1])**2
+        return scalar.distance_sqrd(self.x, self.y, other[0], other[1])
 
     def projection(self, other):
         other_length_sqrd = other[0]*other[0] + other[1]*other[1]
@@ -404,6 +381,45 @@ class Vec2d(object):
     def convert_to_basis(self, x_vector, y_vector):
         return Vec2d(self.dot(x_vector)/x_vector.get_length_sqrd(), self.dot(y_vector)/y_vector.get_length_sqrd())
 
+    # Allocation-free versions of common expressions. Operands are anything with x & y
+    # (Vec2d, Point, ...); the result goes to 'out' (anything with settable x & y), which is returned.
+
+    def add_into(self, other, out):
+        """out = self + other"""
+        out.x = self.x + other.x
+        out.y = self.y + other.y
+        return out
+
+    def sub_into(self, other, out):
+        """out = self - other"""
+        out.x = self.x - other.x
+        out.y = self.y - other.y
+        return out
+
+    def scale_into(self, factor, out):
+        """out = self * factor"""
+        out.x = self.x * factor
+        out.y = self.y * factor
+        return out
+
+    @staticmethod
+    def axpy(a, x, y, out):
+        """out = a * x + y"""
+        out.x = a * x.x + y.x
+        out.y = a * x.y + y.y
+        return out
+
+    def lerp_into(self, other, t, out):
+        """out = self + (other - self) * t; same as interpolate_to."""
+        out.x = self.x + (other.x - self.x) * t
+        out.y = self.y + (other.y - self.y) * t
+        return out
+
+    def normalize_into(self, out):
+        """out = self normalized (a null vector stays null); returns out, like the other *_into methods."""
+        out.x, out.y, _ = scalar.normalized(self.x, self.y)
+        return out
+
     def __getstate__(self):
         return [self.x, self.y]
 
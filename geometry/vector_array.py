@@ -0,0 +1,169 @@
+"""Array-backed collection of 2d vectors.
+
+Vec2dArray  -- many vectors stored in one contiguous NumPy buffer
+
+Vec2dArray offers the vector algebra of Vec2d (dot, cross, normalized,
+projection, ...) with every operation done in one NumPy pass over all the
+vectors. The 'other' operand of an operation can be a single Vec2d (or pair,
+list or (2,) array), which is broadcast, or another Vec2dArray of the same
+length. As with Vec2d, '*' and '/' by a pair are componentwise; one scalar per
+vector goes through 'scaled_each' (or a (N, 1) array).
+
+Angles come back as float arrays in [0, 2*Pi), computed with a vectorized
+arctan2 instead of one AngleInRadians per vector.
+"""
+
+import numpy as np
+
+from geometry.angle_array import normalize_radians
+from geometry.vector import Vec2d
+from geometry.xy_array import XYArray, as_coords, as_scalars
+
+
+class Vec2dArray(XYArray):
+    """A collection of 2d vectors, supporting vector and scalar operators."""
+
+    __slots__ = []
+
+    item_class = Vec2d
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Builds an array from an iterable of Vec2d (or of (x,y) pairs)."""
+        vectors = list(vectors)
+        coords = np.empty((len(vectors), 2), dtype=np.float64)
+        coords[:, 0] = [a_vector[0] for a_vector in vectors]
+        coords[:, 1] = [a_vector[1] for a_vector in vectors]
+        return cls(coords)
+
+    @classmethod
+    def from_to(cls, from_pts, to_pts):
+        """Vectors going from each point of 'from_pts' to the matching one of 'to_pts'."""
+        return cls(as_coords(to_pts) - as_coords(from_pts))
+
+    # Arithmetic
+    def __add__(self, other):
+        return self.__class__(self.coords + as_coords(other))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.__class__(self.coords - as_coords(other))
+
+    def __rsub__(self, other):
+        return self.__class__(as_coords(other) - self.coords)
+
+    def __mul__(self, other):
+        return self.__class__(self.coords * as_coords(other))
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self.__class__(self.coords / as_coords(other))
+
+    def __neg__(self):
+        return self.__class__(-self.coords)
+
+    def __abs__(self):
+        return self.__class__(np.abs(self.coords))
+
+    def to_vectors(self):
+        """A list with one Vec2d per entry."""
+        return [Vec2d(x, y) for (x, y) in self.coords.tolist()]
+
+    # Angles
+    def angle_with_positive_x_axis(self) -> np.ndarray:
+        """Angles (in radians, in [0, 2*Pi)) these vectors make with the X+ axis."""
+        return angles_with_positive_x_axis(self)
+
+    def angle_to(self, other) -> np.ndarray:
+        """Angles (in radians, in [0, 2*Pi)) swept when going from these vectors to 'other'."""
+        return angles_between(self, other)
+
+    # vectory functions
+    def get_length_sqrd(self) -> np.ndarray:
+        return np.einsum('ij,ij->i', self.coords, self.coords)
+
+    def get_length(self) -> np.ndarray:
+        return np.hypot(self.coords[:, 0], self.coords[:, 1])
+
+    def norm(self) -> np.ndarray:
+        return self.get_length()
+
+    def normalized(self):
+        """Unit vectors; null vectors stay null."""
+        lengths = self.get_length()
+        lengths[lengths == 0] = 1.0
+        return self.__class__(self.coords / lengths[:, np.newaxis])
+
+    def scaled_each(self, scalars):
+        """Each vector multiplied by its own scalar ('scalars' has one value per vector, or is a single value)."""
+        return self.__class__(self.coords * as_scalars(scalars))
+
+    def scaled_to_norm(self, new_norm):
+        """Vectors with the specified norm(s), on the same directions as the current ones."""
+        return self.normalized().scaled_each(new_norm)
+
+    def perpendicular(self):
+        return self.__class__(np.column_stack((-self.coords[:, 1], self.coords[:, 0])))
+
+    def perpendicular_normal(self):
+        return self.normalized().perpendicular()
+
+    def dot(self, other) -> np.ndarray:
+        other = as_coords(other)
+        return self.coords[:, 0] * other[..., 0] + self.coords[:, 1] * other[..., 1]
+
+    def cross(self, other) -> np.ndarray:
+        other = as_coords(other)
+        return self.coords[:, 0] * other[..., 1] - self.coords[:, 1] * other[..., 0]
+
+    def get_distance(self, other) -> np.ndarray:
+        diff = self.coords - as_coords(other)
+        return np.hypot(diff[:, 0], diff[:, 1])
+
+    def get_dist_sqrd(self, other) -> np.ndarray:
+        diff = self.coords - as_coords(other)
+        return np.einsum('ij,ij->i', diff, diff)
+
+    def projection(self, other):
+        other = as_coords(other)
+        other_length_sqrd = other[..., 0] * other[..., 0] + other[..., 1] * other[..., 1]
+        factor = self.dot(other) / other_length_sqrd
+        return self.__class__(other * factor[:, np.newaxis])
+
+    def interpolate_to(self, other, range):
+        return self.__class__(self.coords + (as_coords(other) - self.coords) * as_scalars(range))
+
+    def convert_to_basis(self, x_vector, y_vector):
+        x_vector = as_coords(x_vector)
+        y_vector = as_coords(y_vector)
+        x_length_sqrd = x_vector[..., 0] ** 2 + x_vector[..., 1] ** 2
+        y_length_sqrd = y_vector[..., 0] ** 2 + y_vector[..., 1] ** 2
+        return self.__class__(np.column_stack((self.dot(x_vector) / x_length_sqrd,
+                                               self.dot(y_vector) / y_length_sqrd)))
+
+
+def angles_with_positive_x_axis(vectors) -> np.ndarray:
+    """
+    Batch version of Vec2d.angle_with_positive_x_axis.
+    :param vectors: a Vec2dArray, or anything convertible to a (N, 2) array.
+    :return: array of angles in radians, in [0, 2*Pi). Null vectors give 0.
+    """
+    return normalize_radians(_arctan2(np.atleast_2d(as_coords(vectors))))
+
+
+def angles_between(from_vectors, to_vectors) -> np.ndarray:
+    """
+    Batch version of Vec2d.angle_to.
+    :param from_vectors: vectors where the angles start.
+    :param to_vectors: vectors where the angles end; either one per entry of 'from_vectors' or a single one.
+    :return: array of angles in radians, in [0, 2*Pi).
+    """
+    from_coords = np.atleast_2d(as_coords(from_vectors))
+    to_coords = np.atleast_2d(as_coords(to_vectors))
+    return normalize_radians(_arctan2(to_coords) - _arctan2(from_coords))
+
+
+def _arctan2(coords: np.ndarray) -> np.ndarray:
+    """arctan2 of each vector, 0 for null vectors (arctan2(-0.0, -0.0) is -Pi), like Vec2d."""
+    xs, ys = coords[:, 0], coords[:, 1]
+    return np.where((xs == 0) & (ys == 0), 0.0, np.arctan2(ys, xs))
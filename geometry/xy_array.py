@@ -0,0 +1,161 @@
+"""Common machinery for array-backed collections of (x,y) pairs.
+
+XYArray  -- (N, 2) float64 buffer with indexing, iteration and construction helpers
+as_coords  -- an operand brought to something that broadcasts against (N, 2)
+as_coords_array  -- points of any kind as a (N, 2) float64 array
+as_xy  -- a single point as a pair of floats
+
+Concrete collections (PointArray, Vec2dArray) subclass it and say which scalar
+class an integer index gives back.
+"""
+
+import pickle
+
+import numpy as np
+
+
+class XYArray(object):
+    """Many (x,y) pairs stored in a single C-contiguous (N, 2) float64 array.
+
+    supports: pickle (with protocol 5, the coordinates are one out-of-band buffer)
+
+    xs, ys  -- views on the x and y coordinates
+    wrap  -- share an existing buffer instead of copying it
+    as_tuple  -- construct tuple (xs, ys) of arrays
+    clone  -- construct a duplicate
+    """
+
+    __slots__ = ['coords']
+
+    # class of the objects handed out by integer indexing; set by subclasses.
+    item_class = None
+
+    def __init__(self, coords):
+        """
+        Initializes the collection.
+        :param coords: anything convertible to a (N, 2) array of floats, another XYArray, or an iterable of points.
+        """
+        if isinstance(coords, XYArray):
+            coords = coords.coords
+        try:
+            coords = np.array(coords, dtype=np.float64, order='C', ndmin=2)
+        except ValueError:
+            # e.g. a list of Point, which NumPy doesn't read as pairs
+            try:
+                coords = as_coords_array(coords)
+            except (TypeError, ValueError, IndexError):
+                raise ValueError("Expected (x, y) pairs or points, got %r" % (coords,)) from None
+        if coords.size == 0:
+            coords = coords.reshape(0, 2)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("Expected coordinates of shape (N, 2), got %s" % (coords.shape,))
+        self.coords = coords
+
+    @classmethod
+    def wrap(cls, coords: np.ndarray):
+        """Collection backed by 'coords' itself (a (N, 2) C-contiguous float64 array), without copying it."""
+        if coords.dtype != np.float64 or coords.ndim != 2 or coords.shape[1] != 2 or \
+                not coords.flags['C_CONTIGUOUS']:
+            raise ValueError("Can only wrap C-contiguous (N, 2) float64 arrays")
+        a_collection = cls.__new__(cls)
+        a_collection.coords = coords
+        return a_collection
+
+    @classmethod
+    def from_xy(cls, xs, ys):
+        """Builds an array from separate x and y sequences."""
+        return cls(np.column_stack((np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))))
+
+    @classmethod
+    def from_tuples(cls, tuples):
+        """Builds an array from an iterable of (x,y) tuples."""
+        return cls(list(tuples))
+
+    @classmethod
+    def zeros(cls, n: int):
+        """An array of 'n' entries, all (0, 0)."""
+        return cls(np.zeros((n, 2), dtype=np.float64))
+
+    @property
+    def xs(self) -> np.ndarray:
+        return self.coords[:, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        return self.coords[:, 1]
+
+    def __len__(self):
+        return self.coords.shape[0]
+
+    def __iter__(self):
+        item_class = self.item_class
+        for (x, y) in self.coords.tolist():
+            yield item_class(x, y)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            x, y = self.coords[item].tolist()
+            return self.item_class(x, y)
+        return self.__class__(self.coords[item])
+
+    def __setitem__(self, item, value):
+        self.coords[item] = as_coords(value)
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and np.array_equal(self.coords, other.coords)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.coords.tolist())
+
+    def as_tuple(self):
+        """(xs, ys)"""
+        return (self.coords[:, 0], self.coords[:, 1])
+
+    def clone(self):
+        """Return a full copy of this array."""
+        return self.__class__(self.coords.copy())
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return _from_buffer, (self.__class__, pickle.PickleBuffer(self.coords))
+        return self.__class__, (self.coords,)
+
+
+def _from_buffer(cls, buffer):
+    """Unpickles an XYArray of class 'cls' over 'buffer' (read-only if the buffer is)."""
+    return cls.wrap(np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2))
+
+
+def as_coords(other):
+    """Brings 'other' to something that broadcasts against a (N, 2) array."""
+    if isinstance(other, XYArray):
+        return other.coords
+    if hasattr(other, 'x') and hasattr(other, 'y'):
+        return np.array((other.x, other.y), dtype=np.float64)
+    return np.asarray(other, dtype=np.float64)
+
+
+def as_scalars(scalar):
+    """One scalar, or one scalar per entry (shaped to broadcast against (N, 2))."""
+    scalar = np.asarray(scalar, dtype=np.float64)
+    if scalar.ndim == 1:
+        return scalar[:, np.newaxis]
+    return scalar
+
+
+def as_coords_array(points) -> np.ndarray:
+    """(N, 2) float64 array of the coordinates of an XYArray, an array, a point, or an iterable of points or pairs."""
+    if isinstance(points, XYArray):
+        return points.coords
+    if isinstance(points, np.ndarray) or hasattr(points, 'x'):
+        return np.asarray(as_coords(points), dtype=np.float64).reshape(-1, 2)
+    return np.array([as_xy(a_point) for a_point in points], dtype=np.float64).reshape(-1, 2)
+
+
+def as_xy(a_point):
+    """(x, y) floats of a point (anything with .x and .y) or of a pair."""
+    if hasattr(a_point, 'x') and hasattr(a_point, 'y'):
+        return float(a_point.x), float(a_point.y)
+    return float(a_point[0]), float(a_point[1])